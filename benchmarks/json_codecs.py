@@ -0,0 +1,166 @@
+"""Decode and encode rates of the JSON codecs of :func:`slack.utils.get_codec`.
+
+Payloads are shaped like a ``users.list`` page and a ``block_actions`` envelope.
+The rate of ``message`` envelopes decoded and passed through
+:func:`slack.ws.dispatch_to_parsers`, as the socket reader does, is reported as well.
+Codecs whose package is not installed are skipped.
+
+Usage ::
+
+    python benchmarks/json_codecs.py [--repeat 5]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import slack
+from slack.errors import InvalidArgumentException
+from slack.utils import get_codec
+from slack.ws import dispatch_to_parsers
+
+CODECS = ("json", "orjson", "msgspec")
+
+
+def users_list(count: int = 1000) -> dict:
+    members = []
+    for i in range(count):
+        images = {
+            f"image_{size}": f"https://secure.gravatar.com/avatar/{i}.jpg?s={size}"
+            for size in (24, 32, 48, 72, 192, 512)
+        }
+        members.append({
+            "id": f"U{i:08d}",
+            "team_id": "T00000000",
+            "name": f"user{i}",
+            "deleted": False,
+            "color": "9f69e7",
+            "real_name": f"User {i}",
+            "tz": "Asia/Tokyo",
+            "tz_label": "Japan Standard Time",
+            "tz_offset": 32400,
+            "profile": {
+                "real_name": f"User {i}",
+                "display_name": f"u{i}",
+                "avatar_hash": f"g{i}",
+                "team": "T00000000",
+                **images
+            },
+            "is_admin": False,
+            "is_owner": False,
+            "is_bot": False,
+            "updated": 1690000000,
+        })
+
+    return {"ok": True, "members": members, "response_metadata": {"next_cursor": "dXNlcjpVMDAwMDEwMDA="}}
+
+
+def block_actions() -> dict:
+    return {
+        "envelope_id": "57d6a792-4d35-4d0b-b6aa-3361493e1caf",
+        "type": "interactive",
+        "accepts_response_payload": False,
+        "payload": {
+            "type": "block_actions",
+            "user": {"id": "U00000000", "team_id": "T00000000"},
+            "actions": [
+                {"action_id": f"action-{i}", "block_id": f"block-{i}", "type": "button", "value": "x" * 50}
+                for i in range(50)
+            ],
+            "message": {
+                "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": "hello " * 40}} for _ in range(40)]
+            },
+        },
+    }
+
+
+def message_envelope(i: int) -> dict:
+    return {
+        "envelope_id": f"e{i:08d}",
+        "type": "events_api",
+        "accepts_response_payload": False,
+        "payload": {
+            "team_id": "T00000000",
+            "event_id": f"Ev{i:08d}",
+            "event": {
+                "type": "message",
+                "channel": "C00000000",
+                "user": "U00000000",
+                "team": "T00000000",
+                "text": "hello " * 20,
+                "ts": f"1690000000.{i:06d}",
+            },
+        },
+    }
+
+
+def dispatch_rate(codec, seconds: float) -> float:
+    client = slack.Client("xoxp-t", "xoxb-t", "xapp-t", log_level=logging.WARNING)
+    state = client.connection
+    state.teams["T00000000"] = slack.Team(state, {"id": "T00000000", "name": "team"})
+    raws = [json.dumps(message_envelope(i)).encode() for i in range(1000)]
+
+    def dispatch(raw: bytes) -> None:
+        dispatch_to_parsers(state.parsers, codec.loads(raw))
+
+    count = 0
+    started = time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < seconds:
+        dispatch(raws[count % len(raws)])
+        count += 1
+
+    return count / elapsed
+
+
+def rate(func, arg, seconds: float) -> float:
+    count = 0
+    started = time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < seconds:
+        func(arg)
+        count += 1
+
+    return count / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="time spent on each measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="measurements per codec, the best is kept")
+    args = parser.parse_args()
+
+    print(f"auto picks {get_codec('auto').name}")
+    print(f"{'payload':32} {'codec':8} {'loads/s':>10} {'dumps/s':>10}")
+    for name, payload in (("users.list, 1000 members", users_list()), ("block_actions envelope", block_actions())):
+        raw = json.dumps(payload).encode()
+        for codec_name in CODECS:
+            try:
+                codec = get_codec(codec_name)
+
+            except InvalidArgumentException:
+                print(f"{name:32} {codec_name:8} {'not installed':>21}")
+                continue
+
+            loads = max(rate(codec.loads, raw, args.seconds) for _ in range(args.repeat))
+            dumps = max(rate(codec.dumps, payload, args.seconds) for _ in range(args.repeat))
+            print(f"{name:32} {codec_name:8} {loads:10.0f} {dumps:10.0f}")
+
+    print(f"\n{'message envelopes dispatched':32} {'codec':8} {'envelopes/s':>12}")
+    for codec_name in CODECS:
+        try:
+            codec = get_codec(codec_name)
+
+        except InvalidArgumentException:
+            print(f"{'':32} {codec_name:8} {'not installed':>12}")
+            continue
+
+        dispatched = max(dispatch_rate(codec, args.seconds) for _ in range(args.repeat))
+        print(f"{'':32} {codec_name:8} {dispatched:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Memory retained by cached members, measured with :mod:`tracemalloc`.
+
+Synthetic ``users.list`` members are decoded and built into :class:`slack.Member` objects
+the way the bootstrap does. The memory still allocated afterwards is reported, then again
+once the profile of every member has been read. ``--against`` runs the same measurement
+on another git revision of the package, e.g. the parent of the commit that introduced the
+compact member layout, found with ``git log -- slack/member.py``.
+
+Usage ::
+
+    python benchmarks/member_memory.py 100000
+    python benchmarks/member_memory.py 100000 --against HEAD~1
+"""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TIMEZONES = (
+    ("America/Los_Angeles", "Pacific Daylight Time", -25200),
+    ("Asia/Tokyo", "Japan Standard Time", 32400),
+    ("Europe/London", "British Summer Time", 3600),
+)
+
+
+def member(i: int, rng: random.Random) -> dict:
+    tz, tz_label, tz_offset = TIMEZONES[i % len(TIMEZONES)]
+    avatar = f"{rng.getrandbits(80):020x}"
+    if i % 4 == 0:
+        def image(size: int) -> str:
+            return (
+                f"https://secure.gravatar.com/avatar/{avatar[:16]}.jpg?s={size}"
+                f"&d=https%3A%2F%2Fa.slack-edge.com%2Fdf10d%2Fimg%2Favatars%2Fava_00{i % 30:02d}-{size}.png"
+            )
+
+    else:
+        def image(size: int) -> str:
+            return f"https://avatars.slack-edge.com/2021-0{i % 9 + 1}-1{i % 9}/{1000000000 + i}_{avatar}_{size}.jpg"
+
+    return {
+        "id": f"U{i:010X}",
+        "team_id": "T0000000001",
+        "name": f"user.{i}",
+        "deleted": False,
+        "color": rng.choice(["9f69e7", "4bbe2e", "e7392d", "3c989f"]),
+        "real_name": f"User Number {i}",
+        "tz": tz,
+        "tz_label": tz_label,
+        "tz_offset": tz_offset,
+        "profile": {
+            "title": "Engineer",
+            "phone": "",
+            "skype": "",
+            "real_name": f"User Number {i}",
+            "real_name_normalized": f"User Number {i}",
+            "display_name": f"user{i}",
+            "display_name_normalized": f"user{i}",
+            "fields": None,
+            "status_text": "",
+            "status_emoji": ":palm_tree:" if i % 7 == 0 else "",
+            "status_emoji_display_info": [],
+            "status_expiration": 0,
+            "avatar_hash": avatar[:12],
+            "first_name": "User",
+            "last_name": f"Number {i}",
+            **{f"image_{size}": image(size) for size in (24, 32, 48, 72, 192, 512)},
+            "status_text_canonical": "",
+            "team": "T0000000001",
+        },
+        "is_admin": False,
+        "is_owner": False,
+        "is_primary_owner": False,
+        "is_restricted": False,
+        "is_ultra_restricted": False,
+        "is_bot": False,
+        "is_app_user": False,
+        "updated": 1600000000 + i,
+        "is_email_confirmed": True,
+    }
+
+
+async def measure(count: int) -> None:
+    import slack
+    from slack.member import Member
+
+    rng = random.Random(1)
+    texts = [json.dumps(member(i, rng)) for i in range(count)]
+    client = slack.Client("xoxp-t", "xoxb-t", "xapp-t", log_level=logging.WARNING)
+    state = client.connection
+    state.teams["T0000000001"] = slack.Team(state, {"id": "T0000000001", "name": "team"})
+    members = {}
+
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    for text in texts:
+        data = json.loads(text)
+        members[data["id"]] = Member(state, data)
+
+    built = time.perf_counter() - started
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+
+    started = time.perf_counter()
+    for m in members.values():
+        m.profile.image_48
+
+    read = time.perf_counter() - started
+    gc.collect()
+    after_read, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"  {count} members built in {built:.2f}s, {retained / 2 ** 20:.1f} MiB ({retained / count:.0f} B/member)\n"
+        f"  every profile read in {read:.2f}s, {after_read / 2 ** 20:.1f} MiB ({after_read / count:.0f} B/member)"
+    )
+
+
+def run_tree(tree: str, count: int) -> None:
+    env = dict(os.environ, PYTHONPATH=tree)
+    subprocess.run([sys.executable, os.path.abspath(__file__), str(count), "--child"], env=env, check=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("count", type=int, nargs="?", default=100000, help="number of members")
+    parser.add_argument("--against", metavar="REV", help="git revision to measure as well")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        asyncio.run(measure(args.count))
+        return
+
+    print("working tree:")
+    run_tree(ROOT, args.count)
+    if args.against is None:
+        return
+
+    with tempfile.TemporaryDirectory() as tree:
+        archive = os.path.join(tree, "slack.tar")
+        subprocess.run(["git", "-C", ROOT, "archive", "-o", archive, args.against, "slack"], check=True)
+        with tarfile.open(archive) as tar:
+            tar.extractall(tree)
+
+        print(f"{args.against}:")
+        run_tree(tree, args.count)
+
+
+if __name__ == "__main__":
+    main()
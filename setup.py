@@ -34,6 +34,9 @@ setup(
         'slack.view'
     ],
     install_requires=requirements,
+    extras_require={
+        'speed': ['orjson>=3.6'],
+    },
     url='https://github.com/peco2282/slack.py',
     license='MIT',
     author='peco2282',
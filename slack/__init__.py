@@ -5,9 +5,15 @@ from .channel import *
 from .client import *
 from .errors import *
 from .httpclient import *
+from .iterators import *
 from .member import *
 from .message import *
+from .metrics import *
+from .receiver import *
+from .recorder import *
 from .route import *
+from .sharding import *
+from .snapshot import *
 from .state import *
 from .team import *
 from .ws import *
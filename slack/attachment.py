@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import io
+import os
+from typing import TYPE_CHECKING, IO, AsyncIterable, AsyncIterator
 
+import aiohttp
+
+from .errors import InvalidArgumentException
 from .route import Route
 from .types import (
     File as FilePayload,
@@ -9,6 +15,7 @@ from .types import (
     PublicShare as PublicSharePayload
 )
 from .utils import ts2time
+from .ws import ExponentialBackoff
 
 if TYPE_CHECKING:
     from .channel import Channel
@@ -16,12 +23,173 @@ if TYPE_CHECKING:
     from .state import ConnectionState
 
 
+def _finish_download(downloads: dict[str, asyncio.Future], key: str, task: asyncio.Future) -> None:
+    downloads.pop(key, None)
+    if not task.cancelled():
+        # Mark the exception as retrieved even if every caller was cancelled.
+        task.exception()
+
+
 class Attachment:
-    def __init__(self, fp: str, name: str, title: str, initial_comment: str | None = None):
+    """A file to upload.
+
+    .. versionchanged:: 1.4.5
+        ``fp`` accepts bytes, binary file objects and async iterators of bytes.
+
+    Parameters
+    ----------
+    fp: Union[:class:`str`, :class:`os.PathLike`, :class:`bytes`, IO[:class:`bytes`], AsyncIterable[:class:`bytes`]]
+        Path, content, binary file object or async iterator of the file.
+
+    name: :class:`str`
+        File name.
+
+    title: :class:`str`
+        File title.
+
+    initial_comment: Optional[:class:`str`]
+        Message posted with the file.
+
+    size: Optional[:class:`int`]
+        Length of the file in bytes. Required for async iterators and unseekable file objects.
+
+        .. versionadded:: 1.4.5
+    """
+
+    def __init__(
+            self,
+            fp: str | os.PathLike | bytes | IO[bytes] | AsyncIterable[bytes],
+            name: str,
+            title: str,
+            initial_comment: str | None = None,
+            *,
+            size: int | None = None
+    ):
         self.fp = fp
         self.name = str(name)
         self.title = str(title)
         self.initial_comment = str(initial_comment) if isinstance(initial_comment, str) else None
+        self.size: int | None = size
+
+    @property
+    def length(self) -> int | None:
+        """Length of the file in bytes, or ``None`` if it cannot be known before reading.
+
+        .. versionadded:: 1.4.5
+        """
+        if self.size is not None:
+            return self.size
+
+        fp = self.fp
+        if isinstance(fp, (bytes, bytearray, memoryview)):
+            return len(fp)
+
+        if isinstance(fp, (str, os.PathLike)):
+            return os.path.getsize(fp)
+
+        if hasattr(fp, "seek") and hasattr(fp, "tell"):
+            try:
+                position = fp.tell()
+                end = fp.seek(0, io.SEEK_END)
+                fp.seek(position)
+                return end - position
+
+            except (OSError, io.UnsupportedOperation):
+                return None
+
+        return None
+
+    async def stream(self, chunk_size: int = 262144) -> AsyncIterator[bytes]:
+        """Read the file in chunks without blocking the event loop.
+
+        Files are read in the default executor, and opened paths are always closed.
+
+        .. versionadded:: 1.4.5
+
+        Parameters
+        ----------
+        chunk_size: :class:`int`
+            Maximum length of each chunk.
+
+        Yields
+        ------
+        :class:`bytes`
+        """
+        fp = self.fp
+        if isinstance(fp, (bytes, bytearray, memoryview)):
+            view = memoryview(fp)
+            for i in range(0, len(view), chunk_size):
+                yield bytes(view[i:i + chunk_size])
+
+        elif isinstance(fp, (str, os.PathLike)):
+            loop = asyncio.get_running_loop()
+            f = await loop.run_in_executor(None, open, fp, "rb")
+            try:
+                while chunk := await loop.run_in_executor(None, f.read, chunk_size):
+                    yield chunk
+
+            finally:
+                f.close()
+
+        elif hasattr(fp, "__aiter__"):
+            async for chunk in fp:
+                yield bytes(chunk)
+
+        elif hasattr(fp, "read"):
+            loop = asyncio.get_running_loop()
+            while chunk := await loop.run_in_executor(None, fp.read, chunk_size):
+                yield chunk
+
+        else:
+            raise InvalidArgumentException("`fp` must be a path, bytes, a binary file or an async iterator of bytes.")
+
+
+class FileCache:
+    """On-disk cache of downloaded files.
+
+    Files are stored by ID and size, so a file is downloaded once until its content changes.
+    Files of unknown size are stored by ID only. Unfinished downloads keep a ``.part`` file
+    and are resumed with a ``Range`` request.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    directory: Union[:class:`str`, :class:`os.PathLike`]
+        Directory of the cache. It is created if missing.
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, file_id: str, size: int | None) -> str:
+        """Path of a cached file.
+
+        Parameters
+        ----------
+        file_id: :class:`str`
+        size: Optional[:class:`int`]
+            ``None`` when the size is unknown.
+
+        Returns
+        -------
+        :class:`str`
+        """
+        return os.path.join(self.directory, file_id if size is None else f"{file_id}-{size}")
+
+    def get(self, file_id: str, size: int | None) -> str | None:
+        """Path of a completely downloaded file, or ``None``.
+
+        Returns
+        -------
+        Optional[:class:`str`]
+        """
+        path = self.path(file_id, size)
+        if os.path.isfile(path) and (size is None or os.path.getsize(path) == size):
+            return path
+
+        return None
 
 
 class PublicShare:
@@ -52,30 +220,31 @@ class File:
     def __init__(self, state: ConnectionState, data: FilePayload):
         self.__state = state
         self.id = data["id"]
-        self.created_at = ts2time(data["created"])
-        self.name = data["name"]
-        self.title = data["title"]
-        self.mimetype = data["mimetype"]
-        self.filetype = data["filetype"]
+        self.created_at = ts2time(data.get("created"))
+        self.name = data.get("name")
+        self.title = data.get("title")
+        self.mimetype = data.get("mimetype")
+        self.filetype = data.get("filetype")
         self.pretty_type = data.get("pretty_type")
         self.user = self.__state.members.get(data.get("user", ""))
         self.team = self.__state.teams.get(data.get("user_team", ""))
         self.is_editable = data.get("editable", False)
-        self.size = int(data.get("size", 0))
+        # Missing from some payloads, e.g. the files of ``files.completeUploadExternal``.
+        self.size: int | None = int(data["size"]) if data.get("size") is not None else None
         self.mode = data.get("mode")
         self.is_external = data.get("is_external")
         self.external_type: str | None = data.get("external_type")
         self.is_public: bool = data.get("is_public", False)
         self.public_url_shared: bool = data.get("public_url_shared", False)
         self.display_as_bot: bool = data.get("display_as_bot", False)
-        self.username: str = data["username"]
-        self.url_private: str = data["url_private"]
-        self.url_private_download: str = data["url_private_download"]
-        self.permalink: str = data["permalink"]
-        self.permalink_public: str = data["permalink_public"]
-        self.edit_link: str = data["edit_link"]
-        self.preview: str = data["preview"]
-        self.preview_highlight: str = data["preview_highlight"]
+        self.username: str | None = data.get("username")
+        self.url_private: str = data.get("url_private")
+        self.url_private_download: str = data.get("url_private_download")
+        self.permalink: str = data.get("permalink")
+        self.permalink_public: str = data.get("permalink_public")
+        self.edit_link: str = data.get("edit_link")
+        self.preview: str = data.get("preview")
+        self.preview_highlight: str = data.get("preview_highlight")
         self.lines: int = data.get("lines", 0)
         self.lines_more: int = data.get("lines_more", 0)
         self.preview_is_truncated: bool = data.get("preview_is_truncated", False)
@@ -89,6 +258,118 @@ class File:
         self.has_rich_preview: bool = data.get("has_rich_preview", False)
         self.file_access: str | None = data.get("file_access")
 
+    def stream(self, offset: int = 0, chunk_size: int = 262144) -> AsyncIterator[bytes]:
+        """Stream the content of the file in chunks.
+
+        .. versionadded:: 1.4.5
+
+        Examples
+        --------
+        Examples ::
+
+            async for chunk in file.stream():
+                digest.update(chunk)
+
+        Parameters
+        ----------
+        offset: :class:`int`
+            Byte to start from.
+
+        chunk_size: :class:`int`
+            Maximum length of each chunk.
+
+        Returns
+        -------
+        AsyncIterator[:class:`bytes`]
+        """
+        return self.__state.http.download(self.url_private_download or self.url_private, offset, chunk_size)
+
+    async def download(self, fp: str | os.PathLike | None = None, *, retries: int = 3) -> str:
+        """Download the file to ``fp`` or to the client's file cache.
+
+        The content is written to a ``.part`` file and renamed when it is complete.
+        An interrupted download continues from the bytes already written. A ``.part`` file
+        left by an earlier run is only resumed when the size of the file is known.
+        Files found in the cache are not downloaded again, and concurrent downloads to
+        the same path share one request.
+
+        .. versionadded:: 1.4.5
+
+        Parameters
+        ----------
+        fp: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+            Destination path. Defaults to the path in the ``file_cache_dir`` of the client.
+
+        retries: :class:`int`
+            How many times an interrupted download is resumed, after delays of :class:`ExponentialBackoff`.
+
+        Raises
+        ------
+        :class:`InvalidArgumentException`
+            Raise when neither ``fp`` nor a file cache is available.
+
+        Returns
+        -------
+        :class:`str`
+            Path of the downloaded file.
+        """
+        cache = self.__state.http.file_cache
+        if fp is None:
+            if cache is None:
+                raise InvalidArgumentException("`fp` is required when the client has no `file_cache_dir`.")
+
+            cached = cache.get(self.id, self.size)
+            if cached is not None:
+                return cached
+
+            path = cache.path(self.id, self.size)
+
+        else:
+            path = os.fspath(fp)
+
+        # The ``.part`` file is appended to, so only one download may write it.
+        downloads = self.__state.http._downloads
+        key = os.path.abspath(path)
+        task = downloads.get(key)
+        if task is None:
+            task = downloads[key] = asyncio.ensure_future(self._download(path, retries))
+            task.add_done_callback(lambda t: _finish_download(downloads, key, t))
+
+        return await asyncio.shield(task)
+
+    async def _download(self, path: str, retries: int) -> str:
+        part = path + ".part"
+        loop = asyncio.get_running_loop()
+        backoff = ExponentialBackoff(base=0.5, maximum=10.0)
+        if self.size is None and os.path.isfile(part):
+            # Whether a ``.part`` file of an earlier run is complete cannot be told, it is downloaded again.
+            os.remove(part)
+
+        while True:
+            offset = os.path.getsize(part) if os.path.isfile(part) else 0
+            if self.size is not None and 0 < self.size <= offset:
+                break
+
+            f = await loop.run_in_executor(None, open, part, "ab")
+            try:
+                async for chunk in self.stream(offset):
+                    await loop.run_in_executor(None, f.write, chunk)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if backoff.attempts >= retries:
+                    raise
+
+                await asyncio.sleep(backoff.delay())
+                continue
+
+            finally:
+                f.close()
+
+            break
+
+        os.replace(part, path)
+        return path
+
     async def create_url(self):
         await self.__state.http.get_anything(
             Route("GET", "files.getUploadURLExternal", self.__state.http.bot_token),
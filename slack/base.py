@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import urllib.parse
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 from .attachment import File
 from .errors import InvalidArgumentException, SlackException
+from .iterators import CursorIterator
 from .route import Route
 from .utils import ts2time
 from .view import ViewFrame
@@ -145,7 +145,7 @@ class Sendable:
         if view is not None:
             if not issubclass(type(view), ViewFrame):
                 raise InvalidArgumentException("")
-            blocks = json.dumps(view.to_list())
+            blocks = self._state.http.codec.dumps(view.to_list())
             query = {
                 "channel": self.id,
                 "blocks": urllib.parse.quote(str(blocks)).replace("%25", "%").replace("%27", "%22")
@@ -204,14 +204,20 @@ class Sendable:
         message.scheduled_message_id = resp.get("scheduled_message_id")
         return message
 
-    async def get_scheduled_messages(
+    def get_scheduled_messages(
             self,
             limit: int | None = None,
             latest: datetime | int | float | None = None,
-            oldest: datetime | int | float | None = None
-    ) -> list[ScheduledMessage | None]:
+            oldest: datetime | int | float | None = None,
+            *,
+            page_size: int = 100,
+            prefetch: bool = False
+    ) -> CursorIterator[ScheduledMessage]:
         """
 
+        .. versionchanged:: 1.4.5
+            Return :class:`CursorIterator` reading every page.
+
         Examples
         --------
         Examples ::
@@ -220,6 +226,9 @@ class Sendable:
             for message in messages:
                 print(message.content)
 
+            async for message in channel.get_scheduled_messages():
+                print(message.content)
+
         Parameters
         ----------
         limit: Optional[:class:`int`]
@@ -227,9 +236,15 @@ class Sendable:
         latest: Optional[:class:`int`, :class:`float`, :class:`datetime`]
         oldest: Optional[:class:`int`, :class:`float`, :class:`datetime`]
 
+        page_size: :class:`int`
+            Number of messages requested per page.
+
+        prefetch: :class:`bool`
+            Request the next page while the current one is consumed.
+
         Returns
         -------
-        List[Optional[:class:`ScheduledMessage`]]
+        :class:`CursorIterator` [:class:`ScheduledMessage`]
         """
         if not any(
                 [
@@ -268,13 +283,16 @@ class Sendable:
                 oldest = oldest.timestamp()
 
             param["oldest"] = int(oldest)
-        rtn = await self._state.http.get_anything(
+        return CursorIterator(
+            self._state.http,
             Route("GET", "chat.scheduledMessages.list", self._state.http.bot_token),
-            param
+            "scheduled_messages",
+            lambda data: ScheduledMessage(self._state, data),
+            param,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch
         )
-        print(rtn)
-        messages = [ScheduledMessage(self._state, m) for m in rtn.get("scheduled_messages", [])]
-        return messages
 
     async def send_ephemeral(self, text: str, member: Member) -> datetime:
         """|coro|
@@ -315,6 +333,9 @@ class Sendable:
     async def send_file(self, attachment: Attachment) -> File:
         """This function occur sending file.
 
+        .. versionchanged:: 1.4.5
+            Stream the file instead of using ``files.upload``.
+
         Parameters
         ----------
         attachment: :class:`Attachment`
@@ -325,22 +346,65 @@ class Sendable:
         :class:`File`
             Sended data of file.
         """
-        initial_text = attachment.initial_comment
+        files = await self.send_files(attachment, initial_comment=attachment.initial_comment)
+        return files[0]
 
-        param = {
-            "channels": self.id,
-            "title": attachment.title,
-            "filename": attachment.name
-        }
-        if initial_text:
-            param["initial_comment"] = initial_text
+    async def send_files(
+            self,
+            *attachments: Attachment,
+            initial_comment: str | None = None,
+            concurrency: int = 4,
+            progress: Callable[[Attachment, int, int], Any] | None = None
+    ) -> list[File]:
+        """Upload several files in parallel and share them in one message.
+
+        Files are streamed in chunks, so large files are never loaded into memory.
+
+        .. versionadded:: 1.4.5
+
+        Examples
+        --------
+        Examples ::
+
+            def progress(attachment, sent, total):
+                print(f"{attachment.name}: {sent}/{total}")
+
+            await channel.send_files(
+                Attachment("app.log", "app.log", "app log"),
+                Attachment(b"...", "dump.bin", "dump"),
+                progress=progress
+            )
+
+        Parameters
+        ----------
+        attachments: :class:`Attachment`
+            Files to send.
+
+        initial_comment: Optional[:class:`str`]
+            Message posted with the files.
+
+        concurrency: :class:`int`
+            Number of files uploaded at the same time.
+
+        progress: Optional[Callable[[:class:`Attachment`, :class:`int`, :class:`int`], Any]]
+            Called with the attachment, bytes sent and total bytes after each chunk.
+
+        Returns
+        -------
+        List[:class:`File`]
+            Sended data of files.
+        """
+        if not attachments:
+            raise InvalidArgumentException("At least one attachment is required.")
 
         sended = await self._state.http.send_files(
-            Route(method="POST", endpoint="files.upload", token=self._state.http.bot_token),
-            data=param,
-            files=[attachment],
+            list(attachments),
+            channel_id=self.id,
+            initial_comment=initial_comment,
+            concurrency=concurrency,
+            progress=progress
         )
-        return File(self._state, sended["file"])
+        return [File(self._state, data) for data in sended["files"]]
 
     async def get_permalink(self, message: Message) -> str:
         """
@@ -384,8 +448,17 @@ class Sendable:
             param
         )
 
-    async def history(self) -> list[Message]:
+    def history(
+            self,
+            limit: int | None = 100,
+            *,
+            page_size: int = 200,
+            prefetch: bool = False
+    ) -> CursorIterator[Message]:
         """
+        .. versionchanged:: 1.4.5
+            Return :class:`CursorIterator` reading every page up to ``limit``.
+
         Examples
         --------
         Examples ::
@@ -393,19 +466,40 @@ class Sendable:
             async for message in channel.history():
                 print(message.content)
 
+            messages = await channel.history(limit=10)
+
+        Parameters
+        ----------
+        limit: Optional[:class:`int`]
+            Maximum number of messages. ``None`` reads the whole history.
+
+        page_size: :class:`int`
+            Number of messages requested per page.
+
+        prefetch: :class:`bool`
+            Request the next page while the current one is consumed.
+
         Returns
         -------
-
+        :class:`CursorIterator` [:class:`Message`]
         """
-        query = {
-            "channel": self.id
-        }
-        msg = await self._state.http.get_anything(
+        from .message import Message
+
+        def converter(data: dict[str, Any]) -> Message:
+            message = Message(self._state, data=data)
+            message.channel_id = self.id
+            return message
+
+        return CursorIterator(
+            self._state.http,
             Route("GET", "conversations.history", self._state.http.bot_token),
-            query=query
+            "messages",
+            converter,
+            {"channel": self.id},
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch
         )
-        messages = msg["messages"]
-        return [Message(self._state, data=data) for data in messages]
 
     async def delete_message(self, message_id: str):
         query = {
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 from .attachment import File
 from .base import Sendable
 from .errors import InvalidArgumentException
+from .iterators import CachedIterator, CursorIterator, PageIterator
 from .message import Message
 from .route import Route
 from .team import Team
@@ -47,21 +48,51 @@ class Channel(Sendable):
     created_by: :class:`Member`
         Who channel create.
 
+    is_archived: :class:`bool`
+        Whether the channel is archived.
+
+        .. versionadded:: 1.4.5
+
+    is_member: :class:`bool`
+        Whether the bot is in the channel.
+
+        .. versionadded:: 1.4.5
+
     """
 
     def __init__(self, state: ConnectionState, data: ChannelPayload):
         self.__state = state
         self.http = state.http
+        self._update(data)
+
+    def _update(self, data: ChannelPayload) -> None:
         self.id: str = data.get("id")
         self.name = data.get("name")
         self.team: Team | None = self.__state.teams.get(data.get("context_team_id", ""))
         self.created_at: datetime = datetime.fromtimestamp(float(data.get("created", 0)))
         self.created_by: Member | None = self.__state.members.get(data.get("creator"))
+        self.is_archived: bool = data.get("is_archived", False)
+        self.is_member: bool = data.get("is_member", False)
         # self.overload(data)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id} name={self.name}>"
 
+    def to_dict(self) -> ChannelPayload:
+        """Payload this channel can be built from again.
+
+        .. versionadded:: 1.4.5
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "context_team_id": self.team.id if self.team is not None else None,
+            "created": self.created_at.timestamp(),
+            "creator": self.created_by.id if self.created_by is not None else None,
+            "is_archived": self.is_archived,
+            "is_member": self.is_member,
+        }
+
     async def kick(self, member: Member) -> None:
         """
         A way to :class:`Member`.kick()
@@ -101,30 +132,81 @@ class Channel(Sendable):
             query=query
         )
 
-    async def members(self, channel_id: str | None = None) -> list[Member | None]:
+    def members(
+            self,
+            channel_id: str | None = None,
+            *,
+            limit: int | None = None,
+            page_size: int = 200,
+            prefetch: bool = False,
+            cached: bool = True
+    ) -> CursorIterator[Member | None] | CachedIterator[Member | None]:
         """
         Return List channel the calling user may access.
 
         ..versionadded:: 1.4.3
 
+        .. versionchanged:: 1.4.5
+            Return :class:`CursorIterator` reading every page.
+
+        .. versionchanged:: 1.4.5
+            Served from :class:`MembershipIndex`, which requests a channel the bot is in once.
 
         Parameters
         ----------
         channel_id: Optional[:class:`str`]
 
+        limit: Optional[:class:`int`]
+            Maximum number of members. ``None`` reads every page.
+
+        page_size: :class:`int`
+            Number of members requested per page. Only used with ``cached=False``.
+
+        prefetch: :class:`bool`
+            Request the next page while the current one is consumed. Only used with ``cached=False``.
+
+        cached: :class:`bool`
+            ``False`` requests every page of ``conversations.members`` again.
+
         Returns
         -------
-        List[Optional[:class:`Member`]]
+        Union[:class:`CursorIterator`, :class:`CachedIterator`] [Optional[:class:`Member`]]
             Users participating in the channel.
         """
-        rtn = await self.http.get_anything(
+        if cached:
+            return CachedIterator(
+                lambda: self.__state.membership.fetch(channel_id or self.id),
+                lambda user: self.__state.members.get(user),
+                limit=limit
+            )
+
+        return CursorIterator(
+            self.http,
             Route("GET", "conversations.members", self.http.bot_token),
-            query={
-                "channel": channel_id or self.id
-            }
+            "members",
+            lambda user: self.__state.members.get(user),
+            {"channel": channel_id or self.id},
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch
         )
-        members = rtn["members"]
-        return [self.__state.members[user] for user in members]
+
+    async def has_member(self, member: Member | str) -> bool:
+        """Whether a member is in this channel, from :class:`MembershipIndex`.
+
+        .. versionadded:: 1.4.5
+
+        Parameters
+        ----------
+        member: Union[:class:`Member`, :class:`str`]
+            Member or member ID.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        member_id = member if isinstance(member, str) else member.id
+        return member_id in await self.__state.membership.fetch(self.id)
 
     async def unarchive(self) -> None:
         """
@@ -208,17 +290,23 @@ class Channel(Sendable):
         self.__state.channels[self.id] = channel
         return channel
 
-    async def reaction_messages(
+    def reaction_messages(
             self,
             *,
             team: Team | None = None,
-            member: Member | None = None
-    ) -> list[Message | None]:
+            member: Member | None = None,
+            limit: int | None = None,
+            page_size: int = 100,
+            prefetch: bool = False
+    ) -> CursorIterator[Message]:
         """
         Returns a list of messages that have been reacted to on the specified channel.
 
         ..versionadded:: 1.4.3
 
+        .. versionchanged:: 1.4.5
+            Return :class:`CursorIterator` reading every page.
+
         Parameters
         ----------
         team: Optional[:class:`Team`]
@@ -227,9 +315,18 @@ class Channel(Sendable):
         member: Optional[:class:`Member`]
             Member to be sent from.
 
+        limit: Optional[:class:`int`]
+            Maximum number of messages. ``None`` reads every page.
+
+        page_size: :class:`int`
+            Number of items requested per page.
+
+        prefetch: :class:`bool`
+            Request the next page while the current one is consumed.
+
         Returns
         -------
-
+        :class:`CursorIterator` [:class:`Message`]
         """
         query = {}
         if team is not None:
@@ -238,41 +335,75 @@ class Channel(Sendable):
         if member is not None:
             query["member"] = member.id
 
-        rtn = await self.http.manage_channel(
-            Route("GET", "reactions.list", self.http.bot_token),
-            query=query
-        )
-        items = rtn["items"]
-        messages = []
-        for item in items:
+        def converter(item: dict[str, Any]) -> Message:
             message = Message(self.__state, item["message"])
             message.channel_id = item["channel"]
-            messages.append(message)
+            return message
 
-        return messages
+        return CursorIterator(
+            self.http,
+            Route("GET", "reactions.list", self.http.bot_token),
+            "items",
+            converter,
+            query,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch
+        )
 
-    async def files(
+    def files(
             self,
             this_channel: bool = True,
             member: Member | None = None,
             *,
-            count: int = 100
-    ) -> list[File | None]:
-        query = {}
-        if isinstance(count, int):
-            query["count"] = int(count)
+            count: int | None = 100,
+            page_size: int = 100,
+            prefetch: bool = False
+    ) -> PageIterator[File]:
+        """
+        Files shared in this channel.
+
+        .. versionchanged:: 1.4.5
+            Return :class:`PageIterator` reading every page up to ``count``.
 
+        Parameters
+        ----------
+        this_channel: :class:`bool`
+            Only files of this channel.
+
+        member: Optional[:class:`Member`]
+            Only files created by this member.
+
+        count: Optional[:class:`int`]
+            Maximum number of files. ``None`` reads every page.
+
+        page_size: :class:`int`
+            Number of files requested per page.
+
+        prefetch: :class:`bool`
+            Request the next page while the current one is consumed.
+
+        Returns
+        -------
+        :class:`PageIterator` [:class:`File`]
+        """
+        query = {}
         if this_channel:
             query["channel"] = self.id
 
         if member:
             query["user"] = member.id
-        resp = await self.http.get_anything(
+
+        return PageIterator(
+            self.http,
             Route("GET", "files.list", self.http.bot_token),
-            query=query
+            "files",
+            lambda data: File(self.__state, data),
+            query,
+            limit=count,
+            page_size=page_size,
+            prefetch=prefetch
         )
-        files = resp["files"]
-        return [File(self.__state, data) for data in files]
 
 
 class DeletedChannel:
@@ -17,15 +17,30 @@ from typing import (
 
 from . import utils
 from .errors import TokenTypeException, InvalidArgumentException
-from .httpclient import HTTPClient
+from .attachment import FileCache
+from .httpclient import HTTPClient, ResponseCache
+from .metrics import Latency, SocketMetrics
+from .receiver import EventsReceiver
+from .recorder import EnvelopeRecorder
+from .snapshot import StateSnapshot
+from .route import BASE
+from .sharding import shard_key
 from .state import ConnectionState
-from .ws import SlackWebSocket
+from .ws import (
+    SlackWebSocket,
+    AckResponder,
+    DedupIndex,
+    EventDispatcher,
+    ExponentialBackoff,
+    dispatch_to_parsers
+)
 
 if TYPE_CHECKING:
     from .team import Team
     from .channel import Channel
     from .member import Member
 
+MAX_CONNECTIONS = 10
 Coro = TypeVar("Coro", bound=Callable[..., Coroutine[Any, Any, Any]])
 T = TypeVar("T")
 
@@ -200,6 +215,157 @@ class Client:
     debug: :class:`bool`
         Print announce in client object.
 
+        .. versionadded:: 1.4.5
+
+    rate_limit_retries: :class:`int`
+        How many times a ``ratelimited`` request waits for ``Retry-After`` and is sent again.
+        Defaults to ``3``.
+
+        .. versionadded:: 1.4.5
+
+    connector: Optional[:class:`aiohttp.BaseConnector`]
+        Connection pool shared with other clients. See :func:`create_connector`.
+        It is not closed by :meth:`close`.
+
+        .. versionadded:: 1.4.5
+
+    connector_options: Optional[Dict[:class:`str`, Any]]
+        Keyword arguments of :func:`create_connector` used when ``connector`` is not passed.
+
+        .. versionadded:: 1.4.5
+
+    warmup_connections: :class:`int`
+        Number of connections opened on login before any request. Defaults to ``0``.
+
+        .. versionadded:: 1.4.5
+
+    coalesce_requests: :class:`bool`
+        Share one round trip between identical ``GET`` requests of idempotent read endpoints
+        (:data:`COALESCED_ENDPOINTS`) in flight. Defaults to ``True``.
+
+        .. versionadded:: 1.4.5
+
+    response_cache: Union[:class:`bool`, :class:`ResponseCache`]
+        Cache responses of read endpoints such as ``team.info`` or ``chat.getPermalink``.
+        ``True`` uses a :class:`ResponseCache` with default TTLs. Defaults to ``False``.
+
+        .. versionadded:: 1.4.5
+
+    file_cache_dir: Optional[:class:`str`]
+        Directory where :meth:`File.download` keeps files by ID and size.
+
+        .. versionadded:: 1.4.5
+
+    json_codec: Union[:class:`str`, :class:`JSONCodec`]
+        JSON backend of HTTP responses, websocket frames and blocks: ``auto``, ``orjson``,
+        ``msgspec`` or ``json``. ``auto`` uses the fastest installed one. Defaults to ``auto``.
+
+        .. versionadded:: 1.4.5
+
+    metrics: :class:`bool`
+        Record per-endpoint counters and latency in ``client.http.metrics``. Defaults to ``False``.
+
+        .. versionadded:: 1.4.5
+
+    base_url: :class:`str`
+        Root URL of the Web API. Defaults to ``https://slack.com/api/``.
+        Point it at :class:`slack.testing.FakeSlackServer` to run without the network.
+
+        .. versionadded:: 1.4.5
+
+    dispatch_workers: :class:`int`
+        Number of workers that parse and dispatch envelopes while the websocket keeps being read.
+        Defaults to ``4``.
+
+        .. versionadded:: 1.4.5
+
+    dispatch_queue_size: :class:`int`
+        Capacity of the queue between the websocket reader and the workers. Defaults to ``1000``.
+
+        .. versionadded:: 1.4.5
+
+    backpressure: :class:`str`
+        What happens when the queue is full: ``block`` the reader, ``drop_oldest`` queued envelope,
+        or ``shed`` low-priority events such as reactions and pins. Defaults to ``block``.
+
+        .. versionadded:: 1.4.5
+
+    connections: :class:`int`
+        Number of Socket Mode connections opened at once, up to ``10``. Slack spreads envelopes
+        across them and they are merged into one dispatch stream. Defaults to ``1``.
+
+        .. versionadded:: 1.4.5
+
+    dedup_window: :class:`float`
+        Seconds during which a redelivered ``envelope_id`` or ``event_id`` is suppressed.
+        Defaults to ``600``.
+
+        .. versionadded:: 1.4.5
+
+    dedup_size: :class:`int`
+        Maximum number of IDs remembered for deduplication. Defaults to ``10000``.
+
+        .. versionadded:: 1.4.5
+
+    heartbeat_interval: :class:`float`
+        Seconds between websocket pings. ``0`` disables them. Defaults to ``10``.
+
+        .. versionadded:: 1.4.5
+
+    heartbeat_timeout: :class:`float`
+        Seconds to wait for a pong before the connection is replaced as stale. Defaults to ``10``.
+
+        .. versionadded:: 1.4.5
+
+    bootstrap_page_size: :class:`int`
+        Items requested per page of ``conversations.list`` and ``users.list`` on login.
+        Defaults to ``1000``.
+
+        .. versionadded:: 1.4.5
+
+    member_cache: :class:`str`
+        ``eager`` loads every member on login. ``lazy`` skips ``users.list`` and fetches
+        members with ``users.info`` the first time an event refers to them. In both modes,
+        members unknown to the cache are fetched before an event is parsed. Defaults to ``eager``.
+
+        .. versionadded:: 1.4.5
+
+    member_fetch_window: :class:`float`
+        Seconds member misses are collected before their ``users.info`` requests are sent side by side.
+        Concurrent misses of the same member share one request. Defaults to ``0.01``.
+
+        .. versionadded:: 1.4.5
+
+    member_miss_ttl: :class:`float`
+        Seconds a member ID that Slack returned no user for, e.g. ``user_not_found``, is not
+        requested again. ``0`` disables it. Defaults to ``10``.
+
+        .. versionadded:: 1.4.5
+
+    bootstrap_progress: Optional[Callable[[:class:`str`, Dict[:class:`str`, Any]], None]]
+        Called with the phase (``teams``, ``channels``, ``members`` or ``total``) and its
+        ``items``, ``pages`` and ``elapsed`` seconds after every page of the login bootstrap.
+        ``elapsed`` is set once the phase is done.
+
+        .. versionadded:: 1.4.5
+
+    record_to: Optional[:class:`str`]
+        Append every raw envelope to this gzip JSON Lines log. See :class:`EnvelopeRecorder`
+        and :func:`replay`.
+
+        .. versionadded:: 1.4.5
+
+    snapshot_path: Optional[:class:`str`]
+        sqlite file the teams, channels and members are saved to on :meth:`close` and every
+        ``snapshot_interval`` seconds. When it exists, login loads the caches from it and
+        reconciles them with Slack in the background. See :class:`StateSnapshot`.
+
+        .. versionadded:: 1.4.5
+
+    snapshot_interval: :class:`float`
+        Seconds between periodic saves of ``snapshot_path``. ``0`` saves on :meth:`close` only.
+        Defaults to ``300``.
+
         .. versionadded:: 1.4.5
     """
 
@@ -235,6 +401,11 @@ class Client:
             raise TokenTypeException("Token must be start `xapp-`")
 
         self._ws: SlackWebSocket | None = None
+        self._sockets: list[SlackWebSocket] = []
+        self._connections: int = options.get("connections", 1)
+        if not 1 <= self._connections <= MAX_CONNECTIONS:
+            raise InvalidArgumentException(f"connections must be between 1 and {MAX_CONNECTIONS}.")
+
         self._user_token: str = user_token
         self._bot_token: str = bot_token
         self._token: str | None = token
@@ -248,13 +419,59 @@ class Client:
         self._debug = options.get("debug", True)
         utils.setup_logging(self._logger, log_level, log_format)
 
+        cache = options.get("response_cache")
+        if cache is True:
+            cache = ResponseCache()
+
         self.http: HTTPClient = HTTPClient(
             self.loop,
             user_token=user_token,
             bot_token=bot_token,
             token=token,
-            logger=logger
+            logger=self._logger,
+            rate_limit_retries=options.get("rate_limit_retries", 3),
+            connector=options.get("connector"),
+            connector_options=options.get("connector_options"),
+            warmup_connections=options.get("warmup_connections", 0),
+            coalesce_requests=options.get("coalesce_requests", True),
+            # An empty ResponseCache is falsy.
+            cache=cache if isinstance(cache, ResponseCache) else None,
+            file_cache=FileCache(options["file_cache_dir"]) if options.get("file_cache_dir") else None,
+            codec=options.get("json_codec", "auto"),
+            metrics=options.get("metrics", False),
+            base_url=options.get("base_url", BASE)
+        )
+
+        self.socket_metrics: SocketMetrics = SocketMetrics()
+        self.ack_responders: dict[str, AckResponder] = {}
+        self._heartbeat: tuple[float, float] = (
+            options.get("heartbeat_interval", 10.), options.get("heartbeat_timeout", 10.)
+        )
+        self.recorder: EnvelopeRecorder | None = (
+            EnvelopeRecorder(options["record_to"]) if options.get("record_to") else None
         )
+        self.snapshot: StateSnapshot | None = (
+            StateSnapshot(options["snapshot_path"], options.get("json_codec", "auto"))
+            if options.get("snapshot_path") else None
+        )
+        self._snapshot_interval: float = options.get("snapshot_interval", 300.)
+        self._snapshot_tasks: list[asyncio.Task] = []
+        self.dedup: DedupIndex = DedupIndex(
+            maxsize=options.get("dedup_size", 10000),
+            window=options.get("dedup_window", 600.),
+            metrics=self.socket_metrics
+        )
+        self.dispatcher: EventDispatcher | None = None
+        # Last envelope of each shard key that waits for members, see :meth:`_dispatch_envelope`.
+        self._held: dict[str, asyncio.Future] = {}
+        self.receiver: EventsReceiver | None = None
+        self._dispatch_options: dict[str, Any] = {
+            "workers": options.get("dispatch_workers", 4),
+            "maxsize": options.get("dispatch_queue_size", 1000),
+            "policy": options.get("backpressure", "block"),
+        }
+        if self._dispatch_options["policy"] not in EventDispatcher.POLICIES:
+            raise InvalidArgumentException(f"backpressure must be one of {', '.join(EventDispatcher.POLICIES)}.")
 
         self.connection: ConnectionState = self._get_state(**options)
         # self._teams: list[dict[str, Any]]
@@ -337,6 +554,19 @@ class Client:
         """
         return list(self._members.values())
 
+    @property
+    def latency(self) -> Latency:
+        """Rolling round trips of websocket pings over every connection.
+
+        .. versionadded:: 1.4.5
+
+        Returns
+        -------
+        :class:`Latency`
+            ``last``, ``p50`` and ``p99`` in seconds.
+        """
+        return self.socket_metrics.latency
+
     @property
     def logger(self) -> logging.Logger:
         return self._logger
@@ -398,6 +628,37 @@ class Client:
         setattr(self, coro.__name__, coro)
         return coro
 
+    def ack_response(self, envelope_type: str) -> Callable[[AckResponder], AckResponder]:
+        """Register a function building the payload sent with the acknowledgement of an envelope.
+
+        Envelopes are acknowledged as soon as they are decoded, so the function is synchronous and
+        should return quickly. Returning ``None`` sends a plain acknowledgement.
+
+        .. versionadded:: 1.4.5
+
+        Examples
+        --------
+        Examples ::
+
+            @client.ack_response("slash_commands")
+            def echo(payload):
+                return {"text": payload["text"]}
+
+        Parameters
+        ----------
+        envelope_type: :class:`str`
+            ``slash_commands`` or ``interactive``.
+        """
+
+        def decorator(func: AckResponder) -> AckResponder:
+            if asyncio.iscoroutinefunction(func):
+                raise TypeError("ack responder must not be coroutine function.")
+
+            self.ack_responders[envelope_type] = func
+            return func
+
+        return decorator
+
     def run(self) -> None:
         """A blocking call that abstracts away the event loop
         initialisation from you.
@@ -473,41 +734,314 @@ class Client:
         """
         data = await self.http.login()
         self._logger.info("login successful with wss: %s", data.get("url"))
-        self._teams, self._channels, self._members = await self.connection.initialize()
+        await self._initialize()
+        await self.connect(data.get("url"))
+
+    async def serve(
+            self,
+            signing_secret: str,
+            host: str = "0.0.0.0",
+            port: int = 3000,
+            *,
+            path: str = "/slack/events",
+            reuse_port: bool = False,
+            dedup: DedupIndex | None = None
+    ) -> None:
+        """Receive events over HTTP (Events API and interactivity) instead of Socket Mode.
+
+        Get teams, channels and member data, then serve until :meth:`close`.
+        Any number of processes can serve behind a load balancer. Retries are then only
+        suppressed across processes with a shared ``dedup`` store, see :class:`EventsReceiver`.
+
+        .. versionadded:: 1.4.5
+
+        Parameters
+        ----------
+        signing_secret: :class:`str`
+            Signing secret of the app, used to verify requests.
+
+        host: :class:`str`
+            Interface to listen on.
+
+        port: :class:`int`
+            Port to listen on.
+
+        path: :class:`str`
+            Request URL path configured in the app.
+
+        reuse_port: :class:`bool`
+            Let several processes listen on the same port.
+
+        dedup: Optional[:class:`DedupIndex`]
+            Deduplication store of the receiver. Defaults to :attr:`dedup`, which only
+            knows the requests of this process.
+        """
+        await self.http.prepare()
+        await self._initialize()
+        self._start_dispatcher()
+        self.receiver = EventsReceiver(self, signing_secret, path=path, dedup=dedup)
+        await self.receiver.start(host, port, reuse_port=reuse_port)
+        self._logger.info("serving events on http://%s:%s%s", host, port, path)
+        self.connection.parsers["hello"]()
+        await self.receiver.wait_closed()
+
+    async def _initialize(self, bootstrap: StateSnapshot | None = None) -> None:
+        state = self.connection
+        if bootstrap is not None and bootstrap.load(state):
+            # Written from fresh data by another process, e.g. the ingest process of a ShardedRunner.
+            self._teams, self._channels, self._members = state.teams, state.channels, state.members
+
+        elif self.snapshot is not None and self.snapshot.load(state):
+            self._logger.info(
+                "loaded %d teams, %d channels and %d members from %s",
+                len(state.teams), len(state.channels), len(state.members), self.snapshot.path
+            )
+            self._snapshot_tasks.append(asyncio.create_task(self._reconcile(), name="snapshot: reconcile"))
+            self._teams, self._channels, self._members = state.teams, state.channels, state.members
+
+        else:
+            self._teams, self._channels, self._members = await state.initialize()
+            if self.snapshot is not None:
+                await self.snapshot.save(state)
+
+        if self.snapshot is not None and self._snapshot_interval > 0:
+            self._snapshot_tasks.append(asyncio.create_task(self._save_periodically(), name="snapshot: save"))
+
         self._team_manager = _TeamManager(self._teams)
         self._channel_manager = _ChannelManager(self._channels)
-        await self.connect(data.get("url"))
+
+    async def _reconcile(self) -> None:
+        try:
+            changed = await self.connection.reconcile()
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as e:
+            self._logger.error("reconcile of the snapshot raise %s", e, exc_info=e)
+            return
+
+        self._logger.info("snapshot reconciled: %s", changed)
+        await self.snapshot.save(self.connection)
+
+    async def _save_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._snapshot_interval)
+            try:
+                await self.snapshot.save(self.connection)
+
+            except Exception as e:
+                self._logger.error("save of the snapshot raise %s", e, exc_info=e)
+
+    def _start_dispatcher(self) -> EventDispatcher:
+        if self.dispatcher is None:
+            self.dispatcher = EventDispatcher(
+                self._dispatch_envelope, metrics=self.socket_metrics, **self._dispatch_options
+            )
+
+        self.dispatcher.start()
+        return self.dispatcher
 
     async def close(self) -> None:
         """Close connection.
         """
         self._closed = True
+        for ws in list(self._sockets):
+            await ws.socket.close()
+
+        if self.dispatcher is not None:
+            await self.dispatcher.stop(drain=False)
+
+        if self.receiver is not None:
+            await self.receiver.stop()
+
+        if self.recorder is not None:
+            self.recorder.close()
+
+        for task in self._snapshot_tasks:
+            task.cancel()
+
+        self._snapshot_tasks = []
+        if self.snapshot is not None and self.connection.teams:
+            await self.snapshot.save(self.connection)
+
+        await self.http.close()
         self._logger.info("connection closed.")
 
     async def connect(self, ws_url: str) -> None:
         """
         connect to slack-API
 
+        .. versionchanged:: 1.4.5
+            Opens ``connections`` websockets and merges their envelopes.
+            A connection that is closed or asked to refresh is replaced without
+            running :meth:`ConnectionState.initialize` again.
+
         Parameters
         ----------
         ws_url : :class:`str`
         """
-        while True:
-            try:
-                coro = SlackWebSocket.from_client(client=self, ws_url=ws_url, logger=self._logger)
-                self._ws: SlackWebSocket = await asyncio.wait_for(coro, timeout=60.)
-                if not self._ws:
-                    break
-                while True:
-                    try:
-                        await self._ws.poll_event()
+        try:
+            self._start_dispatcher()
+            urls: list[str | None] = [ws_url] + [None] * (self._connections - 1)
+            await asyncio.gather(*(self._supervise(url, first=index == 0) for index, url in enumerate(urls)))
 
-                    except AttributeError:
-                        break
+        except Exception as e:
+            self._logger.error("raise %s", e)
+            raise e
 
-            except Exception as e:
-                self._logger.error("raise %s", e)
-                raise e
+    async def _open_socket(self, ws_url: str | None = None, dispatch_hello: bool = False) -> SlackWebSocket:
+        if ws_url is None:
+            ws_url = (await self.http.open_connection())["url"]
+
+        coro = SlackWebSocket.from_client(
+            client=self, ws_url=ws_url, logger=self._logger, dispatch_hello=dispatch_hello
+        )
+        return await asyncio.wait_for(coro, timeout=60.)
+
+    async def _supervise(self, ws_url: str | None, first: bool = False) -> None:
+        """Keep one connection of the pool open.
+
+        On a ``disconnect`` envelope the replacement is opened while the old socket
+        is still read, so no envelope waits for a reconnect. Failed attempts are
+        retried with :class:`ExponentialBackoff`. The :class:`MembershipIndex` is cleared
+        when a socket closes before another one took over, and again once reconnected.
+        """
+        backoff = ExponentialBackoff()
+        replacement: asyncio.Future[SlackWebSocket] | None = None
+        gap = False
+
+        def open_replacement() -> None:
+            nonlocal replacement
+            if replacement is None:
+                replacement = asyncio.ensure_future(self._open_socket())
+
+        try:
+            while not self._closed:
+                try:
+                    if replacement is not None:
+                        ws, replacement = await replacement, None
+
+                    else:
+                        ws = await self._open_socket(ws_url, dispatch_hello=first)
+
+                except Exception as e:
+                    # A socket URL is used once, the retry asks for a new one.
+                    replacement, ws_url = None, None
+                    gap = True
+                    delay = backoff.delay()
+                    self._logger.warning("websocket connection failed: %r, retrying in %.2fs", e, delay)
+                    await asyncio.sleep(delay)
+                    continue
+
+                backoff.reset()
+                ws_url, first = None, False
+                if gap:
+                    # Channels seeded while no socket was open may miss membership events.
+                    self.connection.membership.clear()
+                    gap = False
+
+                if await self._read_socket(ws, open_replacement) == "link_disabled":
+                    self._logger.error("socket mode is disabled for this app.")
+                    return
+
+                if self._closed:
+                    return
+
+                if replacement is None or not replacement.done():
+                    # Membership events are lost until a socket is open again.
+                    self.connection.membership.clear()
+                    gap = True
+
+                if replacement is None:
+                    self._logger.warning("websocket is closed. reconnecting.")
+                    open_replacement()
+
+                self.socket_metrics.reconnects += 1
+
+        finally:
+            if replacement is not None:
+                replacement.cancel()
+
+    async def _read_socket(self, ws: SlackWebSocket, on_disconnect: Callable[[], None]) -> str | None:
+        """Read ``ws`` until it is closed. ``on_disconnect`` is called on a ``disconnect`` envelope.
+
+        Returns
+        -------
+        Optional[:class:`str`]
+            Reason of the ``disconnect`` envelope, if one was received.
+        """
+        self._sockets.append(ws)
+        self._ws = ws
+        heartbeat = asyncio.create_task(ws.heartbeat(*self._heartbeat)) if self._heartbeat[0] > 0 else None
+        try:
+            while True:
+                envelope = await ws.receive()
+                if envelope is None:
+                    return ws.disconnect_reason
+
+                if envelope.get("type") == "disconnect":
+                    self._logger.info("disconnect requested: %s", ws.disconnect_reason)
+                    if ws.disconnect_reason == "link_disabled":
+                        await ws.socket.close()
+
+                    else:
+                        on_disconnect()
+
+                    continue
+
+                if ws.is_duplicate(envelope):
+                    continue
+
+                await self.dispatcher.put(envelope)
+
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+
+            self._sockets.remove(ws)
+
+    def _dispatch_envelope(self, envelope: dict[str, Any]) -> Coroutine[Any, Any, None] | None:
+        key = shard_key(envelope)
+        previous = self._held.get(key)
+        missing = self.connection.missing_members(envelope.get("payload") or {})
+        if missing or previous is not None:
+            # Later envelopes of the channel wait for this one, so they are still parsed in order.
+            done = self._held[key] = asyncio.get_running_loop().create_future()
+            return self._fetch_and_dispatch(envelope, key, missing, previous, done)
+
+        self._dispatch_now(envelope)
+        return None
+
+    async def _fetch_and_dispatch(
+            self,
+            envelope: dict[str, Any],
+            key: str,
+            missing: set[str],
+            previous: asyncio.Future | None,
+            done: asyncio.Future
+    ) -> None:
+        try:
+            if previous is not None:
+                await asyncio.shield(previous)
+
+            if missing:
+                # Unknown members are fetched first, so the parsers find them.
+                await self.connection.fetch_members(missing)
+
+            self._dispatch_now(envelope)
+
+        finally:
+            done.set_result(None)
+            if self._held.get(key) is done:
+                del self._held[key]
+
+    def _dispatch_now(self, envelope: dict[str, Any]) -> None:
+        if self._ws is not None:
+            self._ws.dispatch_envelope(envelope)
+
+        else:
+            dispatch_to_parsers(self.connection.parsers, envelope)
 
     def _schedule_event(
             self,
@@ -1,21 +1,426 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-import traceback
-from typing import Any, TYPE_CHECKING, IO
+import ssl
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, TYPE_CHECKING, AsyncIterator, Callable
 
 import aiohttp
 
-from .attachment import Attachment
-from .errors import RateLimitException, ForbiddenException
-from .route import Route
-from .utils import parse_exception
+from .attachment import Attachment, FileCache
+from .errors import RateLimitException, ForbiddenException, InvalidArgumentException, RequestException
+from .metrics import HTTPMetrics
+from .route import Route, BASE
+from .utils import parse_exception, get_codec, JSONCodec
 
 if TYPE_CHECKING:
     from .ws import SlackWebSocket
 
+# Requests per minute of Slack's rate-limit tiers.
+# https://api.slack.com/docs/rate-limits
+TIER_1 = 1
+TIER_2 = 20
+TIER_3 = 50
+TIER_4 = 100
+
+RATE_LIMITS: dict[str, int] = {
+    # Tier 1, but Slack lets an app open its 10 Socket Mode connections in a burst.
+    "apps.connections.open": 10,
+    "auth.teams.list": TIER_2,
+    "conversations.archive": TIER_2,
+    "conversations.create": TIER_2,
+    "conversations.list": TIER_2,
+    "conversations.rename": TIER_2,
+    "conversations.setPurpose": TIER_2,
+    "conversations.setTitle": TIER_2,
+    "conversations.setTopic": TIER_2,
+    "emoji.list": TIER_2,
+    "reactions.list": TIER_2,
+    "users.list": TIER_2,
+    "conversations.members": TIER_4,
+    "chat.getPermalink": TIER_4,
+    "chat.postEphemeral": TIER_4,
+    "files.completeUploadExternal": TIER_4,
+    "files.getUploadURLExternal": TIER_4,
+    "users.info": TIER_4,
+}
+
+# `chat.postMessage` is limited to about one message per second per channel.
+PER_CHANNEL_LIMITS: dict[str, int] = {
+    "chat.postMessage": 60,
+}
+
+
+class RateLimited:
+    """Marker returned by :meth:`HTTPClient._request` when Slack answered ``ratelimited``.
+
+    Attributes
+    ----------
+    data: Dict[:class:`str`, Any]
+        Response body.
+
+    retry_after: :class:`float`
+        Seconds to wait before the next request.
+    """
+
+    def __init__(self, data: dict[str, Any], retry_after: str | None):
+        self.data = data
+        try:
+            self.retry_after: float = float(retry_after) if retry_after is not None else 1.0
+
+        except ValueError:
+            self.retry_after = 1.0
+
+
+class RateLimitBucket:
+    """Token bucket of one Slack method family.
+
+    Attributes
+    ----------
+    key: Tuple[:class:`str`, ...]
+        ``(endpoint, token, team[, channel])``.
+
+    limit: :class:`int`
+        Requests allowed per ``per`` seconds.
+
+    per: :class:`float`
+        Length of the window in seconds.
+    """
+
+    def __init__(self, key: tuple[str, ...], limit: int, per: float = 60.0):
+        self.key = key
+        self.limit = limit
+        self.per = per
+        self._tokens: float = float(limit)
+        self._updated: float = time.monotonic()
+        self._blocked_until: float = 0.0
+        self._lock = asyncio.Lock()
+        self._waiting: int = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} key={self.key} remaining={self.remaining} limit={self.limit}>"
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(float(self.limit), self._tokens + (now - self._updated) * self.limit / self.per)
+        self._updated = now
+
+    @property
+    def remaining(self) -> int:
+        """Requests that can be sent right now."""
+        if self.is_limited:
+            return 0
+
+        self._refill(time.monotonic())
+        return int(self._tokens)
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the bucket accepts the next request."""
+        now = time.monotonic()
+        if self._blocked_until > now:
+            return self._blocked_until - now
+
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+
+        return (1 - self._tokens) * self.per / self.limit
+
+    @property
+    def is_limited(self) -> bool:
+        """Whether Slack answered ``ratelimited`` and ``Retry-After`` has not passed yet."""
+        return self._blocked_until > time.monotonic()
+
+    @property
+    def waiting(self) -> int:
+        """Requests queued on this bucket."""
+        return self._waiting
+
+    async def acquire(self) -> None:
+        """Wait until the bucket has capacity and take one request from it.
+
+        Waiters are served in the order they arrived.
+        """
+        self._waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    delay = self.retry_after
+                    if delay <= 0:
+                        break
+                    await asyncio.sleep(delay)
+
+                self._tokens -= 1
+
+        finally:
+            self._waiting -= 1
+
+    def block(self, retry_after: float) -> None:
+        """Close the bucket for ``retry_after`` seconds.
+
+        Parameters
+        ----------
+        retry_after: :class:`float`
+            Value of the ``Retry-After`` header.
+        """
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + retry_after)
+        self._tokens = 1.0
+        self._updated = self._blocked_until
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "per": self.per,
+            "remaining": self.remaining,
+            "retry_after": self.retry_after,
+            "is_limited": self.is_limited,
+            "waiting": self.waiting,
+        }
+
+
+class RateLimiter:
+    """Keeps a :class:`RateLimitBucket` per method family, token and team.
+
+    Parameters
+    ----------
+    max_retries: :class:`int`
+        How many times a ``ratelimited`` request is queued again.
+
+    default_limit: :class:`int`
+        Requests per minute of endpoints missing from :data:`RATE_LIMITS`.
+    """
+
+    def __init__(self, max_retries: int = 3, default_limit: int = TIER_3):
+        self.max_retries = max_retries
+        self.default_limit = default_limit
+        self.buckets: dict[tuple[str, ...], RateLimitBucket] = {}
+
+    def get_bucket(
+            self,
+            route: Route,
+            data: dict[str, Any] | None = None,
+            query: dict[str, Any] | None = None
+    ) -> RateLimitBucket:
+        params: dict[str, Any] = {}
+        if data is not None:
+            params.update(data)
+
+        if query is not None:
+            params.update(query)
+
+        endpoint = route.endpoint
+        team = str(params.get("team") or params.get("team_id") or "")
+        key: tuple[str, ...] = (endpoint, route.token, team)
+
+        per_channel = PER_CHANNEL_LIMITS.get(endpoint)
+        if per_channel is not None:
+            key += (str(params.get("channel", "")),)
+            limit = per_channel
+
+        else:
+            limit = RATE_LIMITS.get(endpoint, self.default_limit)
+
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = self.create_bucket(key, limit)
+
+        return bucket
+
+    # noinspection PyMethodMayBeStatic
+    def create_bucket(self, key: tuple[str, ...], limit: int) -> RateLimitBucket:
+        return RateLimitBucket(key, limit)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """State of every bucket.
+
+        Tokens are not included in the keys.
+
+        Returns
+        -------
+        Dict[:class:`str`, Dict[:class:`str`, Any]]
+        """
+        return {
+            ":".join(k for i, k in enumerate(key) if i != 1): bucket.to_dict() for key, bucket in self.buckets.items()
+        }
+
+
+# Idempotent read endpoints whose identical in-flight ``GET`` requests share one round trip.
+# Endpoints that mint something, like ``files.getUploadURLExternal``, must never be listed.
+COALESCED_ENDPOINTS: frozenset[str] = frozenset((
+    "auth.teams.list",
+    "auth.test",
+    "bots.info",
+    "chat.getPermalink",
+    "chat.scheduledMessages.list",
+    "conversations.history",
+    "conversations.info",
+    "conversations.list",
+    "conversations.members",
+    "conversations.replies",
+    "emoji.list",
+    "files.info",
+    "files.list",
+    "reactions.get",
+    "reactions.list",
+    "team.info",
+    "users.info",
+    "users.list",
+    "users.lookupByEmail",
+))
+
+# Seconds a response of a read endpoint stays in :class:`ResponseCache`.
+CACHE_TTLS: dict[str, float] = {
+    "team.info": 3600.0,
+    "users.info": 300.0,
+    "conversations.info": 300.0,
+    "chat.getPermalink": 86400.0,
+    "emoji.list": 3600.0,
+    "conversations.members": 60.0,
+}
+
+
+class ResponseCache:
+    """TTL and LRU bounded cache of idempotent ``GET`` responses.
+
+    Parameters
+    ----------
+    maxsize: :class:`int`
+        Number of responses kept. The least recently used one is evicted first.
+
+    ttls: Optional[Dict[:class:`str`, :class:`float`]]
+        Seconds each endpoint is cached. Endpoints missing here are never cached.
+        Defaults to :data:`CACHE_TTLS`.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        Requests answered from the cache.
+
+    misses: :class:`int`
+        Cacheable requests sent to Slack.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttls: dict[str, float] | None = None):
+        self.maxsize = maxsize
+        self.ttls: dict[str, float] = dict(CACHE_TTLS if ttls is None else ttls)
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, dict[str, str], dict[str, Any]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_cacheable(self, route: Route) -> bool:
+        return route.method == "GET" and route.endpoint in self.ttls
+
+    def get(self, key: tuple[Any, ...]) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, _, value = entry
+            if expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+            del self._entries[key]
+
+        self.misses += 1
+        return None
+
+    def set(self, key: tuple[Any, ...], route: Route, params: dict[str, str], value: dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttls[route.endpoint], params, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str | None = None, **params: Any) -> int:
+        """Drop cached responses.
+
+        Examples
+        --------
+        Examples ::
+
+            client.http.cache.invalidate("conversations.info", channel=channel.id)
+
+        Parameters
+        ----------
+        endpoint: Optional[:class:`str`]
+            Endpoint to drop. ``None`` drops every endpoint.
+
+        params
+            Only responses requested with these parameters are dropped.
+
+        Returns
+        -------
+        :class:`int`
+            Number of dropped responses.
+        """
+        params = {k: str(v) for k, v in params.items()}
+        removed = [
+            key for key, (_, _params, _) in self._entries.items()
+            if (endpoint is None or key[1] == endpoint) and all(_params.get(k) == v for k, v in params.items())
+        ]
+        for key in removed:
+            del self._entries[key]
+
+        return len(removed)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def create_connector(
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: int | None = 300,
+        ssl_context: ssl.SSLContext | None = None
+) -> aiohttp.TCPConnector:
+    """Create a connection pool for :class:`HTTPClient`.
+
+    Pass the returned connector as ``connector`` to several :class:`Client` objects
+    to share one pool in a process. It must be created in a running event loop and
+    closed by its owner.
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        Total number of simultaneous connections. ``0`` means no limit.
+    limit_per_host: :class:`int`
+        Simultaneous connections to the same host. ``0`` means no limit.
+    keepalive_timeout: :class:`float`
+        Seconds an idle connection stays in the pool.
+    ttl_dns_cache: Optional[:class:`int`]
+        Seconds a resolved address is cached. ``None`` caches forever.
+    ssl_context: Optional[:class:`ssl.SSLContext`]
+        TLS context shared by every connection of the pool, so the CA certificates are loaded once.
+        TLS sessions are not resumed from it: handshakes are saved by keeping connections alive.
+
+    Returns
+    -------
+    :class:`aiohttp.TCPConnector`
+    """
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=ttl_dns_cache,
+        use_dns_cache=True,
+        ssl=ssl_context or ssl.create_default_context()
+    )
+
 
 class HTTPClient:
     """connector of slackAPI
@@ -26,6 +431,13 @@ class HTTPClient:
     user_token : str
     token : str
     bot_token : str
+    rate_limiter : RateLimiter
+    connector : Optional[aiohttp.BaseConnector]
+    cache : Optional[ResponseCache]
+    file_cache : Optional[FileCache]
+    codec : JSONCodec
+    metrics : Optional[HTTPMetrics]
+    base_url : str
 
     """
 
@@ -35,7 +447,17 @@ class HTTPClient:
             user_token: str,
             token: str | None,
             bot_token: str,
-            logger: logging.Logger
+            logger: logging.Logger,
+            rate_limit_retries: int = 3,
+            connector: aiohttp.BaseConnector | None = None,
+            connector_options: dict[str, Any] | None = None,
+            warmup_connections: int = 0,
+            coalesce_requests: bool = True,
+            cache: ResponseCache | None = None,
+            file_cache: FileCache | None = None,
+            codec: str | JSONCodec = "auto",
+            metrics: bool = False,
+            base_url: str = BASE
     ):
         self.loop: asyncio.AbstractEventLoop = loop
         self.user_token: str = user_token
@@ -44,21 +466,63 @@ class HTTPClient:
         self.__session: aiohttp.ClientSession | None = None
         self._ws: SlackWebSocket
         self._logger = logger
+        self._rate_limiter: RateLimiter = RateLimiter(max_retries=rate_limit_retries)
+        self.connector: aiohttp.BaseConnector | None = connector
+        self._connector_options: dict[str, Any] = connector_options or {}
+        self._warmup_connections: int = warmup_connections
+        self._owns_connector: bool = connector is None
+        self._coalesce: bool = coalesce_requests
+        self._inflight: dict[tuple[Any, ...], asyncio.Future] = {}
+        # Downloads in progress by destination path, see File.download.
+        self._downloads: dict[str, asyncio.Future] = {}
+        self.cache: ResponseCache | None = cache
+        self.file_cache: FileCache | None = file_cache
+        self.codec: JSONCodec = get_codec(codec)
+        self.metrics: HTTPMetrics | None = HTTPMetrics() if metrics else None
+        self.base_url: str = base_url if base_url.endswith("/") else base_url + "/"
 
-    async def ws_connect(self, url: str) -> aiohttp.ClientWebSocketResponse:
+    async def ws_connect(self, url: str, **kwargs: Any) -> aiohttp.ClientWebSocketResponse:
         """It connects to a websocket and returns a websocket object
 
         Parameters
         ----------
         url : str
             he URL to connect to.
+        kwargs
+            Passed to :meth:`aiohttp.ClientSession.ws_connect`.
+
+            .. versionadded:: 1.4.5
 
         Returns
         -------
             A websocket connection object.
 
         """
-        return await self.__session.ws_connect(url=url)
+        return await self.__session.ws_connect(url=url, **kwargs)
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Rate-limit engine used by :meth:`request`.
+
+        Returns
+        -------
+        :class:`RateLimiter`
+        """
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, rate_limiter: RateLimiter) -> None:
+        self._rate_limiter = rate_limiter
+
+    @property
+    def buckets(self) -> dict[tuple[str, ...], RateLimitBucket]:
+        """Rate-limit buckets seen so far, keyed by ``(endpoint, token, team[, channel])``.
+
+        Returns
+        -------
+        Dict[Tuple[:class:`str`, ...], :class:`RateLimitBucket`]
+        """
+        return self._rate_limiter.buckets
 
     async def request(
             self,
@@ -69,91 +533,371 @@ class HTTPClient:
     ) -> dict[str, Any] | str:
         """request with param
 
+        The request waits for its rate-limit bucket to have capacity. When Slack still answers
+        ``ratelimited``, the bucket is blocked for ``Retry-After`` seconds and the request is
+        queued again, up to ``rate_limit_retries`` times.
+
+        Identical ``GET`` requests of :data:`COALESCED_ENDPOINTS` (same route, token and parameters)
+        that are in flight at the same time share one round trip.
+        When :attr:`cache` is set, responses of its endpoints are served from it until they expire.
+        Shared and cached responses are returned as shallow copies, so nested objects are shared
+        by every caller and must be treated as read-only.
+
         Parameters
         ----------
         query
         route : Route
         data : Optional[Dict[str, Any]]
 
+        Raises
+        ------
+        :class:`RateLimitException`
+            Raise when retries are exhausted.
+
         Returns
         -------
             Union[Dict[str, Any], str]
         """
+        if route.method != "GET":
+            return await self._send(route, data, query, **kwargs)
+
+        key = self._request_key(route, data, query)
+        cache = self.cache
+        if cache is not None and cache.is_cacheable(route):
+            cached = cache.get(key)
+            if cached is not None:
+                return dict(cached)
+
+            response = await self._coalesced(key, route, data, query, **kwargs)
+            if isinstance(response, dict):
+                cache.set(key, route, dict(key[3] + key[4]), response)
+                return dict(response)
+
+            return response
+
+        return await self._coalesced(key, route, data, query, **kwargs)
+
+    async def _coalesced(
+            self,
+            key: tuple[Any, ...],
+            route: Route,
+            data: dict[str, Any] | None = None,
+            query: dict[str, str] | None = None,
+            **kwargs
+    ) -> dict[str, Any] | str:
+        if not self._coalesce or route.endpoint not in COALESCED_ENDPOINTS or kwargs.get("files") is not None:
+            return await self._send(route, data, query, **kwargs)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(route, data, query, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+
+        response = await asyncio.shield(task)
+        return dict(response) if isinstance(response, dict) else response
+
+    def _finish_inflight(self, key: tuple[Any, ...], task: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller was cancelled.
+            task.exception()
+
+    @staticmethod
+    def _request_key(
+            route: Route,
+            data: dict[str, Any] | None,
+            query: dict[str, Any] | None
+    ) -> tuple[Any, ...]:
+        return (
+            route.method,
+            route.endpoint,
+            route.token,
+            tuple(sorted((str(k), str(v)) for k, v in (data or {}).items())),
+            tuple(sorted((str(k), str(v)) for k, v in (query or {}).items())),
+        )
+
+    async def _send(
+            self,
+            route: Route,
+            data: dict[str, Any] | None = None,
+            query: dict[str, str] | None = None,
+            **kwargs
+    ) -> dict[str, Any] | str:
+        bucket = self._rate_limiter.get_bucket(route, data, query)
+        metrics = self.metrics
+        retries = 0
+        while True:
+            if metrics is not None and bucket.retry_after > 0:
+                started = time.perf_counter()
+                await bucket.acquire()
+                metrics.record_wait(route.endpoint, time.perf_counter() - started)
+
+            else:
+                await bucket.acquire()
+
+            response = await self._request(route, data, query, **kwargs)
+            if not isinstance(response, RateLimited):
+                return response
+
+            if retries >= self._rate_limiter.max_retries:
+                raise RateLimitException(response.data)
+
+            retries += 1
+            if metrics is not None:
+                metrics.record_retry(route.endpoint)
+
+            bucket.block(response.retry_after)
+            self._logger.warning(
+                "%s is rate limited. retrying in %.2f seconds. (%d/%d)",
+                route.endpoint,
+                response.retry_after,
+                retries,
+                self._rate_limiter.max_retries
+            )
+
+    async def _request(
+            self,
+            route: Route,
+            data: dict[str, Any] | None = None,
+            query: dict[str, str] | None = None,
+            **kwargs
+    ) -> dict[str, Any] | str | RateLimited | None:
         headers = {
             "Authorization": f"Bearer {route.token}",
         }
         attrs = {
             "headers": headers
         }
-        is_file = False
-        f: IO | None = None
-        files: list[Attachment] | None = kwargs.get("files")
-        if files is not None:
-            f = open(files[0].fp, mode="rb")
-            data["file"] = f
-            is_file = True
-
         if data is not None:
             attrs["data"] = data
 
+        url = self.base_url + route.endpoint
         if query is not None:
             query_url = "&".join(f"{k}={v}" for k, v in query.items())
-            route.url += f"?{query_url}"
+            url += f"?{query_url}"
 
         method = route.method
-
-        url = route.url
+        metrics = self.metrics
+        started = time.perf_counter() if metrics is not None else 0.0
 
         async with self.__session.request(method, url, **attrs) as response:
+            body = await response.read()
+            if metrics is not None:
+                metrics.record_response(
+                    route.endpoint,
+                    response.status,
+                    time.perf_counter() - started,
+                    len(body),
+                    len(url) + sum(len(str(k)) + len(str(v)) + 2 for k, v in (data or {}).items())
+                )
+
             try:
-                _json = await response.json(content_type=None)
+                _json = self.codec.loads(body)
                 is_ok = _json.get("ok")
+                if metrics is not None and is_ok is not True:
+                    metrics.record_error(route.endpoint, str(_json.get("error")))
+
                 if 300 > response.status >= 200:
                     if is_ok is True:
-                        if is_file is True:
-                            try:
-                                f.close()
-
-                            except IOError as io:
-                                traceback.format_exception(io)
-                                raise io
-
-                            finally:
-                                # noinspection PyUnusedLocal
-                                is_file = False
                         return _json
 
                     else:
                         if _json.get("error") == "ratelimited":
-
-                            raise RateLimitException(_json)
+                            return RateLimited(_json, response.headers.get("Retry-After"))
 
                         else:
                             parse_exception(_json["error"])
 
+                elif response.status == 429:
+                    return RateLimited(_json, response.headers.get("Retry-After"))
+
                 elif response.status == 403:
                     raise ForbiddenException()
 
-            except json.JSONDecodeError:
+            except self.codec.decode_errors:
                 self._logger.warning("JSON object cannot serialize.")
                 return await response.text()
 
-    def send_files(
+    async def upload_file(
             self,
-            route: Route,
-            data: Any,
-            file: Attachment | None = None,
-            files: list[Attachment] | None = None
-    ):
-        if file is not None:
-            files = [file]
+            attachment: Attachment,
+            progress: Callable[[Attachment, int, int], Any] | None = None,
+            chunk_size: int = 262144
+    ) -> str:
+        """Stream one file to an upload URL from ``files.getUploadURLExternal``.
 
-        return self.request(
-            route,
-            data=data,
-            files=files,
+        .. versionadded:: 1.4.5
+
+        Parameters
+        ----------
+        attachment: :class:`Attachment`
+            File to upload.
+
+        progress: Optional[Callable[[:class:`Attachment`, :class:`int`, :class:`int`], Any]]
+            Called with the attachment, bytes sent and total bytes after each chunk.
+
+        chunk_size: :class:`int`
+            Maximum length of each chunk read from the file.
+
+        Raises
+        ------
+        :class:`InvalidArgumentException`
+            Raise when the length of the file is unknown.
+        :class:`RequestException`
+            Raise when the upload URL rejects the file.
+
+        Returns
+        -------
+        :class:`str`
+            ID of the uploaded file.
+        """
+        length = attachment.length
+        if length is None:
+            raise InvalidArgumentException(f"Length of {attachment.name} is unknown. Pass `size` to Attachment.")
+
+        rtn = await self.request(
+            Route("GET", "files.getUploadURLExternal", self.bot_token),
+            query={
+                "filename": urllib.parse.quote(attachment.name, safe=""),
+                "length": length
+            }
+        )
+        sent = 0
+
+        async def body() -> AsyncIterator[bytes]:
+            nonlocal sent
+            async for chunk in attachment.stream(chunk_size):
+                sent += len(chunk)
+                if progress is not None:
+                    progress(attachment, sent, length)
+                yield chunk
+
+        async with self.__session.post(
+                rtn["upload_url"],
+                data=body(),
+                headers={"Content-Length": str(length)}
+        ) as response:
+            if response.status != 200:
+                raise RequestException(f"Upload of {attachment.name} failed with status {response.status}.")
+
+        return rtn["file_id"]
+
+    async def send_files(
+            self,
+            attachments: list[Attachment],
+            channel_id: str | None = None,
+            initial_comment: str | None = None,
+            concurrency: int = 4,
+            progress: Callable[[Attachment, int, int], Any] | None = None
+    ) -> dict[str, Any]:
+        """Upload files in parallel and share them in one message.
+
+        .. versionchanged:: 1.4.5
+            Use ``files.getUploadURLExternal`` and ``files.completeUploadExternal``
+            instead of the deprecated ``files.upload``.
+
+        Parameters
+        ----------
+        attachments: List[:class:`Attachment`]
+            Files to upload.
+
+        channel_id: Optional[:class:`str`]
+            Channel the files are shared to. ``None`` keeps them private.
+
+        initial_comment: Optional[:class:`str`]
+            Message posted with the files.
+
+        concurrency: :class:`int`
+            Number of files uploaded at the same time.
+
+        progress: Optional[Callable[[:class:`Attachment`, :class:`int`, :class:`int`], Any]]
+            See :meth:`upload_file`.
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+            Response of ``files.completeUploadExternal``.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upload(attachment: Attachment) -> dict[str, str]:
+            async with semaphore:
+                file_id = await self.upload_file(attachment, progress)
+            return {"id": file_id, "title": attachment.title}
+
+        files = await asyncio.gather(*(upload(a) for a in attachments))
+        data = {
+            "files": self.codec.dumps(files)
+        }
+        if channel_id is not None:
+            data["channel_id"] = channel_id
+
+        if initial_comment:
+            data["initial_comment"] = initial_comment
+
+        return await self.request(
+            Route("POST", "files.completeUploadExternal", self.bot_token),
+            data=data
         )
 
+    async def download(
+            self,
+            url: str,
+            offset: int = 0,
+            chunk_size: int = 262144
+    ) -> AsyncIterator[bytes]:
+        """Stream a private file with the bot token.
+
+        .. versionadded:: 1.4.5
+
+        Parameters
+        ----------
+        url: :class:`str`
+            ``url_private`` or ``url_private_download`` of a file.
+
+        offset: :class:`int`
+            Byte to start from. Sent as a ``Range`` header.
+
+        chunk_size: :class:`int`
+            Maximum length of each chunk.
+
+        Raises
+        ------
+        :class:`ForbiddenException`
+            Raise when the token cannot read the file.
+        :class:`RequestException`
+            Raise when the download fails.
+
+        Yields
+        ------
+        :class:`bytes`
+        """
+        headers = {
+            "Authorization": f"Bearer {self.bot_token}"
+        }
+        if offset > 0:
+            headers["Range"] = f"bytes={offset}-"
+
+        async with self.__session.get(url, headers=headers) as response:
+            if response.status == 403:
+                raise ForbiddenException()
+
+            if response.status not in (200, 206):
+                raise RequestException(f"Download of {url} failed with status {response.status}.")
+
+            # The server ignored the range and sent the whole file.
+            skip = offset if response.status == 200 else 0
+            async for chunk in response.content.iter_chunked(chunk_size):
+                if skip > 0:
+                    if len(chunk) <= skip:
+                        skip -= len(chunk)
+                        continue
+
+                    chunk, skip = chunk[skip:], 0
+
+                yield chunk
+
     def send_message(self, route: Route, data=None, query=None):
         """It takes a parameter, and returns a request
 
@@ -222,11 +966,71 @@ class HTTPClient:
             The data that is being returned is the data that is being sent to the server.
 
         """
-        self.__session = aiohttp.ClientSession()
-        data = await self.request(
+        await self.prepare()
+        return await self.open_connection()
+
+    async def prepare(self) -> None:
+        """Create the session and open the warm-up connections.
+
+        .. versionadded:: 1.4.5
+        """
+        await self.create_session()
+        if self._warmup_connections > 0:
+            await self.warmup(self._warmup_connections)
+
+    async def open_connection(self) -> dict[str, Any]:
+        """Ask for a new Socket Mode websocket URL.
+
+        Every call returns a different URL, so it is called once per connection of a pool.
+
+        .. versionadded:: 1.4.5
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+            Response of ``apps.connections.open``.
+        """
+        return await self.request(
             Route("POST", "apps.connections.open", self.token)
         )
-        return data
+
+    async def create_session(self) -> aiohttp.ClientSession:
+        """Create the session on top of :attr:`connector`.
+
+        A connector passed by the user is shared and not closed with the session.
+
+        Returns
+        -------
+        :class:`aiohttp.ClientSession`
+        """
+        if self.__session is not None and not self.__session.closed:
+            return self.__session
+
+        self._owns_connector = self.connector is None
+        if self._owns_connector:
+            self.connector = create_connector(**self._connector_options)
+
+        self.__session = aiohttp.ClientSession(connector=self.connector, connector_owner=self._owns_connector)
+        return self.__session
+
+    async def warmup(self, count: int) -> None:
+        """Open ``count`` keep-alive connections to Slack before the first burst.
+
+        Parameters
+        ----------
+        count: :class:`int`
+            Number of connections to open.
+        """
+
+        async def _open() -> None:
+            try:
+                async with self.__session.post(self.base_url + "api.test") as response:
+                    await response.read()
+
+            except aiohttp.ClientError as e:
+                self._logger.warning("warmup connection failed: %s", e)
+
+        await asyncio.gather(*(_open() for _ in range(count)))
 
     async def close(self):
         """It closes the session
@@ -234,3 +1038,6 @@ class HTTPClient:
         """
         if self.__session:
             await self.__session.close()
+            self.__session = None
+            if self._owns_connector:
+                self.connector = None
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import urllib.parse
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Collection, Generator, Generic, TypeVar
+
+from .route import Route
+
+if TYPE_CHECKING:
+    from .httpclient import HTTPClient
+
+__all__ = (
+    "CachedIterator",
+    "CursorIterator",
+    "PageIterator",
+)
+
+T = TypeVar("T")
+
+
+class CursorIterator(Generic[T]):
+    """Async iterator over a list endpoint paginated with ``response_metadata.next_cursor``.
+
+    Only one page is held in memory at a time, so it can stream lists of any length.
+    Awaiting the iterator collects every item into a list.
+
+    .. versionadded:: 1.4.5
+
+    Examples
+    --------
+    Examples ::
+
+        async for message in channel.history(limit=None):
+            print(message.content)
+
+        messages = await channel.history(limit=50)
+
+    Parameters
+    ----------
+    http: :class:`HTTPClient`
+        Client that sends the requests.
+
+    route: :class:`Route`
+        Route of the list endpoint.
+
+    key: :class:`str`
+        Key of the items in each page, like ``messages`` or ``members``.
+
+    converter: Callable[[Any], T]
+        Builds an item from its raw payload.
+
+    query: Optional[Dict[:class:`str`, Any]]
+        Parameters sent with every page.
+
+    limit: Optional[:class:`int`]
+        Maximum number of items. ``None`` reads every page.
+
+    page_size: :class:`int`
+        Number of items requested per page.
+
+    prefetch: :class:`bool`
+        Request the next page while the current one is consumed.
+    """
+
+    page_size_key: str = "limit"
+
+    def __init__(
+            self,
+            http: HTTPClient,
+            route: Route,
+            key: str,
+            converter: Callable[[Any], T],
+            query: dict[str, Any] | None = None,
+            *,
+            limit: int | None = None,
+            page_size: int = 200,
+            prefetch: bool = False
+    ):
+        self.http = http
+        self.route = route
+        self.key = key
+        self.converter = converter
+        self.query: dict[str, Any] = query or {}
+        self.limit = limit
+        self.page_size = page_size
+        self.prefetch = prefetch
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._iterate()
+
+    def __await__(self) -> Generator[Any, None, list[T]]:
+        return self.flatten().__await__()
+
+    async def flatten(self) -> list[T]:
+        """Collect every item into a list.
+
+        Returns
+        -------
+        List[T]
+        """
+        return [item async for item in self]
+
+    async def pages(self) -> AsyncIterator[list[Any]]:
+        """Iterate over the raw items of each page.
+
+        Yields
+        ------
+        List[Any]
+        """
+        remaining = self.limit
+        params: dict[str, Any] | None = {}
+        next_page: asyncio.Future | None = None
+        try:
+            page = await self._fetch(params, remaining)
+            while True:
+                items = page.get(self.key) or []
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+
+                params = self._next_params(page)
+                if params is None or remaining == 0:
+                    yield items
+                    return
+
+                if self.prefetch:
+                    next_page = asyncio.ensure_future(self._fetch(params, remaining))
+
+                yield items
+
+                if next_page is not None:
+                    page, next_page = await next_page, None
+
+                else:
+                    page = await self._fetch(params, remaining)
+
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def _iterate(self) -> AsyncIterator[T]:
+        async for items in self.pages():
+            for item in items:
+                yield self.converter(item)
+
+    async def _fetch(self, params: dict[str, Any], remaining: int | None) -> dict[str, Any]:
+        page_size = self.page_size if remaining is None else min(self.page_size, remaining)
+        query = {**self.query, self.page_size_key: page_size, **params}
+        return await self.http.request(self.route, query=query)
+
+    # noinspection PyMethodMayBeStatic
+    def _next_params(self, page: dict[str, Any]) -> dict[str, Any] | None:
+        cursor = (page.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            return None
+
+        return {"cursor": urllib.parse.quote(cursor, safe="")}
+
+
+class PageIterator(CursorIterator[T]):
+    """:class:`CursorIterator` for endpoints paginated with ``page`` and ``paging.pages``,
+    like ``files.list``.
+
+    .. versionadded:: 1.4.5
+    """
+
+    page_size_key = "count"
+
+    async def _fetch(self, params: dict[str, Any], remaining: int | None) -> dict[str, Any]:
+        # Offsets depend on ``count``, so it stays the same on every page and the last one is trimmed.
+        query = {**self.query, self.page_size_key: self.page_size, **params}
+        return await self.http.request(self.route, query=query)
+
+    def _next_params(self, page: dict[str, Any]) -> dict[str, Any] | None:
+        paging = page.get("paging") or {}
+        current = int(paging.get("page", 1))
+        if current >= int(paging.get("pages", 1)):
+            return None
+
+        return {"page": current + 1}
+
+
+class CachedIterator(Generic[T]):
+    """:class:`CursorIterator` look-alike over items that are loaded at once, usually from a cache.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    loader: Callable[[], Awaitable[Collection[Any]]]
+        Returns the raw items.
+
+    converter: Callable[[Any], T]
+        Builds an item from its raw payload.
+
+    limit: Optional[:class:`int`]
+        Maximum number of items. ``None`` returns every item.
+    """
+
+    def __init__(
+            self,
+            loader: Callable[[], Awaitable[Collection[Any]]],
+            converter: Callable[[Any], T],
+            *,
+            limit: int | None = None
+    ):
+        self.loader = loader
+        self.converter = converter
+        self.limit = limit
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._iterate()
+
+    def __await__(self) -> Generator[Any, None, list[T]]:
+        return self.flatten().__await__()
+
+    async def flatten(self) -> list[T]:
+        """Collect every item into a list.
+
+        Returns
+        -------
+        List[T]
+        """
+        return [item async for item in self]
+
+    async def pages(self) -> AsyncIterator[list[Any]]:
+        """Yield the raw items as one page.
+
+        Yields
+        ------
+        List[Any]
+        """
+        items = list(await self.loader())
+        yield items if self.limit is None else items[:self.limit]
+
+    async def _iterate(self) -> AsyncIterator[T]:
+        async for items in self.pages():
+            for item in items:
+                yield self.converter(item)
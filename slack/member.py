@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import sys
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .channel import Channel
 from .route import Route
@@ -20,6 +21,89 @@ __all__ = (
     "Member"
 )
 
+# Order of the profile values packed into a tuple until :attr:`Member.profile` is read.
+_PROFILE_FIELDS: tuple[str, ...] = (
+    "phone",
+    "skype",
+    "real_name",
+    "real_name_normalized",
+    "display_name",
+    "display_name_normalized",
+    "fields",
+    "status_text",
+    "status_emoji",
+    "status_emoji_display_info",
+    "status_expiration",
+    "avatar_hash",
+    "huddle_state",
+    "first_name",
+    "last_name",
+    "image_24",
+    "image_32",
+    "image_48",
+    "image_72",
+    "image_192",
+    "image_512",
+    "status_text_canonical",
+    "team",
+)
+# Values shared by many members, kept once.
+_INTERNED_PROFILE_FIELDS = frozenset(("status_text", "status_emoji", "huddle_state", "team"))
+# Avatar URLs of every size usually differ from ``image_512`` only by the size.
+_SCALED_IMAGES: dict[str, str] = {
+    "image_24": "24",
+    "image_32": "32",
+    "image_48": "48",
+    "image_72": "72",
+    "image_192": "192",
+}
+_SCALED = object()
+_IMAGE_512 = _PROFILE_FIELDS.index("image_512")
+_PROFILE_LAYOUT: tuple[tuple[str, bool, str | None], ...] = tuple(
+    (key, key in _INTERNED_PROFILE_FIELDS, _SCALED_IMAGES.get(key)) for key in _PROFILE_FIELDS
+)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _pack_profile(data: ProfilePayload, *shared: str | None) -> tuple[Any, ...]:
+    image_512 = data.get("image_512")
+    # Names repeat within a record, e.g. ``real_name`` and ``real_name_normalized``.
+    strings: dict[str, str] = {value: value for value in shared if value}
+    values = []
+    for key, interned, size in _PROFILE_LAYOUT:
+        value = data.get(key)
+        if value.__class__ is not str:
+            pass
+
+        elif interned:
+            value = sys.intern(value)
+
+        elif size is not None and image_512 and value == image_512.replace("512", size):
+            value = _SCALED
+
+        else:
+            value = strings.setdefault(value, value)
+
+        values.append(value)
+
+    return tuple(values)
+
+
+def _unpack_profile(values: tuple[Any, ...]) -> ProfilePayload:
+    image_512: str = values[_IMAGE_512]
+    data: dict[str, Any] = {}
+    for key, value in zip(_PROFILE_FIELDS, values):
+        if value is _SCALED:
+            value = image_512.replace("512", _SCALED_IMAGES[key])
+
+        if value is not None:
+            data[key] = value
+
+    return data
+
 
 class Profile:
     """This function takes in a user and a data object and sets the user and data attributes of the Profile class to the
@@ -44,6 +128,12 @@ class Profile:
 
     """
 
+    __slots__ = (
+        "__state",
+        "user",
+        *_PROFILE_FIELDS,
+    )
+
     def __init__(self, state: ConnectionState, user: "Member", data: ProfilePayload):
         self.__state = state
         self.user = user
@@ -70,7 +160,38 @@ class Profile:
         self.image_512 = data.get("image_512")
         self.status_text_canonical = data.get("status_text_canonical")
         __team = data.get("team")
-        self.team: Team | None = state.teams[__team] if __team is not None else None
+        self.team: Team | None = state.teams.get(__team) if __team is not None else None
+
+    def to_dict(self) -> ProfilePayload:
+        """Payload this profile can be built from again.
+
+        .. versionadded:: 1.4.5
+        """
+        return {
+            "phone": self.phone,
+            "skype": self.skype,
+            "real_name": self.real_name,
+            "real_name_normalized": self.real_name_normalized,
+            "display_name": self.display_name,
+            "display_name_normalized": self.display_name_normalized,
+            "fields": self.fields,
+            "status_text": self.status_text,
+            "status_emoji": self.status_emoji,
+            "status_emoji_display_info": self.status_emoji_display_info,
+            "status_expiration": self.status_expiration,
+            "avatar_hash": self.avatar_hash,
+            "huddle_state": self.huddle_state,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "image_24": self.image_24,
+            "image_32": self.image_32,
+            "image_48": self.image_48,
+            "image_72": self.image_72,
+            "image_192": self.image_192,
+            "image_512": self.image_512,
+            "status_text_canonical": self.status_text_canonical,
+            "team": self.team.id if self.team is not None else None,
+        }
 
 
 # It creates a class called User.
@@ -96,27 +217,69 @@ class Member:
 
     bot: :class:`bool`
         Is bot.
+
+    profile: :class:`Profile`
+        Built from the packed profile values the first time it is read.
+
+        .. versionchanged:: 1.4.5
+            Built lazily.
     """
 
+    __slots__ = (
+        "__state",
+        "id",
+        "team",
+        "deleted",
+        "color",
+        "real_name",
+        "tz",
+        "tz_label",
+        "tz_offset",
+        "_profile",
+        "name",
+        "is_admin",
+        "is_owner",
+        "bot",
+        "is_app_user",
+        "_updated",
+        "is_email_confirmed",
+    )
+
     def __init__(self, state: ConnectionState, data: MemberPayload):
         self.__state = state
-        self.id = data.get("id")
+        self._update(data)
+
+    def _update(self, data: MemberPayload) -> None:
+        state = self.__state
+        self.id = _intern(data.get("id"))
         self.team = state.teams[data.get("team_id")]
         self.deleted = data.get("deleted", False)
-        self.color = data.get("color")
+        self.color = _intern(data.get("color"))
         self.real_name = data.get("real_name")
-        self.tz = data.get("tz")
-        self.tz_label = data.get("tz_label")
+        self.tz = _intern(data.get("tz"))
+        self.tz_label = _intern(data.get("tz_label"))
         self.tz_offset = data.get("tz_offset")
-        self.profile: Profile = Profile(state, self, data.get("profile", {}))
         self.name = data.get("name")
+        self._profile: Profile | tuple[Any, ...] = _pack_profile(data.get("profile", {}), self.real_name, self.name)
         self.is_admin: bool = data.get("is_admin", False)
         self.is_owner: bool = data.get("is_owner", False)
         self.bot: bool = data.get("is_bot", False)
         self.is_app_user: bool = data.get("is_app_user", False)
-        self.updated_at = datetime.fromtimestamp(float(data.get("updated", 0)))
+        self._updated: float = float(data.get("updated", 0))
         self.is_email_confirmed: bool = data.get("is_email_confirmed", False)
 
+    @property
+    def profile(self) -> Profile:
+        profile = self._profile
+        if not isinstance(profile, Profile):
+            profile = self._profile = Profile(self.__state, self, _unpack_profile(profile))
+
+        return profile
+
+    @property
+    def updated_at(self) -> datetime:
+        return datetime.fromtimestamp(self._updated)
+
     def __eq__(self, other) -> bool:
         if isinstance(other, Member):
             return self.id == other.id
@@ -126,6 +289,32 @@ class Member:
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id} name={self.name} is_bot={self.bot}>"
 
+    def to_dict(self) -> MemberPayload:
+        """Payload this member can be built from again.
+
+        .. versionadded:: 1.4.5
+        """
+        return {
+            "id": self.id,
+            "team_id": self.team.id if self.team is not None else None,
+            "name": self.name,
+            "deleted": self.deleted,
+            "color": self.color,
+            "real_name": self.real_name,
+            "tz": self.tz,
+            "tz_label": self.tz_label,
+            "tz_offset": self.tz_offset,
+            "profile": (
+                self._profile.to_dict() if isinstance(self._profile, Profile) else _unpack_profile(self._profile)
+            ),
+            "is_admin": self.is_admin,
+            "is_owner": self.is_owner,
+            "is_bot": self.bot,
+            "is_app_user": self.is_app_user,
+            "updated": self._updated,
+            "is_email_confirmed": self.is_email_confirmed,
+        }
+
     @property
     def mention(self) -> str:
         """Return member mention.
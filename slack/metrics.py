@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import bisect
+from collections import deque
+from typing import Any
+
+__all__ = (
+    "Histogram",
+    "Latency",
+    "EndpointMetrics",
+    "HTTPMetrics",
+    "SocketMetrics",
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram of durations in seconds.
+
+    .. versionadded:: 1.4.5
+
+    Attributes
+    ----------
+    count: :class:`int`
+        Number of observed values.
+
+    total: :class:`float`
+        Sum of observed values.
+
+    max: :class:`float`
+        Largest observed value.
+    """
+
+    BOUNDS: tuple[float, ...] = (
+        0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+    )
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets: list[int] = [0] * (len(self.BOUNDS) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} count={self.count} mean={self.mean:.4f}>"
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect.bisect_left(self.BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket containing the ``q`` quantile.
+
+        Parameters
+        ----------
+        q: :class:`float`
+            Between ``0`` and ``1``.
+
+        Returns
+        -------
+        :class:`float`
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.BOUNDS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": {
+                **{str(bound): count for bound, count in zip(self.BOUNDS, self.buckets)},
+                "+Inf": self.buckets[-1]
+            },
+        }
+
+
+class Latency:
+    """Rolling window of the last websocket round trips, in seconds.
+
+    Read through ``client.latency``.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    size: :class:`int`
+        Number of samples kept.
+    """
+
+    __slots__ = ("samples",)
+
+    def __init__(self, size: int = 100):
+        self.samples: deque[float] = deque(maxlen=size)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} last={self.last:.4f} p50={self.p50:.4f} p99={self.p99:.4f}>"
+
+    def record(self, value: float) -> None:
+        self.samples.append(value)
+
+    @property
+    def last(self) -> float:
+        """Latest round trip. ``nan`` before the first pong."""
+        return self.samples[-1] if self.samples else float("nan")
+
+    @property
+    def p50(self) -> float:
+        return self.quantile(0.5)
+
+    @property
+    def p99(self) -> float:
+        return self.quantile(0.99)
+
+    def quantile(self, q: float) -> float:
+        """Nearest-rank quantile of the window. ``nan`` before the first pong.
+
+        Parameters
+        ----------
+        q: :class:`float`
+            Between ``0`` and ``1``.
+
+        Returns
+        -------
+        :class:`float`
+        """
+        if not self.samples:
+            return float("nan")
+
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, max(0, int(q * len(ordered) + 0.5) - 1))]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": len(self.samples),
+            "last": self.last,
+            "p50": self.p50,
+            "p99": self.p99,
+        }
+
+
+class EndpointMetrics:
+    """Counters of one Slack API method.
+
+    .. versionadded:: 1.4.5
+
+    Attributes
+    ----------
+    requests: :class:`int`
+        Responses received.
+
+    statuses: Dict[:class:`int`, :class:`int`]
+        Responses per HTTP status.
+
+    errors: Dict[:class:`str`, :class:`int`]
+        Responses per Slack ``error`` code.
+
+    retries: :class:`int`
+        Requests sent again after ``ratelimited``.
+
+    rate_limit_waits: :class:`int`
+        Requests that waited for their rate-limit bucket.
+
+    rate_limit_wait_time: :class:`float`
+        Seconds spent waiting for rate-limit buckets.
+
+    bytes_in: :class:`int`
+        Bytes of response bodies.
+
+    bytes_out: :class:`int`
+        Approximate bytes of URLs and form data.
+
+    latency: :class:`Histogram`
+        Time from sending the request to reading the body.
+    """
+
+    __slots__ = (
+        "requests",
+        "statuses",
+        "errors",
+        "retries",
+        "rate_limit_waits",
+        "rate_limit_wait_time",
+        "bytes_in",
+        "bytes_out",
+        "latency",
+    )
+
+    def __init__(self):
+        self.requests: int = 0
+        self.statuses: dict[int, int] = {}
+        self.errors: dict[str, int] = {}
+        self.retries: int = 0
+        self.rate_limit_waits: int = 0
+        self.rate_limit_wait_time: float = 0.0
+        self.bytes_in: int = 0
+        self.bytes_out: int = 0
+        self.latency: Histogram = Histogram()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "errors": dict(self.errors),
+            "retries": self.retries,
+            "rate_limit_waits": self.rate_limit_waits,
+            "rate_limit_wait_time": self.rate_limit_wait_time,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "latency": self.latency.to_dict(),
+        }
+
+
+class HTTPMetrics:
+    """Per-endpoint metrics of :class:`HTTPClient`.
+
+    Enabled with ``Client(metrics=True)`` and read through ``client.http.metrics``.
+    When disabled, ``client.http.metrics`` is ``None`` and nothing is recorded.
+
+    .. versionadded:: 1.4.5
+
+    Examples
+    --------
+    Examples ::
+
+        snapshot = client.http.metrics.snapshot()
+        print(snapshot["chat.postMessage"]["latency"]["p99"])
+    """
+
+    def __init__(self):
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def __getitem__(self, endpoint: str) -> EndpointMetrics:
+        return self.endpoint(endpoint)
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+
+        return metrics
+
+    def record_response(self, endpoint: str, status: int, latency: float, bytes_in: int, bytes_out: int) -> None:
+        metrics = self.endpoint(endpoint)
+        metrics.requests += 1
+        metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+        metrics.latency.observe(latency)
+        metrics.bytes_in += bytes_in
+        metrics.bytes_out += bytes_out
+
+    def record_error(self, endpoint: str, error: str) -> None:
+        errors = self.endpoint(endpoint).errors
+        errors[error] = errors.get(error, 0) + 1
+
+    def record_retry(self, endpoint: str) -> None:
+        self.endpoint(endpoint).retries += 1
+
+    def record_wait(self, endpoint: str, seconds: float) -> None:
+        metrics = self.endpoint(endpoint)
+        metrics.rate_limit_waits += 1
+        metrics.rate_limit_wait_time += seconds
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Copy of every counter as plain dicts.
+
+        Returns
+        -------
+        Dict[:class:`str`, Dict[:class:`str`, Any]]
+        """
+        return {endpoint: metrics.to_dict() for endpoint, metrics in self.endpoints.items()}
+
+    def reset(self) -> None:
+        self.endpoints.clear()
+
+
+class SocketMetrics:
+    """Metrics of the Socket Mode connections of :class:`Client`.
+
+    Read through ``client.socket_metrics``.
+
+    .. versionadded:: 1.4.5
+
+    Attributes
+    ----------
+    envelopes: :class:`int`
+        Envelopes received.
+
+    acks: :class:`int`
+        Envelopes acknowledged.
+
+    ack_latency: :class:`Histogram`
+        Time from receiving a frame to sending its acknowledgement.
+
+    queue_depth: :class:`int`
+        Envelopes waiting for a dispatcher worker.
+
+    max_queue_depth: :class:`int`
+        Largest queue depth seen.
+
+    dropped: :class:`int`
+        Envelopes dropped by the ``drop_oldest`` policy.
+
+    shed: :class:`int`
+        Low-priority envelopes dropped by the ``shed`` policy.
+
+    reconnects: :class:`int`
+        Connections replaced after a ``disconnect`` envelope or a closed socket.
+
+    duplicates: :class:`int`
+        Redelivered envelopes that were not dispatched again.
+
+    stale: :class:`int`
+        Connections closed because they did not answer a ping.
+
+    latency: :class:`Latency`
+        Round trips of websocket pings.
+    """
+
+    def __init__(self):
+        self.envelopes: int = 0
+        self.acks: int = 0
+        self.ack_latency: Histogram = Histogram()
+        self.queue_depth: int = 0
+        self.max_queue_depth: int = 0
+        self.dropped: int = 0
+        self.shed: int = 0
+        self.reconnects: int = 0
+        self.duplicates: int = 0
+        self.stale: int = 0
+        self.latency: Latency = Latency()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Copy of every counter as plain dicts.
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+        """
+        return {
+            "envelopes": self.envelopes,
+            "acks": self.acks,
+            "ack_latency": self.ack_latency.to_dict(),
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "dropped": self.dropped,
+            "shed": self.shed,
+            "reconnects": self.reconnects,
+            "duplicates": self.duplicates,
+            "stale": self.stale,
+            "latency": self.latency.to_dict(),
+        }
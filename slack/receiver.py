@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import logging
+import time
+import urllib.parse
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .ws import DedupIndex
+
+__all__ = (
+    "EventsReceiver",
+    "verify_signature",
+)
+
+_logger = logging.getLogger(__name__)
+
+
+def verify_signature(
+        signing_secret: str,
+        timestamp: str | None,
+        body: bytes,
+        signature: str | None,
+        *,
+        tolerance: float = 300.,
+        now: float | None = None
+) -> bool:
+    """Check the ``X-Slack-Signature`` of a request.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    signing_secret: :class:`str`
+        Signing secret of the app.
+
+    timestamp: Optional[:class:`str`]
+        ``X-Slack-Request-Timestamp`` header.
+
+    body: :class:`bytes`
+        Raw request body.
+
+    signature: Optional[:class:`str`]
+        ``X-Slack-Signature`` header.
+
+    tolerance: :class:`float`
+        Maximum age of the request in seconds, against replay attacks.
+
+    now: Optional[:class:`float`]
+        Current unix time. Defaults to :func:`time.time`.
+
+    Returns
+    -------
+    :class:`bool`
+    """
+    if not timestamp or not signature:
+        return False
+
+    try:
+        if abs((time.time() if now is None else now) - int(timestamp)) > tolerance:
+            return False
+
+    except ValueError:
+        return False
+
+    base = b"v0:" + timestamp.encode() + b":" + body
+    expected = "v0=" + hmac.new(signing_secret.encode(), base, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+class EventsReceiver:
+    """HTTP endpoint for the Events API, interactivity and slash commands.
+
+    Requests are verified, turned into the same envelopes as Socket Mode and put on the
+    dispatcher of ``client``, then answered right away, well within Slack's 3 seconds.
+    Usually started by :meth:`Client.serve`.
+
+    Retries of Slack, sent with ``X-Slack-Retry-Num``, are suppressed by ``dedup``. The default
+    :class:`DedupIndex` of ``client`` only knows the requests of its own process, so behind a load
+    balancer a retry that reaches another process is dispatched again. Pass a store shared by
+    every process, e.g. backed by Redis, to suppress those as well.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        Client whose dispatcher, ack responders and deduplication index are used.
+
+    signing_secret: :class:`str`
+        Signing secret of the app.
+
+    path: :class:`str`
+        Request URL path.
+
+    ack_timeout: :class:`float`
+        Seconds to wait for room in a full dispatcher queue. After that the request is answered
+        with ``503`` and Slack delivers it again later.
+
+    dedup: Optional[:class:`DedupIndex`]
+        Deduplication store. Any object with the ``seen_envelope`` and ``forget_envelope`` methods
+        of :class:`DedupIndex` works, and they may be coroutines. Defaults to ``client.dedup``.
+    """
+
+    def __init__(
+            self,
+            client: Client,
+            signing_secret: str,
+            *,
+            path: str = "/slack/events",
+            ack_timeout: float = 2.,
+            dedup: DedupIndex | None = None
+    ):
+        self.client = client
+        self.signing_secret = signing_secret
+        self.path = path
+        self.ack_timeout = ack_timeout
+        self.dedup: DedupIndex = client.dedup if dedup is None else dedup
+        self.app: web.Application = web.Application()
+        self.app.router.add_post(path, self.handle)
+        self._runner: web.AppRunner | None = None
+        self._closed: asyncio.Event = asyncio.Event()
+
+    async def start(self, host: str = "0.0.0.0", port: int = 3000, *, reuse_port: bool = False) -> None:
+        self._closed.clear()
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port, reuse_port=reuse_port)
+        await site.start()
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+        self._closed.set()
+
+    async def wait_closed(self) -> None:
+        await self._closed.wait()
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        received_at = time.perf_counter()
+        body = await request.read()
+        if not verify_signature(
+                self.signing_secret,
+                request.headers.get("X-Slack-Request-Timestamp"),
+                body,
+                request.headers.get("X-Slack-Signature")
+        ):
+            return web.Response(status=401, text="invalid signature")
+
+        try:
+            envelope = self.to_envelope(request.content_type, body)
+
+        except (ValueError, KeyError, TypeError):
+            return web.Response(status=400, text="invalid body")
+
+        if envelope["type"] == "url_verification":
+            return web.json_response({"challenge": envelope["payload"].get("challenge")})
+
+        client = self.client
+        metrics = client.socket_metrics
+        metrics.envelopes += 1
+        if not await self._call_dedup("seen_envelope", envelope):
+            try:
+                await asyncio.wait_for(client.dispatcher.put(envelope), self.ack_timeout)
+
+            except asyncio.TimeoutError:
+                # Not dispatched: the retry of Slack must not be taken for a duplicate.
+                await self._call_dedup("forget_envelope", envelope)
+                _logger.warning("dispatcher queue is full. asking Slack to retry.")
+                return web.Response(status=503, text="busy")
+
+            except BaseException:
+                await self._call_dedup("forget_envelope", envelope)
+                raise
+
+        response = web.Response(status=200)
+        responder = client.ack_responders.get(envelope["type"])
+        if responder is not None:
+            try:
+                payload = responder(envelope["payload"])
+
+            except Exception as e:
+                _logger.error("ack responder of %s raise %s", envelope["type"], e, exc_info=e)
+
+            else:
+                if payload is not None:
+                    response = web.Response(
+                        status=200, text=client.http.codec.dumps(payload), content_type="application/json"
+                    )
+
+        metrics.acks += 1
+        metrics.ack_latency.observe(time.perf_counter() - received_at)
+        return response
+
+    def to_envelope(self, content_type: str, body: bytes) -> dict[str, Any]:
+        """Turn a request body into a Socket Mode shaped envelope.
+
+        Parameters
+        ----------
+        content_type: :class:`str`
+        body: :class:`bytes`
+
+        Raises
+        ------
+        :class:`ValueError`
+            Raise when the body is not valid JSON, or not an object with a ``type``.
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+            ``type`` is ``url_verification``, ``events_api``, ``interactive`` or ``slash_commands``.
+        """
+        if content_type == "application/x-www-form-urlencoded":
+            form = {k: v[0] for k, v in urllib.parse.parse_qs(body.decode(), keep_blank_values=True).items()}
+            if "payload" in form:
+                payload = self.client.http.codec.loads(form["payload"])
+                if not isinstance(payload, dict):
+                    raise ValueError("payload is not an object.")
+
+                return {"type": "interactive", "payload": payload}
+
+            return {"type": "slash_commands", "payload": form}
+
+        data: dict[str, Any] = self.client.http.codec.loads(body)
+        if not isinstance(data, dict) or "type" not in data:
+            raise ValueError("body is not an event.")
+
+        if data["type"] == "url_verification":
+            return {"type": "url_verification", "payload": data}
+
+        return {"type": "events_api", "payload": data}
+
+    async def _call_dedup(self, method: str, envelope: dict[str, Any]) -> Any:
+        result = getattr(self.dedup, method)(envelope)
+        if asyncio.iscoroutine(result):
+            result = await result
+
+        return result
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Any, Iterator
+
+from .utils import JSONCodec, get_codec
+from .ws import dispatch_to_parsers, envelope_event_type
+
+if TYPE_CHECKING:
+    from .state import ConnectionState
+
+__all__ = (
+    "EnvelopeRecorder",
+    "read_envelopes",
+    "replay",
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class EnvelopeRecorder:
+    """Append every raw Socket Mode envelope to a gzip-compressed JSON Lines log.
+
+    Each line is ``{"t": <unix time of receipt>, "envelope": <frame as received>}``.
+    The frame is written as it came off the socket, without encoding it again.
+
+    .. versionadded:: 1.4.5
+
+    Examples
+    --------
+    Examples ::
+
+        client = slack.Client(user_token, bot_token, token, record_to="envelopes.jsonl.gz")
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        Log file. Existing logs are appended to.
+
+    compresslevel: :class:`int`
+        gzip level from ``1`` (fastest) to ``9`` (smallest).
+
+    Attributes
+    ----------
+    count: :class:`int`
+        Envelopes written by this recorder.
+    """
+
+    def __init__(self, path: str | os.PathLike, compresslevel: int = 6):
+        self.path = path
+        self.count: int = 0
+        self._file = gzip.open(path, "at", encoding="utf-8", compresslevel=compresslevel)
+
+    def __enter__(self) -> EnvelopeRecorder:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, frame: str | bytes, received_at: float | None = None) -> None:
+        """Append one frame.
+
+        Parameters
+        ----------
+        frame: Union[:class:`str`, :class:`bytes`]
+            Raw JSON text of the envelope.
+
+        received_at: Optional[:class:`float`]
+            Unix time of receipt. Defaults to now.
+        """
+        if isinstance(frame, bytes):
+            frame = frame.decode("utf-8")
+
+        if received_at is None:
+            received_at = time.time()
+
+        self._file.write(f'{{"t":{received_at:.6f},"envelope":{frame}}}\n')
+        self.count += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+def read_envelopes(path: str | os.PathLike, codec: str | JSONCodec = "auto") -> Iterator[tuple[float, dict[str, Any]]]:
+    """Read a log written by :class:`EnvelopeRecorder`.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        Log file.
+
+    codec: Union[:class:`str`, :class:`JSONCodec`]
+        JSON backend. See :func:`get_codec`.
+
+    Yields
+    ------
+    Tuple[:class:`float`, Dict[:class:`str`, Any]]
+        Unix time of receipt and envelope.
+    """
+    codec = get_codec(codec)
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+
+            record = codec.loads(line)
+            yield record["t"], record["envelope"]
+
+
+async def replay(
+        state: ConnectionState,
+        path: str | os.PathLike,
+        *,
+        pace: float | None = None,
+        codec: str | JSONCodec = "auto"
+) -> dict[str, Any]:
+    """Feed a recorded log into ``state.parsers``.
+
+    Envelopes go straight to the parsers, without a websocket, acknowledgement or deduplication,
+    so the result measures parsing and dispatch alone.
+
+    .. versionadded:: 1.4.5
+
+    Examples
+    --------
+    Examples ::
+
+        stats = await slack.replay(client.connection, "envelopes.jsonl.gz")
+        print(stats["rate"], "envelopes/s")
+
+    Parameters
+    ----------
+    state: :class:`ConnectionState`
+        State whose parsers receive the envelopes, usually ``client.connection``.
+
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        Log written by :class:`EnvelopeRecorder`.
+
+    pace: Optional[:class:`float`]
+        ``None`` replays as fast as possible. ``1.0`` keeps the original gaps between envelopes,
+        ``2.0`` halves them.
+
+    codec: Union[:class:`str`, :class:`JSONCodec`]
+        JSON backend. See :func:`get_codec`.
+
+    Returns
+    -------
+    Dict[:class:`str`, Any]
+        ``envelopes``, ``errors``, ``undefined`` events, ``elapsed`` seconds and ``rate`` per second.
+    """
+    parsers = state.parsers
+    envelopes = errors = undefined = 0
+    first_at: float | None = None
+    started = time.perf_counter()
+    for received_at, data in read_envelopes(path, codec):
+        if pace is not None:
+            if first_at is None:
+                first_at = received_at
+
+            delay = (received_at - first_at) / pace - (time.perf_counter() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        elif envelopes % 100 == 0:
+            # Let the scheduled event handlers run.
+            await asyncio.sleep(0)
+
+        envelopes += 1
+        if data.get("type") == "disconnect":
+            continue
+
+        try:
+            if not dispatch_to_parsers(parsers, data):
+                undefined += 1
+
+        except Exception as e:
+            errors += 1
+            _logger.error("replay of %s raise %s", envelope_event_type(data), e, exc_info=e)
+
+    await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    return {
+        "envelopes": envelopes,
+        "errors": errors,
+        "undefined": undefined,
+        "elapsed": elapsed,
+        "rate": envelopes / elapsed if elapsed else 0.0,
+    }
@@ -16,6 +16,7 @@ class Route:
 
         """
         self.method: str = method
+        self.endpoint: str = endpoint
         self.url: str = BASE + endpoint
         self.token: str = token
 
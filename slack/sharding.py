@@ -0,0 +1,504 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import tempfile
+import threading
+import time
+import zlib
+from multiprocessing.managers import BaseManager
+from typing import TYPE_CHECKING, Any, Callable
+
+from .httpclient import RateLimitBucket, RateLimiter
+from .metrics import SocketMetrics
+from .snapshot import StateSnapshot
+from .state import MembershipIndex
+from .ws import dispatch_to_parsers, envelope_event_type
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .state import ConnectionState
+
+__all__ = (
+    "ShardedRunner",
+    "SharedRateLimiter",
+    "shard_key",
+)
+
+_logger = logging.getLogger(__name__)
+
+# Put on every worker queue when the membership indexes must be cleared.
+_RESET_MEMBERSHIP = "reset_membership"
+
+
+def shard_key(envelope: dict[str, Any], key: str = "channel") -> str:
+    """Key that decides the worker of an envelope.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    envelope: Dict[:class:`str`, Any]
+        Decoded envelope.
+
+    key: :class:`str`
+        ``channel`` uses the channel of the event and falls back to the team.
+        ``team`` uses the team.
+
+    Returns
+    -------
+    :class:`str`
+        Empty when the envelope has neither.
+    """
+    payload: dict[str, Any] = envelope.get("payload") or {}
+    if key == "channel":
+        event: dict[str, Any] = payload.get("event") or {}
+        channel = event.get("channel") or (event.get("item") or {}).get("channel") or payload.get("channel")
+        if isinstance(channel, dict):
+            channel = channel.get("id")
+
+        if channel:
+            return channel
+
+    team = payload.get("team_id") or payload.get("team")
+    if isinstance(team, dict):
+        team = team.get("id")
+
+    return team or ""
+
+
+class RateLimitState:
+    """Token buckets kept in the manager process and shared by every worker.
+
+    Buckets are ``[tokens, updated, blocked_until]`` lists keyed like :class:`RateLimitBucket`.
+    :func:`time.monotonic` is system-wide, so the times of every process agree.
+    """
+
+    def __init__(self):
+        self._buckets: dict[tuple[str, ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: tuple[str, ...], limit: int, per: float, now: float) -> list[float]:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(limit), now, 0.0]
+
+        else:
+            bucket[0] = min(float(limit), bucket[0] + (now - bucket[1]) * limit / per)
+            bucket[1] = now
+
+        return bucket
+
+    def reserve(self, key: tuple[str, ...], limit: int, per: float) -> tuple[float, float, float]:
+        """Take one request, or return the seconds to wait before trying again.
+
+        The tokens left and the time the block is lifted are returned as well,
+        so the caller can answer questions about the bucket without asking again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._get(key, limit, per, now)
+            if bucket[2] > now:
+                return bucket[2] - now, bucket[0], bucket[2]
+
+            if bucket[0] < 1:
+                return (1 - bucket[0]) * per / limit, bucket[0], bucket[2]
+
+            bucket[0] -= 1
+            return 0.0, bucket[0], bucket[2]
+
+    def peek(self, key: tuple[str, ...], limit: int, per: float) -> tuple[float, float]:
+        """Tokens left and seconds until the block is lifted."""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._get(key, limit, per, now)
+            return bucket[0], max(0.0, bucket[2] - now)
+
+    def block(self, key: tuple[str, ...], limit: int, per: float, retry_after: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._get(key, limit, per, now)
+            bucket[2] = max(bucket[2], now + retry_after)
+            bucket[0] = 1.0
+            bucket[1] = bucket[2]
+
+
+class _StateManager(BaseManager):
+    pass
+
+
+_rate_limit_state: RateLimitState | None = None
+
+
+def _get_rate_limit_state() -> RateLimitState:
+    global _rate_limit_state
+    if _rate_limit_state is None:
+        _rate_limit_state = RateLimitState()
+
+    return _rate_limit_state
+
+
+_StateManager.register("rate_limits", callable=_get_rate_limit_state)
+
+
+class SharedRateLimitBucket(RateLimitBucket):
+    """:class:`RateLimitBucket` whose tokens live in :class:`RateLimitState`.
+
+    Calls to the manager process block, so they run in the default executor. The state
+    it answered last is kept locally, and :attr:`remaining`, :attr:`retry_after` and
+    :attr:`is_limited` are computed from it without asking the manager again.
+    """
+
+    def __init__(self, key: tuple[str, ...], limit: int, state: Any, per: float = 60.0):
+        super().__init__(key, limit, per)
+        self.state = state
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    if self.is_limited:
+                        # Known locally, the block may not have reached the manager yet.
+                        await asyncio.sleep(self._blocked_until - time.monotonic())
+                        continue
+
+                    delay, self._tokens, self._blocked_until = await loop.run_in_executor(
+                        None, self.state.reserve, self.key, self.limit, self.per
+                    )
+                    self._updated = time.monotonic()
+                    if delay <= 0:
+                        break
+                    await asyncio.sleep(delay)
+
+        finally:
+            self._waiting -= 1
+
+    def block(self, retry_after: float) -> None:
+        super().block(retry_after)
+        future = asyncio.get_running_loop().run_in_executor(
+            None, self.state.block, self.key, self.limit, self.per, retry_after
+        )
+        future.add_done_callback(self._blocked)
+
+    def _blocked(self, future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            _logger.warning("could not share the rate limit of %s: %r", self.key[0], future.exception())
+
+
+class SharedRateLimiter(RateLimiter):
+    """:class:`RateLimiter` whose buckets are shared with other processes.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    state:
+        Proxy of the shared bucket state, from :attr:`ShardedRunner.address`.
+
+    max_retries: :class:`int`
+        How many times a ``ratelimited`` request is queued again.
+    """
+
+    def __init__(self, state: Any, max_retries: int = 3, **kwargs: Any):
+        super().__init__(max_retries=max_retries, **kwargs)
+        self.state = state
+
+    def create_bucket(self, key: tuple[str, ...], limit: int) -> RateLimitBucket:
+        return SharedRateLimitBucket(key, limit, self.state)
+
+
+class _ShardRouter:
+    """Stands in for :class:`EventDispatcher` in the ingest process and routes envelopes to the workers."""
+
+    def __init__(self, queues: list[Any], key: str, metrics: SocketMetrics):
+        self.queues = queues
+        self.key = key
+        self.metrics = metrics
+
+    def start(self) -> None:
+        pass
+
+    async def stop(self, drain: bool = True) -> None:
+        pass
+
+    async def put(self, envelope: dict[str, Any]) -> bool:
+        target = self.queues[zlib.crc32(shard_key(envelope, self.key).encode()) % len(self.queues)]
+        try:
+            target.put_nowait(envelope)
+
+        except queue.Full:
+            # Wait for the worker without blocking the other connections.
+            await asyncio.get_running_loop().run_in_executor(None, target.put, envelope)
+
+        return True
+
+    def broadcast(self, item: Any) -> None:
+        """Put ``item`` on every worker queue without waiting for room."""
+        for target in self.queues:
+            try:
+                target.put_nowait(item)
+
+            except queue.Full:
+                asyncio.get_running_loop().run_in_executor(None, target.put, item)
+
+
+class _ShardMembership(MembershipIndex):
+    """Stands in for the :class:`MembershipIndex` of the ingest process, which indexes nothing.
+
+    Clearing it after a connection gap clears the indexes of the workers instead.
+    """
+
+    def __init__(self, state: ConnectionState, router: _ShardRouter):
+        super().__init__(state)
+        self.router = router
+
+    def clear(self) -> None:
+        super().clear()
+        self.router.broadcast(_RESET_MEMBERSHIP)
+
+
+def _run_worker(
+        factory: Callable[[], Client],
+        index: int,
+        envelopes: Any,
+        address: Any,
+        authkey: bytes,
+        bootstrap: str
+) -> None:
+    asyncio.run(_worker(factory, index, envelopes, address, authkey, bootstrap))
+
+
+async def _worker(
+        factory: Callable[[], Client],
+        index: int,
+        envelopes: Any,
+        address: Any,
+        authkey: bytes,
+        bootstrap: str
+) -> None:
+    manager = _StateManager(address=address, authkey=authkey)
+    manager.connect()
+    client = factory()
+    client.http.rate_limiter = SharedRateLimiter(
+        manager.rate_limits(), max_retries=client.http.rate_limiter.max_retries
+    )
+    await client.http.prepare()
+    # Loaded from the caches of the ingest process, so Slack is only listed once.
+    await client._initialize(StateSnapshot(bootstrap, client.http.codec))
+    client.connection.parsers["hello"]()
+    _logger.info("shard worker %s is ready.", index)
+
+    loop = asyncio.get_running_loop()
+    local: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+
+    def pump() -> None:
+        while True:
+            item = envelopes.get()
+            loop.call_soon_threadsafe(local.put_nowait, item)
+            if item is None:
+                return
+
+    threading.Thread(target=pump, name=f"shard-{index}-reader", daemon=True).start()
+    parsers = client.connection.parsers
+    try:
+        while True:
+            envelope = await local.get()
+            if envelope is None:
+                break
+
+            if envelope == _RESET_MEMBERSHIP:
+                # The ingest process had no open socket for a while, membership events may be lost.
+                client.connection.membership.clear()
+                continue
+
+            # Envelopes of one channel are parsed one by one, in the order they were received.
+            try:
+                missing = client.connection.missing_members(envelope.get("payload") or {})
+                if missing:
+                    await client.connection.fetch_members(missing)
+
+                dispatch_to_parsers(parsers, envelope)
+
+            except Exception as e:
+                _logger.error("shard %s: dispatch of %s raise %s", index, envelope_event_type(envelope), e, exc_info=e)
+
+            if local.empty():
+                await asyncio.sleep(0)
+
+    finally:
+        await client.close()
+
+
+class ShardedRunner:
+    """Read Socket Mode in one process and handle events in a pool of worker processes.
+
+    Envelopes are routed by :func:`shard_key`, so every envelope of a channel (or team)
+    goes to the same worker and is parsed in order. Each worker builds its own :class:`Client`
+    with ``factory`` and runs its own handlers. The rate-limit buckets of every process are
+    shared through a manager process.
+
+    ``factory`` is also called once in the ingest process, which only reads, acknowledges,
+    deduplicates and routes envelopes. Ack responders registered there still answer
+    interactive envelopes. It lists teams, channels and members once, or loads them from
+    ``snapshot_path``, and writes them to a :class:`StateSnapshot` every worker loads its
+    :class:`ConnectionState` from. Its own caches are emptied afterwards.
+
+    .. versionadded:: 1.4.5
+
+    Examples
+    --------
+    Examples ::
+
+        def make_client():
+            client = slack.Client(user_token, bot_token, token, connections=4)
+
+            @client.event
+            async def on_message(message):
+                ...
+
+            return client
+
+        if __name__ == "__main__":
+            slack.ShardedRunner(make_client, workers=8).run()
+
+    Parameters
+    ----------
+    factory: Callable[[], :class:`Client`]
+        Builds a client with its handlers. Must be picklable, e.g. a module level function,
+        when the start method is ``spawn``.
+
+    workers: Optional[:class:`int`]
+        Number of worker processes. Defaults to the number of CPUs.
+
+    key: :class:`str`
+        ``channel`` or ``team``. See :func:`shard_key`.
+
+    queue_size: :class:`int`
+        Envelopes buffered per worker before the ingest process waits.
+
+    start_method: Optional[:class:`str`]
+        :mod:`multiprocessing` start method. Defaults to the platform default.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], Client],
+            workers: int | None = None,
+            *,
+            key: str = "channel",
+            queue_size: int = 10000,
+            start_method: str | None = None
+    ):
+        if key not in ("channel", "team"):
+            raise ValueError("key must be channel or team.")
+
+        self.factory = factory
+        self.workers: int = workers or os.cpu_count() or 1
+        self.key = key
+        self.queue_size = queue_size
+        self.context = multiprocessing.get_context(start_method)
+        self.client: Client | None = None
+        self.processes: list[multiprocessing.process.BaseProcess] = []
+        self._manager: _StateManager | None = None
+
+    @property
+    def address(self) -> Any:
+        """Address of the manager process holding the shared rate-limit state."""
+        return self._manager.address if self._manager is not None else None
+
+    def run(self) -> None:
+        """A blocking call that runs :meth:`start` until interrupted."""
+        try:
+            asyncio.run(self.start())
+
+        except KeyboardInterrupt:
+            pass
+
+    async def start(self) -> None:
+        """Start the manager and the workers, then read Socket Mode until the client is closed."""
+        authkey = os.urandom(32)
+        self._manager = _StateManager(authkey=authkey, ctx=self.context)
+        self._manager.start()
+        queues = [self.context.Queue(self.queue_size) for _ in range(self.workers)]
+        client = self.client = self.factory()
+        client.http.rate_limiter = SharedRateLimiter(
+            self._manager.rate_limits(), max_retries=client.http.rate_limiter.max_retries
+        )
+        # The ingest process keeps no state: events are parsed by the workers.
+        client.connection.parsers = {}
+        client.dispatcher = router = _ShardRouter(queues, self.key, client.socket_metrics)
+        client.connection.membership = _ShardMembership(client.connection, router)
+        directory = tempfile.TemporaryDirectory(prefix="slack-shards-")
+        try:
+            data = await client.http.login()
+            bootstrap = await self.bootstrap(os.path.join(directory.name, "bootstrap.sqlite3"))
+            self.processes = [
+                self.context.Process(
+                    target=_run_worker,
+                    args=(self.factory, index, queues[index], self._manager.address, authkey, bootstrap),
+                    name=f"slack-shard-{index}",
+                    daemon=True
+                )
+                for index in range(self.workers)
+            ]
+            for process in self.processes:
+                process.start()
+
+            await client.connect(data["url"])
+
+        finally:
+            await self.stop(queues)
+            directory.cleanup()
+
+    async def bootstrap(self, path: str) -> str:
+        """Fill the caches of the ingest client, write them to ``path`` for the workers and empty them.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            File of the :class:`StateSnapshot`.
+
+        Returns
+        -------
+        :class:`str`
+            ``path``.
+        """
+        client = self.client
+        state = client.connection
+        if client.snapshot is None or not client.snapshot.load(state):
+            await state.initialize()
+            if client.snapshot is not None:
+                await client.snapshot.save(state)
+
+        await StateSnapshot(path, client.http.codec).save(state)
+        _logger.info(
+            "bootstrapped %d teams, %d channels and %d members for the workers",
+            len(state.teams), len(state.channels), len(state.members)
+        )
+        state.teams.clear()
+        state.channels.clear()
+        state.members.clear()
+        return path
+
+    async def stop(self, queues: list[Any] | None = None) -> None:
+        if self.client is not None and not self.client.is_closed():
+            await self.client.close()
+
+        for q in queues or []:
+            q.put(None)
+
+        loop = asyncio.get_running_loop()
+        for process in self.processes:
+            await loop.run_in_executor(None, process.join, 30)
+            if process.is_alive():
+                process.terminate()
+
+        self.processes = []
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
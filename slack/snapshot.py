@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any
+
+from .channel import Channel
+from .member import Member
+from .team import Team
+from .utils import JSONCodec, get_codec
+
+if TYPE_CHECKING:
+    from .state import ConnectionState
+
+__all__ = (
+    "StateSnapshot",
+)
+
+_logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+
+class StateSnapshot:
+    """sqlite file holding the teams, channels and members of a :class:`ConnectionState`.
+
+    A client started with ``snapshot_path`` loads the caches from the file instead of
+    running :meth:`ConnectionState.initialize`, then reconciles them with Slack in the background.
+    Objects are stored as the payloads they are built from, so a snapshot written by another
+    version of the models is rebuilt like any API response. A snapshot of another schema
+    version is ignored.
+
+    .. versionadded:: 1.4.5
+
+    Examples
+    --------
+    Examples ::
+
+        client = slack.Client(user_token, bot_token, token, snapshot_path="state.sqlite3")
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        Snapshot file. Created on the first save.
+
+    codec: Union[:class:`str`, :class:`JSONCodec`]
+        JSON backend of the stored payloads. See :func:`get_codec`.
+    """
+
+    def __init__(self, path: str | os.PathLike, codec: str | JSONCodec = "auto"):
+        self.path = path
+        self.codec: JSONCodec = get_codec(codec)
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={self.path}>"
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS teams (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS channels (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS members (id TEXT PRIMARY KEY, updated REAL, data TEXT NOT NULL);
+            """
+        )
+        return conn
+
+    @property
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def saved_at(self) -> float | None:
+        """Unix time of the last save, or ``None`` without a usable snapshot.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+        """
+        if not self.exists:
+            return None
+
+        with self._connect() as conn:
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+
+        if meta.get("version") != str(SCHEMA_VERSION) or "saved_at" not in meta:
+            return None
+
+        return float(meta["saved_at"])
+
+    async def dump(self, state: ConnectionState, chunk_size: int = 1000) -> dict[str, list[tuple[Any, ...]]]:
+        """Rows of every cached object.
+
+        Objects are serialized on the event loop, since events mutate them there, ``chunk_size``
+        at a time with a yield to the loop in between, so a large cache does not stall events.
+
+        Parameters
+        ----------
+        state: :class:`ConnectionState`
+
+        chunk_size: :class:`int`
+            Objects serialized between two yields to the event loop.
+
+        Returns
+        -------
+        Dict[:class:`str`, List[Tuple[Any, ...]]]
+            Rows of ``teams``, ``channels`` and ``members``.
+        """
+        dumps = self.codec.dumps
+        rows: dict[str, list[tuple[Any, ...]]] = {"teams": [], "channels": [], "members": []}
+        # Copied, the caches may change while the loop runs between chunks.
+        items = {
+            "teams": list(state.teams.items()),
+            "channels": list(state.channels.items()),
+            "members": list(state.members.items()),
+        }
+        for table, objects in items.items():
+            for start in range(0, len(objects), chunk_size):
+                if table == "members":
+                    rows[table].extend(
+                        (member_id, member.updated_at.timestamp(), dumps(member.to_dict()))
+                        for member_id, member in objects[start:start + chunk_size]
+                    )
+
+                else:
+                    rows[table].extend((key, dumps(obj.to_dict())) for key, obj in objects[start:start + chunk_size])
+
+                await asyncio.sleep(0)
+
+        return rows
+
+    def write(self, rows: dict[str, list[tuple[Any, ...]]]) -> None:
+        """Replace the snapshot with ``rows`` from :meth:`dump` in one transaction."""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM teams")
+                conn.execute("DELETE FROM channels")
+                conn.execute("DELETE FROM members")
+                conn.executemany("INSERT INTO teams VALUES (?, ?)", rows["teams"])
+                conn.executemany("INSERT INTO channels VALUES (?, ?)", rows["channels"])
+                conn.executemany("INSERT INTO members VALUES (?, ?, ?)", rows["members"])
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                    [("version", str(SCHEMA_VERSION)), ("saved_at", repr(time.time()))]
+                )
+
+        finally:
+            conn.close()
+
+    async def save(self, state: ConnectionState) -> int:
+        """Write the caches of ``state``. Rows are built in chunks by :meth:`dump` and
+        the file is written in the default executor.
+
+        Parameters
+        ----------
+        state: :class:`ConnectionState`
+
+        Returns
+        -------
+        :class:`int`
+            Number of objects written.
+        """
+        started = time.perf_counter()
+        rows = await self.dump(state)
+        async with self._lock:
+            await asyncio.get_running_loop().run_in_executor(None, self.write, rows)
+
+        count = sum(len(r) for r in rows.values())
+        _logger.debug("snapshot of %d objects saved in %.3fs", count, time.perf_counter() - started)
+        return count
+
+    def load(self, state: ConnectionState) -> bool:
+        """Fill the caches of ``state`` from the snapshot.
+
+        Parameters
+        ----------
+        state: :class:`ConnectionState`
+
+        Returns
+        -------
+        :class:`bool`
+            ``False`` when there is no snapshot of this schema version. The caches are left untouched.
+        """
+        if self.saved_at() is None:
+            return False
+
+        loads = self.codec.loads
+        conn = self._connect()
+        try:
+            teams = conn.execute("SELECT id, data FROM teams").fetchall()
+            members = conn.execute("SELECT id, data FROM members").fetchall()
+            channels = conn.execute("SELECT id, data FROM channels").fetchall()
+
+        finally:
+            conn.close()
+
+        # Members refer to teams and channels refer to both.
+        for team_id, data in teams:
+            state.teams[team_id] = Team(state, loads(data))
+
+        for member_id, data in members:
+            state.members[member_id] = Member(state=state, data=loads(data))
+
+        for channel_id, data in channels:
+            state.channels[channel_id] = Channel(state, loads(data))
+
+        return True
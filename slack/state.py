@@ -1,22 +1,25 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import datetime
 import inspect
 import logging
 import sys
+import time
 from typing import (
     Callable,
     Any,
     TYPE_CHECKING,
     TypeVar,
-    Generic, Optional,
+    Generic, Optional, Iterable,
 )
 
 from typing_extensions import Unpack
 
 from .block import Block
 from .channel import Channel, DeletedChannel
+from .iterators import CursorIterator
 from .member import Member
 from .message import (
     Message,
@@ -31,6 +34,9 @@ from .utils import ts2time
 if TYPE_CHECKING:
     from .httpclient import HTTPClient
 
+#: Conversation types cached in :attr:`ConnectionState.channels`.
+CHANNEL_TYPES = "public_channel,private_channel"
+
 # noinspection PyBroadException
 try:
     Parsers = TypeVar("Parsers", bound=dict[str, Callable[[Optional[dict[str, Any]]], None]])
@@ -91,6 +97,375 @@ class ReactionEvent:
         self.message_timestamp: datetime.datetime | None = ts2time(event.get("event_ts", 0))
 
 
+class MemberLoader:
+    """Loads members missing from ``state.members`` on demand.
+
+    Misses are coalesced: concurrent misses of the same ID share one ``users.info`` request,
+    and misses that arrive within ``window`` seconds are requested side by side. Slack has no
+    bulk lookup by ID, so every distinct ID still costs one request. IDs that returned no member,
+    e.g. ``user_not_found``, are answered with ``None`` for ``negative_ttl`` seconds without a request.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    state: :class:`ConnectionState`
+        State whose ``members`` are filled.
+
+    window: :class:`float`
+        Seconds misses are collected before they are requested.
+
+    max_pending: :class:`int`
+        Distinct IDs that trigger the requests before the window ends.
+
+    negative_ttl: :class:`float`
+        Seconds an ID that returned no member is not requested again. ``0`` disables it.
+
+    Attributes
+    ----------
+    requests: :class:`int`
+        ``users.info`` requests sent.
+    """
+
+    def __init__(
+            self,
+            state: ConnectionState,
+            window: float = 0.01,
+            max_pending: int = 100,
+            negative_ttl: float = 10.
+    ):
+        self.state = state
+        self.window = window
+        self.max_pending = max_pending
+        self.negative_ttl = negative_ttl
+        self.requests: int = 0
+        # Expiry of the IDs that returned no member, in insertion order, so the oldest expire first.
+        self._missing: dict[str, float] = {}
+        self._inflight: dict[str, asyncio.Future[Member | None]] = {}
+        self._pending: list[str] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    async def fetch(self, member_id: str) -> Member | None:
+        """Cached member, or the member fetched with ``users.info``.
+
+        Returns
+        -------
+        Optional[:class:`Member`]
+            ``None`` when Slack does not know the ID.
+        """
+        member = self.state.members.get(member_id)
+        if member is not None:
+            return member
+
+        expires_at = self._missing.get(member_id)
+        if expires_at is not None:
+            if expires_at > time.monotonic():
+                return None
+
+            del self._missing[member_id]
+
+        future = self._inflight.get(member_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._inflight[member_id] = loop.create_future()
+            self._pending.append(member_id)
+            if len(self._pending) >= self.max_pending:
+                self._flush()
+
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+
+        return await asyncio.shield(future)
+
+    async def fetch_many(self, member_ids: Iterable[str]) -> list[Member | None]:
+        return list(await asyncio.gather(*(self.fetch(member_id) for member_id in member_ids)))
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        member_ids, self._pending = self._pending, []
+        if member_ids:
+            asyncio.ensure_future(self._load(member_ids))
+
+    async def _load(self, member_ids: list[str]) -> None:
+        state = self.state
+        self.requests += len(member_ids)
+        responses = await asyncio.gather(*(
+            state.http.request(Route("GET", "users.info", state.http.bot_token), query={"user": member_id})
+            for member_id in member_ids
+        ), return_exceptions=True)
+        try:
+            for member_id, response in zip(member_ids, responses):
+                future = self._inflight.pop(member_id)
+                member: Member | None = None
+                if isinstance(response, BaseException):
+                    state.logger.warning("users.info of %s raise %s", member_id, response)
+
+                elif not isinstance(response, dict):
+                    # 5xx responses come back as ``None`` or as the text of an HTML page.
+                    state.logger.warning("users.info of %s returned no user: %r", member_id, response)
+
+                else:
+                    try:
+                        member = state.members[member_id] = Member(state=state, data=response["user"])
+
+                    except KeyError as e:
+                        state.logger.warning("member %s of unknown team %s", member_id, e)
+
+                    except Exception as e:
+                        state.logger.error("member %s could not be built: %s", member_id, e, exc_info=e)
+
+                if member is None:
+                    self._remember_missing(member_id)
+
+                future.set_result(member)
+
+        finally:
+            # Nobody may wait forever for a member, whatever went wrong above.
+            for member_id in member_ids:
+                future = self._inflight.pop(member_id, None)
+                if future is not None and not future.done():
+                    future.set_result(None)
+
+    def _remember_missing(self, member_id: str) -> None:
+        if self.negative_ttl <= 0:
+            return
+
+        now = time.monotonic()
+        missing = self._missing
+        missing.pop(member_id, None)
+        missing[member_id] = now + self.negative_ttl
+        while missing:
+            oldest, expires_at = next(iter(missing.items()))
+            if expires_at > now:
+                break
+
+            del missing[oldest]
+
+
+class MemberCache(dict):
+    """``state.members``: members by ID, also indexed by team.
+
+    .. versionadded:: 1.4.5
+
+    Attributes
+    ----------
+    by_team: Dict[Optional[:class:`str`], Dict[:class:`str`, :class:`Member`]]
+        Members of each team ID, by member ID.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.by_team: dict[str | None, dict[str, Member]] = {}
+
+    def __setitem__(self, member_id: str, member: Member) -> None:
+        self._unindex(member_id)
+        super().__setitem__(member_id, member)
+        team_id = member.team.id if member.team is not None else None
+        members = self.by_team.get(team_id)
+        if members is None:
+            members = self.by_team[team_id] = {}
+
+        members[member_id] = member
+
+    def __delitem__(self, member_id: str) -> None:
+        super().__delitem__(member_id)
+        self._unindex(member_id)
+
+    def pop(self, member_id: str, *default: Any) -> Member:
+        self._unindex(member_id)
+        return super().pop(member_id, *default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for member_id, member in dict(*args, **kwargs).items():
+            self[member_id] = member
+
+    def clear(self) -> None:
+        super().clear()
+        self.by_team.clear()
+
+    def _unindex(self, member_id: str) -> None:
+        # There are few teams, and the member may have moved to another one.
+        for members in self.by_team.values():
+            members.pop(member_id, None)
+
+
+class MembershipIndex:
+    """Which members are in which channels, without calling the API on every check.
+
+    A channel is seeded from ``conversations.members`` the first time it is asked about and
+    then kept current from ``member_joined_channel`` and ``member_left_channel``. Events that
+    arrive while a channel is being seeded are applied once its pages are read. Those events only
+    arrive for channels the bot is in, so only channels with :attr:`Channel.is_member` set are kept;
+    the members of other channels are requested on every use. Channels the bot leaves are forgotten,
+    and the whole index is cleared when the socket connection has a gap in which events may be lost.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    state: :class:`ConnectionState`
+
+    page_size: :class:`int`
+        Members requested per page of ``conversations.members``.
+
+    Attributes
+    ----------
+    channels: Dict[:class:`str`, Set[:class:`str`]]
+        Member IDs of every seeded channel.
+
+    members: Dict[:class:`str`, Set[:class:`str`]]
+        IDs of the seeded channels each member is in.
+
+    requests: :class:`int`
+        ``conversations.members`` pages requested.
+    """
+
+    def __init__(self, state: ConnectionState, page_size: int = 1000):
+        self.state = state
+        self.page_size = page_size
+        self.channels: dict[str, set[str]] = {}
+        self.members: dict[str, set[str]] = {}
+        self.requests: int = 0
+        self._seeding: dict[str, asyncio.Future[set[str]]] = {}
+        self._backlog: dict[str, list[tuple[bool, str]]] = {}
+        self._forgotten: set[str] = set()
+
+    def __contains__(self, channel_id: str) -> bool:
+        return channel_id in self.channels
+
+    def is_member(self, channel_id: str, member_id: str) -> bool | None:
+        """Whether a member is in a channel. ``None`` when the channel is not seeded yet."""
+        members = self.channels.get(channel_id)
+        return None if members is None else member_id in members
+
+    def channels_of(self, member_id: str) -> set[str]:
+        """IDs of the seeded channels a member is in."""
+        return set(self.members.get(member_id, ()))
+
+    async def fetch(self, channel_id: str) -> set[str]:
+        """Member IDs of a channel, seeded from ``conversations.members`` on first use.
+
+        Returns
+        -------
+        Set[:class:`str`]
+            The indexed set. Copy it before keeping it.
+        """
+        members = self.channels.get(channel_id)
+        if members is not None:
+            return members
+
+        channel = self.state.channels.get(channel_id)
+        if channel is None or not channel.is_member:
+            # No membership events arrive for it, an indexed set would go stale.
+            return await self._list(channel_id)
+
+        future = self._seeding.get(channel_id)
+        if future is None:
+            # Membership events are kept from now on, before the first page is requested.
+            self._backlog[channel_id] = []
+            future = self._seeding[channel_id] = asyncio.ensure_future(self._seed(channel_id))
+            future.add_done_callback(lambda _: self._seeding.pop(channel_id, None))
+
+        return await asyncio.shield(future)
+
+    async def _list(self, channel_id: str) -> set[str]:
+        state = self.state
+        member_ids: set[str] = set()
+        async for page in CursorIterator(
+                state.http,
+                Route("GET", "conversations.members", state.http.bot_token),
+                "members",
+                lambda member_id: member_id,
+                {"channel": channel_id},
+                page_size=self.page_size
+        ).pages():
+            self.requests += 1
+            # Shares the ID strings with the member cache and the other channels.
+            member_ids.update(map(sys.intern, page))
+
+        return member_ids
+
+    async def _seed(self, channel_id: str) -> set[str]:
+        try:
+            member_ids = await self._list(channel_id)
+
+        finally:
+            backlog = self._backlog.pop(channel_id)
+
+        for joined, member_id in backlog:
+            if joined:
+                member_ids.add(member_id)
+
+            else:
+                member_ids.discard(member_id)
+
+        if channel_id in self._forgotten:
+            # Forgotten while its pages were read: the list is stale already.
+            self._forgotten.discard(channel_id)
+            return member_ids
+
+        self.channels[channel_id] = member_ids
+        for member_id in member_ids:
+            self.members.setdefault(member_id, set()).add(channel_id)
+
+        return member_ids
+
+    def add(self, channel_id: str, member_id: str) -> None:
+        member_id = sys.intern(member_id)
+        if channel_id in self._backlog:
+            self._backlog[channel_id].append((True, member_id))
+
+        members = self.channels.get(channel_id)
+        if members is not None:
+            members.add(member_id)
+            self.members.setdefault(member_id, set()).add(channel_id)
+
+    def remove(self, channel_id: str, member_id: str) -> None:
+        if channel_id in self._backlog:
+            self._backlog[channel_id].append((False, member_id))
+
+        members = self.channels.get(channel_id)
+        if members is not None:
+            members.discard(member_id)
+            self._unlink(member_id, channel_id)
+
+    def forget(self, channel_id: str) -> None:
+        """Drop a channel from the index. It is seeded again on next use."""
+        if channel_id in self._backlog:
+            self._forgotten.add(channel_id)
+
+        for member_id in self.channels.pop(channel_id, ()):
+            self._unlink(member_id, channel_id)
+
+    def clear(self) -> None:
+        """Drop every channel, e.g. after events may have been missed. Channels are seeded again on next use."""
+        self._forgotten.update(self._backlog)
+        self.channels.clear()
+        self.members.clear()
+
+    def move(self, old_channel_id: str, new_channel_id: str) -> None:
+        """Keep the members of a channel whose ID changed."""
+        members = self.channels.pop(old_channel_id, None)
+        if members is None:
+            return
+
+        self.channels[new_channel_id] = members
+        for member_id in members:
+            channels = self.members[member_id]
+            channels.discard(old_channel_id)
+            channels.add(new_channel_id)
+
+    def _unlink(self, member_id: str, channel_id: str) -> None:
+        channels = self.members.get(member_id)
+        if channels is not None:
+            channels.discard(channel_id)
+            if not channels:
+                del self.members[member_id]
+
+
 # noinspection PyUnusedLocal
 class ConnectionState:
     # noinspection PyUnusedLocal
@@ -112,8 +487,18 @@ class ConnectionState:
         self.parsers = parsers = {}
         self.teams: dict[str, Team] = {}
         self.channels: dict[str, Channel] = {}
-        self.members: dict[str, Member] = {}
+        self.members: MemberCache = MemberCache()
         self.logger = logger
+        self.bootstrap_page_size: int = kwargs.get("bootstrap_page_size", 1000)
+        self.bootstrap_progress: Callable[[str, dict[str, Any]], None] | None = kwargs.get("bootstrap_progress")
+        self.bootstrap_stats: dict[str, dict[str, Any]] = {}
+        self.member_cache: str = kwargs.get("member_cache", "eager")
+        self.member_loader: MemberLoader = MemberLoader(
+            self, window=kwargs.get("member_fetch_window", 0.01), negative_ttl=kwargs.get("member_miss_ttl", 10.)
+        )
+        self.membership: MembershipIndex = MembershipIndex(self, page_size=self.bootstrap_page_size)
+        # IDs changed by events while reconcile is listing, its pages may be older than them.
+        self._touched: set[str] | None = None
         for attr, func in inspect.getmembers(self):
             if attr.startswith("parse_"):
                 parsers[attr[6:]] = func
@@ -123,69 +508,358 @@ class ConnectionState:
         dict[str, Channel],
         dict[str, Member]
     ]:
-        # Request installed team ids.
-        teams: dict[str, Any] = await self.http.request(
-            Route("GET", "auth.teams.list", self.http.bot_token)
+        """Load teams, channels and members.
+
+        The three phases run concurrently under the rate limits: once the team IDs are known,
+        team info, channels and members of every team are requested side by side. Objects are built once the
+        objects they refer to exist. The first error cancels the other phases and is raised.
+        Items and timing of each phase are kept in :attr:`bootstrap_stats`.
+
+        .. versionchanged:: 1.4.5
+            Phases run concurrently and every list is paginated.
+
+        Returns
+        -------
+        Tuple[Dict[:class:`str`, :class:`Team`], Dict[:class:`str`, :class:`Channel`], Dict[:class:`str`, :class:`Member`]]
+        """
+        started = time.perf_counter()
+        self.bootstrap_stats = {}
+        team_ids: list[str] = []
+        team_ids_ready = asyncio.Event()
+        teams_ready = asyncio.Event()
+        members_ready = asyncio.Event()
+
+        async def load_teams() -> None:
+            # Request installed team ids.
+            teams: dict[str, Any] = await self.http.request(
+                Route("GET", "auth.teams.list", self.http.bot_token)
+            )
+            team_ids.extend(team["id"] for team in teams["teams"])
+            team_ids_ready.set()
+
+            # Request team data.
+            _teams = await asyncio.gather(*(
+                self.http.request(Route("GET", "team.info", self.http.bot_token), query={"team": team_id})
+                for team_id in team_ids
+            ))
+            # Serialize Team class.
+            for team in _teams:
+                self.teams[team["team"]["id"]] = Team(self, team["team"])
+
+            self._progress("teams", len(self.teams), 1 + len(_teams), started)
+            teams_ready.set()
+
+        async def load_channels() -> None:
+            await team_ids_ready.wait()
+            raw: list[dict[str, Any]] = []
+            pages = 0
+
+            async def list_team(team_id: str) -> None:
+                nonlocal pages
+                # Request channel data from team id.
+                async for page in CursorIterator(
+                        self.http,
+                        Route("GET", "conversations.list", self.http.bot_token),
+                        "channels",
+                        lambda ch: ch,
+                        {"team": team_id, "types": CHANNEL_TYPES},
+                        page_size=self.bootstrap_page_size
+                ).pages():
+                    raw.extend(page)
+                    pages += 1
+                    self._progress("channels", len(raw), pages)
+
+            await asyncio.gather(*(list_team(team_id) for team_id in team_ids))
+            # Creators of channels are members.
+            await members_ready.wait()
+            # Selialize Channel class.
+            for ch in raw:
+                self.channels[ch["id"]] = Channel(self, ch)
+
+            self._progress("channels", len(self.channels), pages, started)
+
+        async def load_members() -> None:
+            if self.member_cache == "lazy":
+                members_ready.set()
+                return
+
+            pending: list[dict[str, Any]] = []
+            pages = 0
+
+            async def list_team(team_id: str | None) -> None:
+                nonlocal pending, pages
+                # Request member data page by page and serialize Member class once teams are known.
+                async for page in CursorIterator(
+                        self.http,
+                        Route("GET", "users.list", self.http.bot_token),
+                        "members",
+                        lambda m: m,
+                        {"team_id": team_id} if team_id else None,
+                        page_size=self.bootstrap_page_size,
+                        prefetch=True
+                ).pages():
+                    pending.extend(page)
+                    pages += 1
+                    if teams_ready.is_set():
+                        self._add_members(pending)
+                        pending = []
+
+                    self._progress("members", len(self.members) + len(pending), pages)
+
+            # Rate limits are per team, so the teams are paged side by side.
+            await team_ids_ready.wait()
+            await asyncio.gather(*(list_team(team_id) for team_id in team_ids or [None]))
+            await teams_ready.wait()
+            self._add_members(pending)
+            self._progress("members", len(self.members), pages, started)
+            members_ready.set()
+
+        tasks = [
+            asyncio.create_task(load_teams(), name="bootstrap: teams"),
+            asyncio.create_task(load_channels(), name="bootstrap: channels"),
+            asyncio.create_task(load_members(), name="bootstrap: members"),
+        ]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        self._progress(
+            "total",
+            len(self.teams) + len(self.channels) + len(self.members),
+            sum(stats["pages"] for stats in self.bootstrap_stats.values()),
+            started
         )
-        await asyncio.sleep(0.5)
-
-        # Request team data.
-        team_tasks = []
-        for team in teams["teams"]:
-            team_id = team["id"]
-            team_tasks.append(
-                asyncio.ensure_future(
-                    self.http.request(
-                        Route("GET", "team.info", self.http.bot_token),
-                        data={"team": team_id}
+        return self.teams, self.channels, self.members
+
+    async def reconcile(self) -> dict[str, int]:
+        """Bring caches loaded from a :class:`StateSnapshot` up to date with Slack.
+
+        Teams and channels whose data differs are updated in place. Members are updated only when
+        their ``updated`` timestamp is newer than :attr:`Member.updated_at`. New objects are added and
+        objects Slack no longer lists are removed. Objects changed by events while the lists are paged are
+        left as the events made them. Members are not listed in ``lazy`` member cache mode.
+
+        .. versionadded:: 1.4.5
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`int`]
+            Number of ``teams``, ``channels`` and ``members`` added, changed or removed.
+        """
+        started = time.perf_counter()
+        self._touched = touched = set()
+        try:
+            return await self._reconcile(touched, started)
+
+        finally:
+            self._touched = None
+
+    async def _reconcile(self, touched: set[str], started: float) -> dict[str, int]:
+        teams: dict[str, Any] = await self.http.request(Route("GET", "auth.teams.list", self.http.bot_token))
+        team_ids: list[str] = [team["id"] for team in teams["teams"]]
+
+        async def list_all(method: str, key: str, param: str, **query: Any) -> list[dict[str, Any]]:
+            async def list_team(team_id: str) -> list[dict[str, Any]]:
+                return [
+                    item async for item in CursorIterator(
+                        self.http,
+                        Route("GET", method, self.http.bot_token),
+                        key,
+                        lambda item: item,
+                        {param: team_id, **query},
+                        page_size=self.bootstrap_page_size,
+                        prefetch=True
                     )
-                )
-            )
-        _teams = await asyncio.gather(*team_tasks, return_exceptions=True)
+                ]
+
+            pages = await asyncio.gather(*(list_team(team_id) for team_id in team_ids))
+            return [item for page in pages for item in page]
+
+        async def no_members() -> None:
+            return None
+
+        _teams, channels, members = await asyncio.gather(
+            asyncio.gather(*(
+                self.http.request(Route("GET", "team.info", self.http.bot_token), query={"team": team_id})
+                for team_id in team_ids
+            )),
+            list_all("conversations.list", "channels", "team", types=CHANNEL_TYPES),
+            list_all("users.list", "members", "team_id") if self.member_cache != "lazy" else no_members()
+        )
+        changed = {"teams": 0, "channels": 0, "members": 0}
 
-        # Serialize Team class.
         for team in _teams:
-            self.teams[team["team"]["id"]] = Team(self, team)
+            new = Team(self, team["team"])
+            if new.id in touched:
+                continue
 
-        await asyncio.sleep(0.5)
+            cached = self.teams.get(new.id)
+            if cached is None:
+                self.teams[new.id] = new
+                changed["teams"] += 1
 
-        # Request channel data from team id.
-        channel_tasks = []
-        for team in teams["teams"]:
-            team_id = team["id"]
-            channel_tasks.append(
-                asyncio.ensure_future(
-                    self.http.request(
-                        Route("GET", "conversations.list", self.http.bot_token),
-                        data={"team": team_id}
-                    )
-                )
-            )
-        _channels = await asyncio.gather(*channel_tasks, return_exceptions=True)
-        # Selialize Channel class.
-        for chs in _channels:
-            for ch in chs["channels"]:
-                self.channels[ch["id"]] = Channel(self, ch)
+            elif cached.to_dict() != new.to_dict():
+                cached._update(team["team"])
+                changed["teams"] += 1
+
+        changed["teams"] += self._drop_missing(self.teams, {team["team"]["id"] for team in _teams} | touched)
+
+        if members is not None:
+            for data in members:
+                if data["id"] in touched:
+                    continue
 
-        await asyncio.sleep(0.5)
+                cached = self.members.get(data["id"])
+                if cached is None:
+                    self.members[data["id"]] = Member(state=self, data=data)
+                    changed["members"] += 1
 
-        while True:
-            try:
-                # Request member data.
-                members: dict[str, Any] = await self.http.request(
-                    Route("GET", "users.list", self.http.bot_token)
-                )
-                # Serialize Member class.
-                for member in members["members"]:
-                    self.members[member["id"]] = Member(state=self, data=member)
+                elif float(data.get("updated", 0)) > cached.updated_at.timestamp():
+                    cached._update(data)
+                    self.members[cached.id] = cached
+                    changed["members"] += 1
 
-            except (AttributeError, TypeError):
+            changed["members"] += self._drop_missing(self.members, {data["id"] for data in members} | touched)
+
+        # Channels are compared once the teams and members they refer to are up to date.
+        for data in channels:
+            if data["id"] in touched:
                 continue
 
-            else:
-                break
+            new = Channel(self, data)
+            cached = self.channels.get(new.id)
+            if cached is None:
+                self.channels[new.id] = new
+                changed["channels"] += 1
 
-        return self.teams, self.channels, self.members
+            elif cached.to_dict() != new.to_dict():
+                cached._update(data)
+                changed["channels"] += 1
+
+        changed["channels"] += self._drop_missing(self.channels, {data["id"] for data in channels} | touched)
+
+        self._progress("reconcile", sum(changed.values()), len(team_ids), started)
+        return changed
+
+    def _touch(self, *ids: str) -> None:
+        if self._touched is not None:
+            self._touched.update(ids)
+
+    @staticmethod
+    def _drop_missing(cache: dict[str, Any], ids: set[str]) -> int:
+        missing = [key for key in cache if key not in ids]
+        for key in missing:
+            del cache[key]
+
+        return len(missing)
+
+    def missing_members(self, payload: dict[str, Any]) -> set[str]:
+        """IDs of members an event refers to that are not in :attr:`members`.
+
+        .. versionadded:: 1.4.5
+
+        Parameters
+        ----------
+        payload: Dict[:class:`str`, Any]
+            Payload of an envelope.
+
+        Returns
+        -------
+        Set[:class:`str`]
+        """
+        ids: set[str] = set()
+        event: dict[str, Any] = payload.get("event") or {}
+        for data in (event, event.get("message"), event.get("previous_message")):
+            if not isinstance(data, dict):
+                continue
+
+            for key in ("user", "inviter", "item_user", "user_id"):
+                value = data.get(key)
+                if isinstance(value, str):
+                    ids.add(value)
+
+                elif isinstance(value, dict) and value.get("id"):
+                    ids.add(value["id"])
+
+            edited = data.get("edited")
+            if isinstance(edited, dict) and edited.get("user"):
+                ids.add(edited["user"])
+
+            for reaction in data.get("reactions") or ():
+                ids.update(reaction.get("users") or ())
+
+        user = payload.get("user")
+        if isinstance(user, dict) and user.get("id"):
+            ids.add(user["id"])
+
+        elif payload.get("user_id"):
+            ids.add(payload["user_id"])
+
+        members = self.members
+        return {member_id for member_id in ids if member_id not in members}
+
+    async def fetch_member(self, member_id: str) -> Member | None:
+        """Cached member, or the member fetched through :attr:`member_loader`.
+
+        .. versionadded:: 1.4.5
+
+        Returns
+        -------
+        Optional[:class:`Member`]
+        """
+        return await self.member_loader.fetch(member_id)
+
+    async def fetch_members(self, member_ids: Iterable[str]) -> list[Member | None]:
+        """:meth:`fetch_member` for several IDs at once.
+
+        .. versionadded:: 1.4.5
+
+        Returns
+        -------
+        List[Optional[:class:`Member`]]
+        """
+        return await self.member_loader.fetch_many(member_ids)
+
+    def _add_members(self, members: list[dict[str, Any]]) -> None:
+        for member in members:
+            self.members[member["id"]] = Member(state=self, data=member)
+
+    def _progress(self, phase: str, items: int, pages: int, started: float | None = None) -> None:
+        """Record the progress of a bootstrap phase. ``started`` marks the phase as done."""
+        stats = self.bootstrap_stats.setdefault(phase, {"items": 0, "pages": 0, "elapsed": None})
+        stats["items"] = items
+        stats["pages"] = pages
+        if started is not None:
+            stats["elapsed"] = time.perf_counter() - started
+            self.logger.info(
+                "bootstrap %s: %d items in %d pages, %.2fs", phase, items, pages, stats["elapsed"]
+            )
+
+        else:
+            self.logger.debug("bootstrap %s: %d items in %d pages", phase, items, pages)
+
+        if self.bootstrap_progress is not None:
+            self.bootstrap_progress(phase, dict(stats))
+
+    def invalidate_cache(self, endpoint: str, **params: Any) -> None:
+        """Drop cached responses of ``endpoint`` that an event made stale.
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            Endpoint name like ``conversations.info``.
+
+        params
+            Request parameters the responses must match.
+        """
+        if self.http.cache is not None:
+            self.http.cache.invalidate(endpoint, **params)
 
     # noinspection PyUnusedLocal
     def parse_hello(self, *args, **kwargs):
@@ -217,6 +891,7 @@ class ConnectionState:
         event = payload['event']
         ch_data = event['channel']
         channel = Channel(state=self, data=ch_data)
+        self._touch(channel.id)
         self.all_events.add("on_channel_create")
         self.channels[channel.id] = channel
         self.dispatch("channel_create", channel)
@@ -232,7 +907,10 @@ class ConnectionState:
         """
         event = payload['event']
         channel = DeletedChannel(state=self, data=event)
-        del self.channels[channel.channel_id]
+        self.channels.pop(channel.channel_id, None)
+        self._touch(channel.channel_id)
+        self.membership.forget(channel.channel_id)
+        self.invalidate_cache("conversations.info", channel=channel.channel_id)
         self.all_events.add("on_channel_delete")
         self.dispatch("channel_delete", channel)
 
@@ -274,6 +952,9 @@ class ConnectionState:
 
         """
         event = payload['event']
+        self._upsert_channel(dict(event["channel"], is_member=True))
+        # Membership events of the channel were not received while the bot was out of it.
+        self.membership.forget(event["channel"]["id"])
         message = JoinMessage(state=self, data=event)
         self.all_events.add("on_channel_join")
         self.dispatch("channel_join", message)
@@ -285,7 +966,10 @@ class ConnectionState:
         self.dispatch("mention", message)
 
     def parse_channel_archive(self, payload: dict[str, Any]) -> None:
-        """This function takes a payload (a dictionary) and returns a message (an object)
+        """Mark the cached channel as archived and dispatch it with the member who archived it.
+
+        .. versionchanged:: 1.4.5
+            A channel missing from the cache is added from the event.
 
         Parameters
         ----------
@@ -293,15 +977,123 @@ class ConnectionState:
             The payload of the event.
 
         """
-        # event = payload['event']
-        # message = ArchivedMessage(state=self, data=event)
-        # self.all_events.add("on_channel_archive")
-        # self.dispatch("channel_archive", message)
-        ...
+        event = payload['event']
+        channel = self._upsert_channel({"id": event["channel"], "is_archived": True})
+        self.all_events.add("on_channel_archive")
+        self.dispatch("channel_archive", channel, self.members.get(event.get("user", "")))
+
+    def parse_channel_left(self, payload: dict[str, Any]) -> None:
+        """The bot left a channel. The channel stays cached with :attr:`Channel.is_member` unset.
+
+        .. versionadded:: 1.4.5
+        """
+        event = payload['event']
+        channel = self.channels.get(event["channel"])
+        if channel is not None:
+            channel.is_member = False
+
+        self._touch(event["channel"])
+        self.membership.forget(event["channel"])
+        self.invalidate_cache("conversations.info", channel=event["channel"])
+        self.all_events.add("on_channel_left")
+        self.dispatch("channel_left", channel)
+
+    def parse_channel_id_changed(self, payload: dict[str, Any]) -> None:
+        """A channel got a new ID, e.g. when it was shared. The cached channel is moved to it.
+
+        .. versionadded:: 1.4.5
+        """
+        event = payload['event']
+        channel = self.channels.pop(event["old_channel_id"], None)
+        if channel is not None:
+            channel.id = event["new_channel_id"]
+            self.channels[channel.id] = channel
+
+        self.membership.move(event["old_channel_id"], event["new_channel_id"])
+        self._touch(event["old_channel_id"], event["new_channel_id"])
+        self.invalidate_cache("conversations.info", channel=event["old_channel_id"])
+        self.all_events.add("on_channel_id_change")
+        self.dispatch("channel_id_change", event["old_channel_id"], channel)
 
     def parse_team_rename(self, payload: dict[str, Any]) -> None:
-        # event = payload['event']
+        """Rename the cached team and dispatch it before and after the change.
+
+        .. versionchanged:: 1.4.5
+            The cached team is renamed.
+        """
+        event = payload['event']
+        team = self.teams.get(event.get("team_id") or payload.get("team_id", ""))
+        before = copy.copy(team)
+        if team is not None:
+            team.name = event["name"]
+            self._touch(team.id)
+
+        self.invalidate_cache("team.info")
         self.all_events.add("on_team_rename")
+        self.dispatch("team_rename", before, team)
+
+    def parse_team_domain_change(self, payload: dict[str, Any]) -> None:
+        """.. versionadded:: 1.4.5"""
+        event = payload['event']
+        team = self.teams.get(event.get("team_id") or payload.get("team_id", ""))
+        before = copy.copy(team)
+        if team is not None:
+            team.url = event.get("url", team.url)
+            team.domain = event.get("domain", team.domain)
+            self._touch(team.id)
+
+        self.invalidate_cache("team.info")
+        self.all_events.add("on_team_domain_change")
+        self.dispatch("team_domain_change", before, team)
+
+    def parse_team_join(self, payload: dict[str, Any]) -> None:
+        """A member joined a team. The member is added to the cache.
+
+        .. versionadded:: 1.4.5
+        """
+        member = self._upsert_member(payload['event']["user"])
+        self.all_events.add("on_team_join")
+        self.dispatch("team_join", member)
+
+    def parse_user_change(self, payload: dict[str, Any]) -> None:
+        """Update the cached member in place and dispatch it before and after the change.
+        Also handles ``user_profile_changed``.
+
+        .. versionadded:: 1.4.5
+        """
+        data = payload['event']["user"]
+        before = copy.copy(self.members.get(data["id"]))
+        member = self._upsert_member(data)
+        self.all_events.add("on_member_update")
+        self.dispatch("member_update", before, member)
+
+    parse_user_profile_changed = parse_user_change
+
+    def _upsert_member(self, data: dict[str, Any]) -> Member:
+        member = self.members.get(data["id"])
+        if member is None:
+            member = self.members[data["id"]] = Member(state=self, data=data)
+
+        else:
+            member._update(data)
+            # Reindexed in case the member moved to another team.
+            self.members[member.id] = member
+
+        self._touch(member.id)
+        self.invalidate_cache("users.info", user=member.id)
+        return member
+
+    def _upsert_channel(self, data: dict[str, Any]) -> Channel:
+        channel = self.channels.get(data["id"])
+        if channel is None:
+            channel = self.channels[data["id"]] = Channel(self, data)
+
+        else:
+            channel._update(dict(channel.to_dict(), **data))
+
+        self._touch(channel.id)
+        self.invalidate_cache("conversations.info", channel=channel.id)
+        return channel
 
     def parse_message_changed(self, payload: dict[str, Any]) -> None:
         """It takes a dictionary of data, and returns a message object
@@ -319,33 +1111,60 @@ class ConnectionState:
         self.dispatch("message_update", before_message, after_message)
 
     def parse_channel_rename(self, payload: dict[str, Any]):
+        """Rename the cached channel and dispatch it before and after the change.
+
+        .. versionchanged:: 1.4.5
+            A channel missing from the cache is added from the event.
+        """
         event = payload["event"]
         channel_data = event["channel"]
-        channel = self.channels[channel_data["id"]]
-        _channel = channel
-        _channel.name = channel_data["name"]
+        before = copy.copy(self.channels.get(channel_data["id"]))
+        channel = self._upsert_channel(channel_data)
         self.all_events.add("on_channel_rename")
-        self.dispatch("channel_rename", channel, _channel)
+        self.dispatch("channel_rename", before, channel)
 
     def parse_channel_unarchive(self, payload: dict[str, Any]):
+        """Mark the cached channel as unarchived and dispatch it with the member who unarchived it.
+
+        .. versionchanged:: 1.4.5
+            A channel missing from the cache is added from the event and the member is ``None``
+            when not cached.
+        """
         event = payload["event"]
-        channel = self.channels[event["channel"]]
-        user = self.members[event["user"]]
+        channel = self._upsert_channel({"id": event["channel"], "is_archived": False})
+        user = self.members.get(event.get("user", ""))
         self.all_events.add("on_channel_unarchive")
         self.dispatch("channel_unarchive", channel, user)
 
     def parse_member_joined_channel(self, payload: dict[str, Any]):
+        """A member joined a channel. Dispatched with the channel, the member and the inviter.
+
+        .. versionchanged:: 1.4.5
+            A channel missing from the cache is added from the event. The member and
+            the inviter are ``None`` when not cached, the inviter also when the member
+            joined on their own.
+        """
         event = payload["event"]
-        channel = self.channels[event["channel"]]
-        user = self.members[event["user"]]
-        inviter = self.members[event["inviter"]]
+        self.membership.add(event["channel"], event["user"])
+        self.invalidate_cache("conversations.members", channel=event["channel"])
+        channel = self.channels.get(event["channel"]) or self._upsert_channel({"id": event["channel"]})
+        user = self.members.get(event["user"])
+        inviter = self.members.get(event.get("inviter", ""))
         self.all_events.add("on_member_join")
         self.dispatch("member_join", channel, user, inviter)
 
     def parse_member_left_channel(self, payload: dict[str, Any]):
+        """A member left a channel. Dispatched with the channel and the member.
+
+        .. versionchanged:: 1.4.5
+            A channel missing from the cache is added from the event and the member
+            is ``None`` when not cached.
+        """
         event = payload["event"]
-        user = self.members[event["user"]]
-        channel = self.channels[event["channel"]]
+        self.membership.remove(event["channel"], event["user"])
+        self.invalidate_cache("conversations.members", channel=event["channel"])
+        user = self.members.get(event["user"])
+        channel = self.channels.get(event["channel"]) or self._upsert_channel({"id": event["channel"]})
         self.all_events.add("on_member_left")
         self.dispatch("member_left", channel, user)
 
@@ -400,3 +1219,10 @@ class ConnectionState:
     def parse_thread_broadcast(self, payload: dict[str, Any]):
         event = payload.get("event", {})
         user = self.members.get(event.get("user", ""))
+
+    # Private channels send the same events under ``group_`` names.
+    parse_group_archive = parse_channel_archive
+    parse_group_unarchive = parse_channel_unarchive
+    parse_group_rename = parse_channel_rename
+    parse_group_left = parse_channel_left
+    parse_group_deleted = parse_channel_deleted
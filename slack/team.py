@@ -56,6 +56,22 @@ class Icon:
         self.image_230: str | None = data.get("image_230")
         self.image_132: str | None = data.get("image_132")
 
+    def to_dict(self) -> IconPayload:
+        """Payload this icon can be built from again.
+
+        .. versionadded:: 1.4.5
+        """
+        return {
+            "image_default": self.image_default,
+            "image_34": self.image_34,
+            "image_44": self.image_44,
+            "image_68": self.image_68,
+            "image_88": self.image_88,
+            "image_102": self.image_102,
+            "image_230": self.image_230,
+            "image_132": self.image_132,
+        }
+
 
 class Team:
     """This function takes in a TeamPayload object and sets the data attribute of the Team object
@@ -79,6 +95,10 @@ class Team:
 
     def __init__(self, state: ConnectionState, data: TeamPayload):
         self.__state = state
+        self._update(data)
+
+    def _update(self, data: TeamPayload) -> None:
+        state = self.__state
         self.id = data.get("id")
         self.name = data.get("name")
         self.url = data.get("url")
@@ -95,6 +115,20 @@ class Team:
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id} name={self.name}>"
 
+    def to_dict(self) -> TeamPayload:
+        """Payload this team can be built from again.
+
+        .. versionadded:: 1.4.5
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "url": self.url,
+            "domain": self.domain,
+            "email_domain": self.email_domain,
+            "icon": self.icon.to_dict(),
+        }
+
     async def create_channel(self, name: str, join: bool = True) -> Channel:
         """
         Create new channel.
@@ -131,13 +165,12 @@ class Team:
 
         ..versionadded:: 1.4.5
 
+        .. versionchanged:: 1.4.5
+            Read from the team index of the member cache instead of scanning every member.
+
         Returns
         -------
-        :class:`Team`
+        List[:class:`Member`]
             A list of all members in a team.
         """
-        members = []
-        for t, m in self.__state.members.items():
-            if self == m.team:
-                members.append(m)
-        return members
+        return list(self.__state.members.by_team.get(self.id, {}).values())
@@ -0,0 +1,771 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+
+from aiohttp import web, WSMsgType
+
+__all__ = (
+    "FakeSlackServer",
+)
+
+_logger = logging.getLogger(__name__)
+
+Handler = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+class FakeSlackServer:
+    """Local Web API and Socket Mode server for load and regression tests.
+
+    It implements the endpoints this library calls on synthetic teams, channels and members,
+    and pushes ``message`` envelopes to every connected socket at ``event_rate`` per second.
+    Latency, ``ratelimited`` answers and disconnects can be injected.
+
+    .. versionadded:: 1.4.5
+
+    Examples
+    --------
+    Examples ::
+
+        async with FakeSlackServer(members=10000, event_rate=500) as server:
+            client = Client(
+                "xoxp-test", "xoxb-test", "xapp-test",
+                base_url=server.base_url
+            )
+            # start() runs until the client is closed, so it runs in a task.
+            task = asyncio.create_task(client.start())
+            await asyncio.sleep(10)
+            await client.close()
+            await task
+
+    Parameters
+    ----------
+    host: :class:`str`
+        Address to listen on.
+
+    port: :class:`int`
+        Port to listen on. ``0`` picks a free port.
+
+    teams: :class:`int`
+        Number of synthetic teams.
+
+    channels: :class:`int`
+        Number of synthetic channels per team.
+
+    members: :class:`int`
+        Number of synthetic members, spread over the teams.
+
+    latency: :class:`float`
+        Seconds every Web API response is delayed.
+
+    ratelimit_rate: :class:`float`
+        Fraction of Web API requests answered with HTTP 429 ``ratelimited``.
+
+    retry_after: :class:`float`
+        ``Retry-After`` of those answers.
+
+    event_rate: :class:`float`
+        Envelopes pushed per second over all sockets. ``0`` pushes none.
+
+    disconnect_after: Optional[:class:`int`]
+        Envelopes pushed to a socket before it receives a ``disconnect`` envelope and is closed.
+
+    redeliver_after: Optional[:class:`float`]
+        Seconds after which an envelope that was not acknowledged is pushed again,
+        with ``retry_reason`` set to ``timeout`` like Slack does.
+
+    seed: Optional[:class:`int`]
+        Seed of the random generator.
+    """
+
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            *,
+            teams: int = 1,
+            channels: int = 10,
+            members: int = 100,
+            latency: float = 0.0,
+            ratelimit_rate: float = 0.0,
+            retry_after: float = 1.0,
+            event_rate: float = 0.0,
+            disconnect_after: int | None = None,
+            redeliver_after: float | None = None,
+            seed: int | None = None
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.ratelimit_rate = ratelimit_rate
+        self.retry_after = retry_after
+        self.event_rate = event_rate
+        self.disconnect_after = disconnect_after
+        self.redeliver_after = redeliver_after
+        self.random = random.Random(seed)
+
+        self.requests: dict[str, int] = {}
+        self.sent_envelopes: int = 0
+        self.acks: dict[str, float] = {}
+        self.invalid_acks: int = 0
+
+        self._runner: web.AppRunner | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._sockets: list[web.WebSocketResponse] = []
+        self._socket_counts: dict[web.WebSocketResponse, int] = {}
+        self._socket_cycle: itertools.cycle | None = None
+        self._pending: dict[str, tuple[dict[str, Any], float]] = {}
+        self._failures: dict[str, list[tuple[str, int]]] = {}
+        self._ts = itertools.count(1)
+
+        self.teams: list[dict[str, Any]] = [self._team(i) for i in range(teams)]
+        self.members: list[dict[str, Any]] = [self._member(i, self.teams[i % teams]["id"]) for i in range(members)]
+        self.channels: list[dict[str, Any]] = [
+            self._channel(t * channels + i, team["id"]) for t, team in enumerate(self.teams) for i in range(channels)
+        ]
+        self.channel_members: dict[str, list[str]] = {
+            ch["id"]: [m["id"] for m in self.members if m["team_id"] == ch["context_team_id"]] for ch in self.channels
+        }
+        self.messages: dict[str, list[dict[str, Any]]] = {ch["id"]: [] for ch in self.channels}
+        self.scheduled_messages: list[dict[str, Any]] = []
+        self.files: dict[str, dict[str, Any]] = {}
+        self.file_contents: dict[str, bytes] = {}
+        self.download_ranges: list[str | None] = []
+        self._interruptions: dict[str, int] = {}
+
+        self._handlers: dict[str, Handler] = {
+            "api.test": self._api_test,
+            "apps.connections.open": self._apps_connections_open,
+            "auth.teams.list": self._auth_teams_list,
+            "team.info": self._team_info,
+            "users.list": self._users_list,
+            "users.info": self._users_info,
+            "conversations.list": self._conversations_list,
+            "conversations.info": self._conversations_info,
+            "conversations.members": self._conversations_members,
+            "conversations.history": self._conversations_history,
+            "conversations.replies": self._conversations_replies,
+            "conversations.create": self._conversations_create,
+            "conversations.join": self._ok,
+            "conversations.leave": self._ok,
+            "conversations.kick": self._ok,
+            "conversations.archive": self._ok,
+            "conversations.rename": self._conversations_update,
+            "conversations.setTitle": self._conversations_update,
+            "conversations.setPurpose": self._conversations_update,
+            "conversations.setTopic": self._conversations_update,
+            "chat.postMessage": self._chat_post_message,
+            "chat.postEphemeral": self._chat_post_ephemeral,
+            "chat.update": self._chat_update,
+            "chat.delete": self._chat_delete,
+            "chat.getPermalink": self._chat_get_permalink,
+            "chat.scheduleMessage": self._chat_schedule_message,
+            "chat.scheduledMessages.list": self._chat_scheduled_messages_list,
+            "reactions.add": self._ok,
+            "reactions.remove": self._ok,
+            "reactions.get": self._reactions_get,
+            "reactions.list": self._reactions_list,
+            "files.getUploadURLExternal": self._files_get_upload_url,
+            "files.completeUploadExternal": self._files_complete_upload,
+            "files.list": self._files_list,
+            "files.info": self._files_info,
+        }
+
+    async def __aenter__(self) -> FakeSlackServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def base_url(self) -> str:
+        """Pass as ``base_url`` to :class:`Client`."""
+        return f"{self.url}/api/"
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://{self.host}:{self.port}/socket"
+
+    @property
+    def sockets(self) -> list[web.WebSocketResponse]:
+        """Open Socket Mode connections."""
+        return list(self._sockets)
+
+    async def start(self) -> None:
+        app = web.Application(client_max_size=1024 ** 3)
+        app.router.add_route("*", "/api/{method}", self._handle_api)
+        app.router.add_post("/upload/{file_id}", self._handle_upload)
+        app.router.add_get("/files/{file_id}", self._handle_download)
+        app.router.add_get("/socket", self._handle_socket)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        if self.event_rate > 0:
+            self._tasks.append(asyncio.create_task(self._push_events()))
+
+        if self.redeliver_after is not None:
+            self._tasks.append(asyncio.create_task(self._redeliver()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        for socket in list(self._sockets):
+            await socket.close()
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def fail_next(self, method: str, error: str, count: int = 1, *, status: int = 200) -> None:
+        """Answer the next ``count`` calls of ``method`` with ``{"ok": false, "error": error}``.
+
+        Parameters
+        ----------
+        method: :class:`str`
+        error: :class:`str`
+            With a ``status`` of ``500`` or more, the raw body of the response instead,
+            like the HTML page of a failing proxy. An empty body is sent as JSON ``null``.
+        count: :class:`int`
+        status: :class:`int`
+            HTTP status of the responses. ``429`` answers carry ``Retry-After`` like the ones of ``ratelimit_rate``.
+        """
+        self._failures.setdefault(method, []).extend([(error, status)] * count)
+
+    def interrupt_next_download(self, file_id: str, after: int) -> None:
+        """Close the connection of the next download of ``file_id`` once ``after`` bytes of it are sent.
+
+        Parameters
+        ----------
+        file_id: :class:`str`
+        after: :class:`int`
+        """
+        self._interruptions[file_id] = after
+
+    async def push(self, payload: dict[str, Any], envelope_type: str = "events_api") -> str:
+        """Push one envelope to the next socket.
+
+        Parameters
+        ----------
+        payload: Dict[:class:`str`, Any]
+            ``payload`` of the envelope.
+
+        envelope_type: :class:`str`
+            ``events_api``, ``interactive`` or ``slash_commands``.
+
+        Returns
+        -------
+        :class:`str`
+            ID of the envelope.
+        """
+        envelope = {
+            "envelope_id": str(uuid.uuid4()),
+            "type": envelope_type,
+            "accepts_response_payload": envelope_type != "events_api",
+            "retry_attempt": 0,
+            "retry_reason": "",
+            "payload": payload,
+        }
+        await self._send_envelope(envelope)
+        return envelope["envelope_id"]
+
+    async def disconnect(self, reason: str = "refresh_requested") -> None:
+        """Send a ``disconnect`` envelope to every socket and close them.
+
+        Parameters
+        ----------
+        reason: :class:`str`
+            ``refresh_requested``, ``link_disabled`` or ``warning``.
+        """
+        for socket in list(self._sockets):
+            await self._disconnect(socket, reason)
+
+    def message_event(self, channel: dict[str, Any] | None = None, text: str | None = None) -> dict[str, Any]:
+        """Build the payload of a ``message`` event from a random member in a random channel.
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+        """
+        channel = channel or self.random.choice(self.channels)
+        member_ids = self.channel_members[channel["id"]]
+        user = self.random.choice(member_ids) if member_ids else self.members[0]["id"]
+        ts = self._next_ts()
+        return {
+            "token": "fake",
+            "team_id": channel["context_team_id"],
+            "api_app_id": "A00000000",
+            "event": {
+                "type": "message",
+                "channel": channel["id"],
+                "user": user,
+                "text": text if text is not None else f"message {ts}",
+                "ts": ts,
+                "team": channel["context_team_id"],
+                "event_ts": ts,
+                "channel_type": "channel",
+            },
+            "type": "event_callback",
+            "event_id": f"Ev{uuid.uuid4().hex[:10].upper()}",
+            "event_time": int(time.time()),
+        }
+
+    # Synthetic data.
+
+    @staticmethod
+    def _team(i: int) -> dict[str, Any]:
+        return {
+            "id": f"T{i:08d}",
+            "name": f"team-{i}",
+            "url": f"https://team-{i}.slack.com/",
+            "domain": f"team-{i}",
+            "email_domain": "",
+            "icon": {"image_default": True},
+        }
+
+    @staticmethod
+    def _member(i: int, team_id: str) -> dict[str, Any]:
+        return {
+            "id": f"U{i:08d}",
+            "team_id": team_id,
+            "name": f"user{i}",
+            "deleted": False,
+            "color": "9f69e7",
+            "real_name": f"User {i}",
+            "tz": "Asia/Tokyo",
+            "tz_label": "Japan Standard Time",
+            "tz_offset": 32400,
+            "profile": {
+                "real_name": f"User {i}",
+                "display_name": f"user{i}",
+                "avatar_hash": f"{i:012x}",
+                "image_24": f"https://avatars.example.com/{i}_24.png",
+                "image_32": f"https://avatars.example.com/{i}_32.png",
+                "image_48": f"https://avatars.example.com/{i}_48.png",
+                "image_72": f"https://avatars.example.com/{i}_72.png",
+                "image_192": f"https://avatars.example.com/{i}_192.png",
+                "image_512": f"https://avatars.example.com/{i}_512.png",
+                "team": team_id,
+            },
+            "is_admin": False,
+            "is_owner": False,
+            "is_bot": False,
+            "is_app_user": False,
+            "updated": 1600000000,
+        }
+
+    @staticmethod
+    def _channel(i: int, team_id: str) -> dict[str, Any]:
+        return {
+            "id": f"C{i:08d}",
+            "name": f"channel-{i}",
+            "is_channel": True,
+            "is_member": True,
+            "created": 1600000000,
+            "creator": "U00000000",
+            "context_team_id": team_id,
+        }
+
+    def _next_ts(self) -> str:
+        return f"{time.time():.0f}.{next(self._ts):06d}"
+
+    def _find(self, items: list[dict[str, Any]], _id: str | None) -> dict[str, Any] | None:
+        return next((item for item in items if item["id"] == _id), None)
+
+    @staticmethod
+    def _page(items: list[Any], params: dict[str, Any], key: str, default_limit: int = 100) -> dict[str, Any]:
+        start = int(params.get("cursor") or 0)
+        limit = int(params.get("limit") or default_limit)
+        end = start + limit
+        return {
+            "ok": True,
+            key: items[start:end],
+            "response_metadata": {"next_cursor": str(end) if end < len(items) else ""},
+        }
+
+    # HTTP handlers.
+
+    async def _handle_api(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        self.requests[method] = self.requests.get(method, 0) + 1
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+
+        if self.ratelimit_rate > 0 and self.random.random() < self.ratelimit_rate:
+            return web.json_response(
+                {"ok": False, "error": "ratelimited"},
+                status=429,
+                headers={"Retry-After": str(self.retry_after)}
+            )
+
+        failures = self._failures.get(method)
+        if failures:
+            error, status = failures.pop(0)
+            if status >= 500:
+                if not error:
+                    return web.json_response(None, status=status)
+
+                return web.Response(status=status, text=error, content_type="text/html")
+
+            headers = {"Retry-After": str(self.retry_after)} if status == 429 else None
+            return web.json_response({"ok": False, "error": error}, status=status, headers=headers)
+
+        if method != "api.test" and "Authorization" not in request.headers:
+            return web.json_response({"ok": False, "error": "not_authed"})
+
+        handler = self._handlers.get(method)
+        if handler is None:
+            return web.json_response({"ok": False, "error": "unknown_method"})
+
+        params: dict[str, Any] = dict(request.query)
+        if request.body_exists:
+            params.update(await request.post())
+
+        return web.json_response(await handler(params))
+
+    async def _handle_upload(self, request: web.Request) -> web.Response:
+        file_id = request.match_info["file_id"]
+        if file_id not in self.files:
+            return web.Response(status=404)
+
+        self.file_contents[file_id] = await request.read()
+        return web.Response(text=f"OK - {len(self.file_contents[file_id])}")
+
+    async def _handle_download(self, request: web.Request) -> web.Response:
+        content = self.file_contents.get(request.match_info["file_id"])
+        if content is None:
+            return web.Response(status=404)
+
+        if "Authorization" not in request.headers:
+            return web.Response(status=403)
+
+        range_header = request.headers.get("Range", "")
+        self.download_ranges.append(range_header or None)
+        status = 200
+        if range_header.startswith("bytes="):
+            content = content[int(range_header[6:].split("-")[0] or 0):]
+            status = 206
+
+        after = self._interruptions.pop(request.match_info["file_id"], None)
+        if after is None:
+            return web.Response(body=content, status=status)
+
+        response = web.StreamResponse(status=status, headers={"Content-Length": str(len(content))})
+        await response.prepare(request)
+        await response.write(content[:after])
+        request.transport.close()
+        return response
+
+    async def _ok(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {"ok": True}
+
+    async def _api_test(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {"ok": True, "args": params}
+
+    async def _apps_connections_open(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {"ok": True, "url": self.ws_url}
+
+    async def _auth_teams_list(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {"ok": True, "teams": [{"id": t["id"], "name": t["name"]} for t in self.teams]}
+
+    async def _team_info(self, params: dict[str, Any]) -> dict[str, Any]:
+        team = self._find(self.teams, params.get("team")) or self.teams[0]
+        return {"ok": True, "team": team}
+
+    async def _users_list(self, params: dict[str, Any]) -> dict[str, Any]:
+        members = self.members
+        if params.get("team_id"):
+            members = [m for m in members if m["team_id"] == params["team_id"]]
+        return self._page(members, params, "members", default_limit=1000)
+
+    async def _users_info(self, params: dict[str, Any]) -> dict[str, Any]:
+        member = self._find(self.members, params.get("user"))
+        if member is None:
+            return {"ok": False, "error": "user_not_found"}
+        return {"ok": True, "user": member}
+
+    async def _conversations_list(self, params: dict[str, Any]) -> dict[str, Any]:
+        channels = self.channels
+        if params.get("team") or params.get("team_id"):
+            team_id = params.get("team") or params.get("team_id")
+            channels = [c for c in channels if c["context_team_id"] == team_id]
+        types = (params.get("types") or "public_channel").split(",")
+        channels = [c for c in channels if ("private_channel" if c.get("is_private") else "public_channel") in types]
+        return self._page(channels, params, "channels")
+
+    async def _conversations_info(self, params: dict[str, Any]) -> dict[str, Any]:
+        channel = self._find(self.channels, params.get("channel"))
+        if channel is None:
+            return {"ok": False, "error": "channel_not_found"}
+        return {"ok": True, "channel": channel}
+
+    async def _conversations_members(self, params: dict[str, Any]) -> dict[str, Any]:
+        members = self.channel_members.get(params.get("channel", ""))
+        if members is None:
+            return {"ok": False, "error": "channel_not_found"}
+        return self._page(members, params, "members")
+
+    async def _conversations_history(self, params: dict[str, Any]) -> dict[str, Any]:
+        messages = self.messages.get(params.get("channel", ""))
+        if messages is None:
+            return {"ok": False, "error": "channel_not_found"}
+        return self._page(messages[::-1], params, "messages")
+
+    async def _conversations_replies(self, params: dict[str, Any]) -> dict[str, Any]:
+        messages = self.messages.get(params.get("channel", ""), [])
+        ts = params.get("ts")
+        return {"ok": True, "messages": [m for m in messages if ts in (m["ts"], m.get("thread_ts"))]}
+
+    async def _conversations_create(self, params: dict[str, Any]) -> dict[str, Any]:
+        channel = self._channel(len(self.channels), self.teams[0]["id"])
+        channel["name"] = params.get("name", channel["name"])
+        self.channels.append(channel)
+        self.channel_members[channel["id"]] = []
+        self.messages[channel["id"]] = []
+        return {"ok": True, "channel": channel}
+
+    async def _conversations_update(self, params: dict[str, Any]) -> dict[str, Any]:
+        channel = self._find(self.channels, params.get("channel"))
+        if channel is None:
+            return {"ok": False, "error": "channel_not_found"}
+        if "name" in params:
+            channel["name"] = params["name"]
+        return {"ok": True, "channel": channel}
+
+    async def _chat_post_message(self, params: dict[str, Any]) -> dict[str, Any]:
+        channel = params.get("channel", "")
+        message = {
+            "type": "message",
+            "user": "U00000000",
+            "text": params.get("text", ""),
+            "ts": self._next_ts(),
+            "team": self.teams[0]["id"],
+        }
+        if params.get("thread_ts"):
+            message["thread_ts"] = params["thread_ts"]
+        self.messages.setdefault(channel, []).append(message)
+        return {"ok": True, "channel": channel, "ts": message["ts"], "message": message}
+
+    async def _chat_post_ephemeral(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {"ok": True, "message_ts": self._next_ts()}
+
+    async def _chat_update(self, params: dict[str, Any]) -> dict[str, Any]:
+        for message in self.messages.get(params.get("channel", ""), []):
+            if message["ts"] == params.get("ts"):
+                message["text"] = params.get("text", "")
+                message["edited"] = {"user": "U00000000", "ts": self._next_ts()}
+                return {"ok": True, "channel": params["channel"], "ts": message["ts"], "message": message}
+        return {"ok": False, "error": "message_not_found"}
+
+    async def _chat_delete(self, params: dict[str, Any]) -> dict[str, Any]:
+        messages = self.messages.get(params.get("channel", ""), [])
+        self.messages[params.get("channel", "")] = [m for m in messages if m["ts"] != params.get("ts")]
+        return {"ok": True, "channel": params.get("channel"), "ts": params.get("ts")}
+
+    async def _chat_get_permalink(self, params: dict[str, Any]) -> dict[str, Any]:
+        ts = str(params.get("message_ts", "")).replace(".", "")
+        return {
+            "ok": True,
+            "channel": params.get("channel"),
+            "permalink": f"https://team-0.slack.com/archives/{params.get('channel')}/p{ts}",
+        }
+
+    async def _chat_schedule_message(self, params: dict[str, Any]) -> dict[str, Any]:
+        scheduled = {
+            "id": f"Q{len(self.scheduled_messages):08d}",
+            "channel_id": params.get("channel"),
+            "post_at": int(params.get("post_at", 0)),
+            "date_created": int(time.time()),
+            "text": params.get("text", ""),
+        }
+        self.scheduled_messages.append(scheduled)
+        return {
+            "ok": True,
+            "channel": params.get("channel"),
+            "scheduled_message_id": scheduled["id"],
+            "post_at": scheduled["post_at"],
+            "message": {"text": scheduled["text"], "user": "U00000000", "type": "message"},
+        }
+
+    async def _chat_scheduled_messages_list(self, params: dict[str, Any]) -> dict[str, Any]:
+        messages = [m for m in self.scheduled_messages if m["channel_id"] == params.get("channel")]
+        return self._page(messages, params, "scheduled_messages")
+
+    async def _reactions_get(self, params: dict[str, Any]) -> dict[str, Any]:
+        for message in self.messages.get(params.get("channel", ""), []):
+            if message["ts"] == params.get("timestamp"):
+                return {"ok": True, "type": "message", "message": message}
+        return {"ok": False, "error": "message_not_found"}
+
+    async def _reactions_list(self, params: dict[str, Any]) -> dict[str, Any]:
+        items = [
+            {"type": "message", "channel": channel, "message": message}
+            for channel, messages in self.messages.items() for message in messages if message.get("reactions")
+        ]
+        return self._page(items, params, "items")
+
+    async def _files_get_upload_url(self, params: dict[str, Any]) -> dict[str, Any]:
+        file_id = f"F{len(self.files):08d}"
+        self.files[file_id] = {
+            "id": file_id,
+            "name": params.get("filename"),
+            "title": params.get("filename"),
+            "size": int(params.get("length", 0)),
+            "created": int(time.time()),
+            "url_private": f"{self.url}/files/{file_id}",
+            "url_private_download": f"{self.url}/files/{file_id}",
+        }
+        return {"ok": True, "upload_url": f"{self.url}/upload/{file_id}", "file_id": file_id}
+
+    async def _files_complete_upload(self, params: dict[str, Any]) -> dict[str, Any]:
+        files = json.loads(params.get("files", "[]"))
+        for f in files:
+            if f["id"] not in self.file_contents:
+                return {"ok": False, "error": "file_not_found"}
+
+            self.files[f["id"]]["title"] = f.get("title", self.files[f["id"]]["title"])
+            if params.get("channel_id"):
+                self.files[f["id"]]["channels"] = [params["channel_id"]]
+        return {"ok": True, "files": [{"id": f["id"], "title": f.get("title")} for f in files]}
+
+    async def _files_list(self, params: dict[str, Any]) -> dict[str, Any]:
+        files = list(self.files.values())
+        if params.get("channel"):
+            files = [f for f in files if params["channel"] in f.get("channels", [])]
+        count = int(params.get("count") or 100)
+        page = int(params.get("page") or 1)
+        return {
+            "ok": True,
+            "files": files[(page - 1) * count:page * count],
+            "paging": {"count": count, "total": len(files), "page": page, "pages": max(1, -(-len(files) // count))},
+        }
+
+    async def _files_info(self, params: dict[str, Any]) -> dict[str, Any]:
+        file = self.files.get(params.get("file", ""))
+        if file is None:
+            return {"ok": False, "error": "file_not_found"}
+        return {"ok": True, "file": file}
+
+    # Socket Mode.
+
+    async def _handle_socket(self, request: web.Request) -> web.WebSocketResponse:
+        socket = web.WebSocketResponse()
+        await socket.prepare(request)
+        self._sockets.append(socket)
+        self._socket_counts[socket] = 0
+        self._socket_cycle = None
+        await socket.send_str(json.dumps({
+            "type": "hello",
+            "num_connections": len(self._sockets),
+            "debug_info": {"host": "fake", "approximate_connection_time": 18060},
+            "connection_info": {"app_id": "A00000000"},
+        }))
+        try:
+            async for msg in socket:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+
+                try:
+                    ack = json.loads(msg.data)
+
+                except ValueError:
+                    self.invalid_acks += 1
+                    continue
+
+                envelope_id = ack.get("envelope_id") if isinstance(ack, dict) else None
+                if envelope_id is None:
+                    self.invalid_acks += 1
+                    continue
+
+                self.acks[envelope_id] = time.monotonic()
+                self._pending.pop(envelope_id, None)
+
+        finally:
+            if socket in self._sockets:
+                self._sockets.remove(socket)
+            self._socket_counts.pop(socket, None)
+            self._socket_cycle = None
+
+        return socket
+
+    async def _disconnect(self, socket: web.WebSocketResponse, reason: str) -> None:
+        try:
+            await socket.send_str(json.dumps({
+                "type": "disconnect",
+                "reason": reason,
+                "debug_info": {"host": "fake"},
+            }))
+
+        finally:
+            if socket in self._sockets:
+                self._sockets.remove(socket)
+            self._socket_cycle = None
+            await socket.close()
+
+    def _next_socket(self) -> web.WebSocketResponse | None:
+        if not self._sockets:
+            return None
+
+        if self._socket_cycle is None:
+            self._socket_cycle = itertools.cycle(list(self._sockets))
+
+        return next(self._socket_cycle)
+
+    async def _send_envelope(self, envelope: dict[str, Any]) -> None:
+        socket = self._next_socket()
+        if socket is None or socket.closed:
+            return
+
+        self._pending[envelope["envelope_id"]] = (envelope, time.monotonic())
+        await socket.send_str(json.dumps(envelope))
+        self.sent_envelopes += 1
+        self._socket_counts[socket] = self._socket_counts.get(socket, 0) + 1
+        if self.disconnect_after is not None and self._socket_counts[socket] >= self.disconnect_after:
+            await self._disconnect(socket, "refresh_requested")
+
+    async def _push_events(self) -> None:
+        interval = 1 / self.event_rate
+        next_at = time.monotonic()
+        while True:
+            next_at += interval
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if self._sockets:
+                try:
+                    await self.push(self.message_event())
+
+                except ConnectionResetError:
+                    _logger.debug("socket closed while pushing")
+
+    async def _redeliver(self) -> None:
+        while True:
+            await asyncio.sleep(min(self.redeliver_after, 0.5))
+            now = time.monotonic()
+            for envelope_id, (envelope, sent_at) in list(self._pending.items()):
+                if now - sent_at < self.redeliver_after:
+                    continue
+
+                if envelope["retry_attempt"] >= 3:
+                    self._pending.pop(envelope_id, None)
+                    continue
+
+                envelope["retry_attempt"] += 1
+                envelope["retry_reason"] = "timeout"
+                await self._send_envelope(envelope)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import json
 import logging
 import os
 import sys
@@ -11,6 +12,18 @@ from typing import Any, TypeVar, Iterable, Generator, overload, Callable
 
 from .errors import *
 
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+
+except ImportError:
+    msgspec = None
+
 errors: dict[str, SlackExceptions] = {
     "invalid_auth": TokenTypeException("Some aspect of authentication cannot be validated."),
     "missing_args": ClientException("An app-level token wasn't provided."),
@@ -92,6 +105,109 @@ def parse_exception(event_name: str, **kwargs):
     raise exc
 
 
+class JSONCodec:
+    """Encoder and decoder of every JSON payload sent or received by the client.
+
+    This class uses the standard :mod:`json` module.
+
+    .. versionadded:: 1.4.5
+    """
+    name: str = "json"
+    decode_errors: tuple[type[Exception], ...] = (ValueError,)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name}>"
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """:class:`JSONCodec` backed by `orjson <https://github.com/ijl/orjson>`_.
+
+    .. versionadded:: 1.4.5
+    """
+    name = "orjson"
+
+    def loads(self, data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+
+class MsgspecCodec(JSONCodec):
+    """:class:`JSONCodec` backed by `msgspec <https://github.com/jcrist/msgspec>`_.
+
+    .. versionadded:: 1.4.5
+    """
+    name = "msgspec"
+
+    def __init__(self):
+        self.decode_errors = (ValueError, msgspec.DecodeError)
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: str | bytes) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode()
+
+
+def get_codec(codec: str | JSONCodec = "auto") -> JSONCodec:
+    """Return the JSON codec named ``codec``.
+
+    ``auto`` picks orjson, then msgspec, then the standard :mod:`json` module,
+    depending on which is installed.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    codec: Union[:class:`str`, :class:`JSONCodec`]
+        ``auto``, ``orjson``, ``msgspec``, ``json`` or a codec object.
+
+    Raises
+    ------
+    :class:`InvalidArgumentException`
+        Raise when the codec is unknown or its package is not installed.
+
+    Returns
+    -------
+    :class:`JSONCodec`
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    if codec == "auto":
+        if orjson is not None:
+            return OrjsonCodec()
+
+        if msgspec is not None:
+            return MsgspecCodec()
+
+        return JSONCodec()
+
+    if codec == "json":
+        return JSONCodec()
+
+    if codec == "orjson":
+        if orjson is None:
+            raise InvalidArgumentException("orjson is not installed.")
+        return OrjsonCodec()
+
+    if codec == "msgspec":
+        if msgspec is None:
+            raise InvalidArgumentException("msgspec is not installed.")
+        return MsgspecCodec()
+
+    raise InvalidArgumentException(f"Unknown JSON codec: {codec}")
+
+
 T = TypeVar("T")
 
 
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, TypeVar
+import random
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, TypeVar
 
 import aiohttp
 
+from .metrics import SocketMetrics
+from .utils import JSONCodec
+
 if TYPE_CHECKING:
     from .client import Client
+    from .recorder import EnvelopeRecorder
 
 _logger = logging.getLogger(__name__)
 Call = TypeVar("Call", bound=Callable[..., Coroutine[Any, Any, Any]])
+AckResponder = Callable[[dict[str, Any]], Optional[dict[str, Any]]]
 
 
 class SlackWebSocket:
@@ -36,12 +43,27 @@ class SlackWebSocket:
         self.logger: logging.Logger
 
         self.token: str | None
+        self.codec: JSONCodec = JSONCodec()
+        self.metrics: SocketMetrics = SocketMetrics()
+        self.ack_responders: dict[str, AckResponder] = {}
+
+        self.disconnect_reason: str | None = None
+        self.dedup: DedupIndex | None = None
+        self.recorder: EnvelopeRecorder | None = None
+        self._pong: asyncio.Future[bool] | None = None
+        # perf_counter value since which the reader waits for a frame, None while it handles one.
+        self._waiting_since: float | None = None
 
         self._dispatch = lambda *args: None
-        self._dispatch_listeners: list[Any] = []
 
     @classmethod
-    async def from_client(cls, client: Client, ws_url: str, logger: logging.Logger) -> SlackWebSocket:
+    async def from_client(
+            cls,
+            client: Client,
+            ws_url: str,
+            logger: logging.Logger,
+            dispatch_hello: bool = True
+    ) -> SlackWebSocket:
         """`from_client` is a class method that takes a `Client` object and a websocket URL and returns a
         `SlackWebSocket` object
 
@@ -54,104 +76,617 @@ class SlackWebSocket:
         ws_url
             The URL to connect to.
         logger : logging.Logger
+        dispatch_hello : bool
+            Dispatch ``ready`` on the ``hello`` envelope. Extra connections of a pool skip it.
+
+            .. versionadded:: 1.4.5
 
         Returns
         -------
             A SlackWebSocket object
 
         """
-        socket = await client.http.ws_connect(ws_url)
+        # Pongs are read by :meth:`receive` to measure the latency.
+        socket = await client.http.ws_connect(ws_url, autoping=False)
         ws: SlackWebSocket = cls(socket=socket, loop=client.loop)
         ws.token = client.http.token
+        ws.codec = client.http.codec
+        ws.metrics = client.socket_metrics
+        ws.ack_responders = client.ack_responders
+        ws.dedup = client.dedup
+        ws.recorder = client.recorder
         ws.logger = logger
 
         ws._slack_parsers = client.connection.parsers
-        await ws.poll_event()
+        hello = await ws.receive()
+        if hello is None:
+            raise ConnectionResetError("websocket is closed before hello.")
+
+        if dispatch_hello:
+            ws.dispatch_envelope(hello)
+
         return ws
 
+    async def receive(self) -> dict[str, Any] | None:
+        """Read one frame, decode it and acknowledge it.
+
+        The raw frame is written to :attr:`recorder` first, if there is one.
+
+        .. versionadded:: 1.4.5
+
+        Returns
+        -------
+        Optional[Dict[:class:`str`, Any]]
+            The envelope, or ``None`` when the socket is closed.
+        """
+        msg = await self._receive_frame()
+        while msg.type in (aiohttp.WSMsgType.PING, aiohttp.WSMsgType.PONG):
+            if msg.type == aiohttp.WSMsgType.PING:
+                await self.socket.pong(msg.data)
+
+            msg = await self._receive_frame()
+
+        if msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED,
+                        aiohttp.WSMsgType.ERROR):
+            return None
+
+        received_at = time.perf_counter()
+        if self.recorder is not None:
+            self.recorder.write(msg.data)
+
+        data = self.codec.loads(msg.data)
+        if data.get("type") == "disconnect":
+            self.disconnect_reason = data.get("reason")
+
+        elif data.get("type") != "hello":
+            await self.ack_envelope(data, received_at)
+
+        return data
+
+    async def _receive_frame(self) -> aiohttp.WSMessage:
+        self._waiting_since = time.perf_counter()
+        try:
+            msg: aiohttp.WSMessage = await self.socket.receive()
+
+        finally:
+            self._waiting_since = None
+
+        # Any frame shows the socket is alive. Only a pong measures the round trip.
+        if self._pong is not None and not self._pong.done():
+            self._pong.set_result(msg.type == aiohttp.WSMsgType.PONG)
+
+        return msg
+
+    async def heartbeat(self, interval: float = 10., timeout: float = 10.) -> None:
+        """Ping the socket every ``interval`` seconds and record the round trip in ``metrics.latency``.
+
+        A socket is stale when no frame is received within ``timeout`` seconds of a ping
+        while :meth:`receive` waits for one: it is closed, so :meth:`receive` returns ``None``
+        and the connection is replaced. Time the reader spends handling an envelope, e.g. waiting
+        for room in a full dispatcher queue, does not count, since frames are not read meanwhile.
+
+        .. versionchanged:: 1.4.5
+            Any frame counts as an answer and the check is paused while the reader is busy.
+
+        .. versionadded:: 1.4.5
+
+        Parameters
+        ----------
+        interval: :class:`float`
+            Seconds between pings.
+
+        timeout: :class:`float`
+            Seconds to wait for a pong.
+        """
+        while not self.socket.closed:
+            await asyncio.sleep(interval)
+            self._pong = pong = self.loop.create_future()
+            sent_at = time.perf_counter()
+            try:
+                await self.socket.ping()
+                wait = timeout
+                while True:
+                    try:
+                        await asyncio.wait_for(asyncio.shield(pong), wait)
+                        break
+
+                    except asyncio.TimeoutError:
+                        waiting_since = self._waiting_since
+                        waited = 0. if waiting_since is None else time.perf_counter() - waiting_since
+                        if waited >= timeout:
+                            raise
+
+                        # The reader has not waited for frames long enough, the answer may be queued unread.
+                        wait = timeout - waited
+
+            except (asyncio.TimeoutError, ConnectionResetError):
+                if self.socket.closed:
+                    return
+
+                _logger.warning("websocket did not answer a ping in %.1fs. closing as stale.", timeout)
+                self.metrics.stale += 1
+                await self.socket.close()
+                return
+
+            finally:
+                self._pong = None
+
+            if pong.result():
+                self.metrics.latency.record(time.perf_counter() - sent_at)
+
     async def poll_event(self) -> None:
         """It receives a message from the websocket, parses it, and then calls the appropriate function to handle the
         event
 
         """
-        try:
-            msg: aiohttp.WSMessage = await self.socket.receive()
-            await self.parse_event(msg.json())
+        data = await self.receive()
+        if data is None:
+            raise ConnectionResetError("websocket is closed.")
+
+        self.dispatch_envelope(data)
+
+    async def ack(self, envelope_id: str, payload: dict[str, Any] | None = None) -> None:
+        """Acknowledge an envelope.
+
+        .. versionadded:: 1.4.5
+
+        Parameters
+        ----------
+        envelope_id: :class:`str`
+            ID of the envelope.
+
+        payload: Optional[Dict[:class:`str`, Any]]
+            Response of slash commands and options requests.
+        """
+        data: dict[str, Any] = {"envelope_id": envelope_id}
+        if payload is not None:
+            data["payload"] = payload
+
+        await self.socket.send_str(self.codec.dumps(data))
+
+    async def ack_envelope(self, data: dict[str, Any], received_at: float | None = None) -> None:
+        """Acknowledge an envelope right after it is decoded, before it is parsed.
+
+        When :attr:`ack_responders` has a responder for the envelope type, its result is sent
+        as the response payload.
+
+        .. versionadded:: 1.4.5
+
+        Parameters
+        ----------
+        data: Dict[:class:`str`, Any]
+            Decoded envelope.
 
-        except Exception as e:
-            raise e
+        received_at: Optional[:class:`float`]
+            :func:`time.perf_counter` value when the frame was received.
+        """
+        self.metrics.envelopes += 1
+        envelope_id = data.get("envelope_id")
+        if envelope_id is None:
+            return
+
+        payload = None
+        responder = self.ack_responders.get(data.get("type", ""))
+        if responder is not None and data.get("accepts_response_payload"):
+            try:
+                payload = responder(data.get("payload", {}))
 
-    async def response_event(self, envelope_id: str, payload: dict[str, Any]):
-        await asyncio.sleep(0.5)
-        await self.socket.send_str(str({"envelope_id": envelope_id, "payload": json.dumps(payload)}))
+            except Exception as e:
+                _logger.error("ack responder of %s raise %s", data.get("type"), e, exc_info=e)
 
-    async def parse_event(self, data: dict[str, Any]) -> None:
-        """It takes a dictionary of data, and if the data is a hello event, it prints the data and sets the ready event.
+        await self.ack(envelope_id, payload)
+        self.metrics.acks += 1
+        if received_at is not None:
+            self.metrics.ack_latency.observe(time.perf_counter() - received_at)
 
-        If the data is not a hello event, it gets the payload and event from the data, and sets the event type to the
-        event subtype if the event is not None, and if the event type is None, it sets the event type to the event
-        type.
+    def is_duplicate(self, data: dict[str, Any]) -> bool:
+        """Whether the envelope or its event was already received, on this or another connection.
 
-        If the data retry reason is timeout, it returns.
+        .. versionadded:: 1.4.5
 
-        It then tries to get the function from the slack parsers' dictionary, and if it can't, it prints the payload
-        and the event type.
+        Parameters
+        ----------
+        data: Dict[:class:`str`, Any]
+            Decoded envelope.
 
-        If it can get the function, it prints the function name and calls the function with the payload.
+        Returns
+        -------
+        :class:`bool`
+        """
+        if self.dedup is None:
+            return False
+
+        return self.dedup.seen_envelope(data)
+
+    async def parse_event(self, data: dict[str, Any], received_at: float | None = None) -> None:
+        """It acknowledges the envelope and passes it to :meth:`dispatch_envelope`.
 
-        It then creates an empty list, and for each index and entry in the dispatch listeners, it gets the future
-        from the entry, and if the future is cancelled, it appends the index to the list
+        .. versionchanged:: 1.4.5
+            The envelope is acknowledged before it is parsed, and redelivered envelopes are
+            not parsed again.
 
         Parameters
         ----------
         data : Dict[str, Any]
             Dict[str, Any]
 
+        received_at : Optional[float]
+            :func:`time.perf_counter` value when the frame was received.
+
+        """
+        if data.get("type") != "hello":
+            await self.ack_envelope(data, received_at)
+
+        if not self.is_duplicate(data):
+            self.dispatch_envelope(data)
+
+    def dispatch_envelope(self, data: dict[str, Any]) -> None:
+        """It passes an envelope to :func:`dispatch_to_parsers`.
+
+        .. versionadded:: 1.4.5
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            Envelope that is already acknowledged.
+
+        """
+        dispatch_to_parsers(self._slack_parsers, data)
+
+
+def dispatch_to_parsers(parsers: dict[str, Callable[..., Any]], data: dict[str, Any]) -> bool:
+    """Call the parser of an envelope.
+
+    ``hello`` calls the ``hello`` parser, ``disconnect`` is ignored and other envelopes call
+    the parser named by :func:`envelope_event_type` with their payload.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    parsers: Dict[:class:`str`, Callable[..., Any]]
+        Usually ``ConnectionState.parsers``.
+
+    data: Dict[:class:`str`, Any]
+        Envelope.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether a parser was called.
+    """
+    envelope_type = data.get("type")
+    if envelope_type == "hello":
+        hello_func = parsers.get("hello")
+        if hello_func is None:
+            return False
+
+        hello_func()
+        return True
+
+    if envelope_type == "disconnect":
+        return False
+
+    event_type = envelope_event_type(data)
+    try:
+        event_func: Call = parsers[event_type]
+
+    except KeyError:
+        _logger.info("%s is not defined. (Undefined Event.)", event_type)
+        return False
+
+    event_func(data["payload"])
+    _logger.info(f"{event_type} function occuring.")
+    return True
+
+
+def envelope_event_type(data: dict[str, Any]) -> str | None:
+    """Name of the parser of an envelope: the event subtype, the event type or the payload type.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    data: Dict[:class:`str`, Any]
+        Envelope.
+
+    Returns
+    -------
+    Optional[:class:`str`]
+    """
+    payload: dict[str, Any] = data.get("payload") or {}
+    event: dict[str, Any] | None = payload.get("event")
+    if event is None:
+        return payload.get("type")
+
+    return event.get("subtype") or event.get("type")
+
+
+class DedupIndex:
+    """Time-windowed index of the ``envelope_id`` and ``event_id`` already received.
+
+    IDs are kept in arrival order and expire after ``window`` seconds or when more than
+    ``maxsize`` are stored, so memory is bounded and every lookup is O(1).
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    maxsize: :class:`int`
+        Maximum number of IDs.
+
+    window: :class:`float`
+        Seconds an ID is remembered.
+
+    metrics: Optional[:class:`SocketMetrics`]
+        Receives the count of suppressed duplicates.
+    """
+
+    __slots__ = ("maxsize", "window", "metrics", "_seen")
+
+    def __init__(self, maxsize: int = 10000, window: float = 600., metrics: SocketMetrics | None = None):
+        self.maxsize = maxsize
+        self.window = window
+        self.metrics: SocketMetrics = metrics or SocketMetrics()
+        self._seen: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def seen(self, key: str) -> bool:
+        """Remember ``key`` and tell whether it was already there.
+
+        Parameters
+        ----------
+        key: :class:`str`
+
         Returns
         -------
-            The future object is being returned.
+        :class:`bool`
+        """
+        now = time.monotonic()
+        seen = self._seen
+        expires_at = seen.get(key)
+        if expires_at is not None and expires_at > now:
+            return True
 
+        seen.pop(key, None)
+        seen[key] = now + self.window
+        while seen:
+            oldest, expires_at = next(iter(seen.items()))
+            if expires_at > now and len(seen) <= self.maxsize:
+                break
+
+            del seen[oldest]
+
+        return False
+
+    def seen_envelope(self, data: dict[str, Any]) -> bool:
+        """:meth:`seen` for the ``envelope_id`` and ``event_id`` of an envelope.
+
+        Duplicates are counted in ``metrics.duplicates``.
+
+        Parameters
+        ----------
+        data: Dict[:class:`str`, Any]
+
+        Returns
+        -------
+        :class:`bool`
         """
-        if data.get("type") == "hello":
-            try:
-                hello_func: Call = self._slack_parsers["hello"]
-
-            except KeyError:
-                pass
-
-            else:
-                hello_func()
-
-        else:
-            # if not data.get("ok") or data.get("ok") is None:
-            #     return
-            payload: dict[str, Any] = data["payload"]
-            event: dict[str, Any] | None = payload.get("event")
-            event_type: str | None = event.get("subtype") if event is not None else None
-            await self.response_event(data["envelope_id"], payload)
-            if event is None:
-                event_type = payload.get("type")
-
-            if (event_type is None) and (event is not None):
-                event_type = event.get("type")
-            if data.get("retry_reason") == "timeout":
-                return
+        duplicate = False
+        envelope_id = data.get("envelope_id")
+        if envelope_id is not None:
+            duplicate = self.seen(envelope_id)
 
-            try:
-                event_func: Call = self._slack_parsers[event_type]
+        event_id = (data.get("payload") or {}).get("event_id")
+        if event_id is not None:
+            duplicate = self.seen(event_id) or duplicate
+
+        if duplicate:
+            self.metrics.duplicates += 1
+
+        return duplicate
+
+    def forget(self, key: str) -> None:
+        """Drop ``key``, so it is not a duplicate the next time it is seen."""
+        self._seen.pop(key, None)
+
+    def forget_envelope(self, data: dict[str, Any]) -> None:
+        """:meth:`forget` the ``envelope_id`` and ``event_id`` of an envelope that was not dispatched,
+        so its redelivery is.
+
+        Parameters
+        ----------
+        data: Dict[:class:`str`, Any]
+        """
+        envelope_id = data.get("envelope_id")
+        if envelope_id is not None:
+            self.forget(envelope_id)
 
-            except KeyError:
-                _logger.info("%s is not defined. (Undefined Event.)", event_type)
-                pass
+        event_id = (data.get("payload") or {}).get("event_id")
+        if event_id is not None:
+            self.forget(event_id)
+
+    def clear(self) -> None:
+        self._seen.clear()
+
+
+class ExponentialBackoff:
+    """Delays between reconnect attempts: exponential with full jitter.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    base: :class:`float`
+        Upper bound of the first delay in seconds.
+
+    maximum: :class:`float`
+        Upper bound of every delay in seconds.
+    """
+
+    def __init__(self, base: float = 1.0, maximum: float = 60.0):
+        self.base = base
+        self.maximum = maximum
+        self.attempts: int = 0
+
+    def delay(self) -> float:
+        """Delay before the next attempt.
+
+        Returns
+        -------
+        :class:`float`
+        """
+        ceiling = min(self.maximum, self.base * 2 ** self.attempts)
+        self.attempts += 1
+        return random.uniform(0, ceiling)
+
+    def reset(self) -> None:
+        self.attempts = 0
+
+
+# Events dropped first by the ``shed`` backpressure policy.
+LOW_PRIORITY_EVENTS: frozenset[str] = frozenset({
+    "app_home_opened",
+    "file_change",
+    "pin_added",
+    "pin_removed",
+    "reaction_added",
+    "reaction_removed",
+    "thread_broadcast",
+    "user_typing",
+})
+
+
+class EventDispatcher:
+    """Bounded queue of envelopes consumed by a pool of dispatcher workers.
+
+    The websocket reader only decodes and acknowledges envelopes and puts them here, so a slow
+    model build or handler never stalls reading the socket.
+
+    Parsers are synchronous and run on the event loop, so workers do not parse in parallel:
+    they only overlap the time ``handler`` spends awaiting, like the ``users.info`` requests
+    of :meth:`ConnectionState.fetch_members`. Event listeners run in their own tasks either way.
+
+    .. versionadded:: 1.4.5
+
+    Parameters
+    ----------
+    handler: Callable[[Dict[:class:`str`, Any]], Any]
+        Called by a worker with each envelope.
+
+    workers: :class:`int`
+        Number of workers.
+
+    maxsize: :class:`int`
+        Capacity of the queue. ``0`` means unbounded.
+
+    policy: :class:`str`
+        What :meth:`put` does when the queue is full:
+
+        - ``block``: wait for a free slot.
+        - ``drop_oldest``: drop the oldest queued envelope.
+        - ``shed``: drop the envelope if its event is in ``low_priority``, otherwise wait.
+
+    low_priority: Optional[FrozenSet[:class:`str`]]
+        Events shed first. Defaults to :data:`LOW_PRIORITY_EVENTS`.
+
+    metrics: Optional[:class:`SocketMetrics`]
+        Receives queue depth and drop counters.
+    """
+
+    POLICIES = ("block", "drop_oldest", "shed")
+
+    def __init__(
+            self,
+            handler: Callable[[dict[str, Any]], Any],
+            workers: int = 4,
+            maxsize: int = 1000,
+            policy: str = "block",
+            low_priority: frozenset[str] | None = None,
+            metrics: SocketMetrics | None = None
+    ):
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {', '.join(self.POLICIES)}.")
+
+        self.handler = handler
+        self.workers = workers
+        self.policy = policy
+        self.low_priority: frozenset[str] = LOW_PRIORITY_EVENTS if low_priority is None else low_priority
+        self.metrics: SocketMetrics = metrics or SocketMetrics()
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize)
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def depth(self) -> int:
+        """Envelopes waiting in the queue."""
+        return self.queue.qsize()
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+
+        self._tasks = [asyncio.create_task(self._worker(), name=f"dispatcher-{i}") for i in range(self.workers)]
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop the workers.
+
+        Parameters
+        ----------
+        drain: :class:`bool`
+            Dispatch the queued envelopes first.
+        """
+        if drain and self._tasks:
+            await self.queue.join()
+
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def put(self, envelope: dict[str, Any]) -> bool:
+        """Queue an envelope according to :attr:`policy`.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the envelope was queued.
+        """
+        queue = self.queue
+        if queue.full():
+            if self.policy == "drop_oldest":
+                queue.get_nowait()
+                queue.task_done()
+                self.metrics.dropped += 1
+
+            elif self.policy == "shed" and envelope_event_type(envelope) in self.low_priority:
+                self.metrics.shed += 1
+                return False
+
+        await queue.put(envelope)
+        depth = self.metrics.queue_depth = queue.qsize()
+        if depth > self.metrics.max_queue_depth:
+            self.metrics.max_queue_depth = depth
+
+        return True
+
+    async def _worker(self) -> None:
+        queue = self.queue
+        while True:
+            envelope = await queue.get()
+            self.metrics.queue_depth = queue.qsize()
+            try:
+                result = self.handler(envelope)
+                if asyncio.iscoroutine(result):
+                    await result
 
-            else:
-                event_func(payload)
-                _logger.info(f"{event_type} function occuring.")
+            except asyncio.CancelledError:
+                raise
 
-            removed = []
-            for index, entry in enumerate(self._dispatch_listeners):
+            except Exception as e:
+                _logger.error("dispatch of %s raise %s", envelope_event_type(envelope), e, exc_info=e)
 
-                future: asyncio.Future = entry.future
-                if future.cancelled():
-                    removed.append(index)
-                    continue
+            finally:
+                queue.task_done()
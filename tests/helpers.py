@@ -0,0 +1,26 @@
+import asyncio
+import logging
+
+import slack
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def make_client(server, **options):
+    return slack.Client("xoxp-t", "xoxb-t", "xapp-t", base_url=server.base_url, log_level=logging.WARNING, **options)
+
+
+def recorder(client, *events):
+    """Dispatched arguments of ``events``, by event name."""
+    calls = {event: [] for event in events}
+    dispatch = client.connection.dispatch
+
+    def record(event, *args):
+        if event in calls:
+            calls[event].append(args)
+        return dispatch(event, *args)
+
+    client.connection.dispatch = record
+    return calls
@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+
+import slack
+from helpers import make_client, run
+from slack.errors import InvalidArgumentException
+from slack.testing import FakeSlackServer
+
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+
+def test_upload_streams_every_kind_of_source_and_shares_the_files(tmp_path):
+    path = tmp_path / "report.csv"
+    path.write_bytes(b"a,b\n1,2\n")
+
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            progress = {}
+            try:
+                result = await client.http.send_files(
+                    [
+                        slack.Attachment(b"raw bytes", name="raw.txt", title="raw"),
+                        slack.Attachment(str(path), name="report.csv", title="report"),
+                        slack.Attachment(chunks(b"stre", b"amed"), name="stream.bin", title="stream", size=8),
+                    ],
+                    channel_id="C00000000",
+                    progress=lambda attachment, sent, total: progress.__setitem__(attachment.name, (sent, total))
+                )
+
+            finally:
+                await client.close()
+
+            ids = [f["id"] for f in result["files"]]
+            assert [server.file_contents[file_id] for file_id in ids] == [b"raw bytes", b"a,b\n1,2\n", b"streamed"]
+            assert [server.files[file_id]["channels"] for file_id in ids] == [["C00000000"]] * 3
+            assert [f["title"] for f in result["files"]] == ["raw", "report", "stream"]
+            assert progress == {"raw.txt": (9, 9), "report.csv": (8, 8), "stream.bin": (8, 8)}
+
+    run(main())
+
+
+def test_upload_of_unknown_length_is_refused():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                with pytest.raises(InvalidArgumentException):
+                    await client.http.upload_file(slack.Attachment(chunks(b"x"), name="x.bin", title="x"))
+
+            finally:
+                await client.close()
+
+            assert "files.getUploadURLExternal" not in server.requests
+
+    run(main())
+
+
+def test_concurrent_uploads_get_their_own_upload_url():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                files = [
+                    slack.Attachment(b"first", name="same.txt", title="a"),
+                    slack.Attachment(b"other", name="same.txt", title="b"),
+                ]
+                result = await client.http.send_files(files)
+
+            finally:
+                await client.close()
+
+            ids = [f["id"] for f in result["files"]]
+            assert len(set(ids)) == 2
+            assert sorted(server.file_contents[file_id] for file_id in ids) == [b"first", b"other"]
+
+    run(main())
+
+
+async def uploaded_file(client, server, content):
+    result = await client.http.send_files([slack.Attachment(content, name="data.bin", title="data")])
+    return result["files"][0]["id"]
+
+
+def test_interrupted_download_resumes_with_a_range_request(tmp_path):
+    content = bytes(range(256)) * 4096
+
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                file_id = await uploaded_file(client, server, content)
+                server.interrupt_next_download(file_id, 300000)
+                path = await slack.File(client.connection, server.files[file_id]).download(tmp_path / "data.bin")
+
+            finally:
+                await client.close()
+
+            assert open(path, "rb").read() == content
+            assert server.download_ranges == [None, "bytes=300000-"]
+            assert not (tmp_path / "data.bin.part").exists()
+
+    run(main())
+
+
+def test_files_of_unknown_size_are_cached_by_id(tmp_path):
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server, file_cache_dir=str(tmp_path))
+            await client.http.prepare()
+            try:
+                file_id = await uploaded_file(client, server, b"content")
+                data = dict(server.files[file_id])
+                del data["size"]
+                file = slack.File(client.connection, data)
+                first = await file.download()
+                second = await file.download()
+
+            finally:
+                await client.close()
+
+            assert file.size is None
+            assert first == second == str(tmp_path / file_id)
+            assert open(first, "rb").read() == b"content"
+            assert server.download_ranges == [None]
+
+    run(main())
+
+
+def test_concurrent_downloads_to_one_path_write_the_file_once(tmp_path):
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                result = await client.http.send_files([slack.Attachment(b"x" * 1000000, name="big.bin", title="big")])
+                file = slack.File(client.connection, server.files[result["files"][0]["id"]])
+                path = str(tmp_path / "big.bin")
+                paths = await asyncio.gather(*(file.download(path) for _ in range(4)))
+
+            finally:
+                await client.close()
+
+            assert paths == [path] * 4
+            assert (tmp_path / "big.bin").read_bytes() == b"x" * 1000000
+            assert not client.http._downloads
+
+    run(main())
@@ -0,0 +1,139 @@
+import asyncio
+
+import slack
+from helpers import make_client, recorder, run
+from slack.httpclient import ResponseCache
+from slack.testing import FakeSlackServer
+
+
+def test_identical_gets_in_flight_share_one_request():
+    async def main():
+        async with FakeSlackServer(members=2, channels=1, latency=0.05) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                route = slack.Route("GET", "users.info", client.http.bot_token)
+                same = await asyncio.gather(*(
+                    client.http.request(route, query={"user": "U00000000"}) for _ in range(5)
+                ))
+                assert server.requests["users.info"] == 1
+
+                await asyncio.gather(
+                    client.http.request(route, query={"user": "U00000000"}),
+                    client.http.request(route, query={"user": "U00000001"}),
+                )
+                assert server.requests["users.info"] == 3
+                assert not client.http._inflight
+
+            finally:
+                await client.close()
+
+            assert all(response["user"]["id"] == "U00000000" for response in same)
+
+    run(main())
+
+
+def test_requests_are_not_coalesced_when_disabled_or_not_idempotent():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1, latency=0.05) as server:
+            client = make_client(server, coalesce_requests=False)
+            await client.http.prepare()
+            try:
+                route = slack.Route("GET", "users.info", client.http.bot_token)
+                await asyncio.gather(*(client.http.request(route, query={"user": "U00000000"}) for _ in range(2)))
+                assert server.requests["users.info"] == 2
+
+            finally:
+                await client.close()
+
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                route = slack.Route("GET", "files.getUploadURLExternal", client.http.bot_token)
+                uploads = await asyncio.gather(*(
+                    client.http.request(route, query={"filename": "a.txt", "length": "1"}) for _ in range(2)
+                ))
+
+            finally:
+                await client.close()
+
+            assert uploads[0]["file_id"] != uploads[1]["file_id"]
+
+    run(main())
+
+
+def test_cached_responses_expire_after_their_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("slack.httpclient.time.monotonic", lambda: now[0])
+    cache = ResponseCache(maxsize=2, ttls={"team.info": 60.0})
+    route = slack.Route("GET", "team.info", "xoxb-t")
+    cache.set(("GET", "team.info", "a"), route, {"team": "T1"}, {"ok": True})
+
+    now[0] += 59
+    assert cache.get(("GET", "team.info", "a")) == {"ok": True}
+    now[0] += 2
+    assert cache.get(("GET", "team.info", "a")) is None
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 0)
+    assert not cache.is_cacheable(slack.Route("GET", "users.list", "xoxb-t"))
+
+
+def test_cache_evicts_the_least_recently_used_response():
+    cache = ResponseCache(maxsize=2, ttls={"team.info": 60.0})
+    route = slack.Route("GET", "team.info", "xoxb-t")
+    for name in "abc":
+        cache.set(("GET", "team.info", name), route, {"team": name}, {"team": name})
+        cache.get(("GET", "team.info", "a"))
+
+    assert cache.get(("GET", "team.info", "b")) is None
+    assert cache.get(("GET", "team.info", "a")) == {"team": "a"}
+    assert cache.invalidate("team.info", team="c") == 1
+    assert len(cache) == 1
+
+
+def test_shared_and_cached_responses_are_copies():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server, response_cache=True)
+            await client.http.prepare()
+            try:
+                route = slack.Route("GET", "team.info", client.http.bot_token)
+                first, second = await asyncio.gather(
+                    client.http.request(route, query={"team": "T00000000"}),
+                    client.http.request(route, query={"team": "T00000000"}),
+                )
+                first["team"] = None
+                cached = await client.http.request(route, query={"team": "T00000000"})
+
+            finally:
+                await client.close()
+
+            assert first is not second
+            assert second["team"]["id"] == "T00000000"
+            assert cached["team"]["id"] == "T00000000"
+            assert server.requests["team.info"] == 1
+
+    run(main())
+
+
+def test_membership_events_invalidate_the_cache():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server, response_cache=True)
+            await client.http.prepare()
+            try:
+                cache = client.http.cache
+                route = slack.Route("GET", "conversations.members", client.http.bot_token)
+                await client.http.request(route, query={"channel": "C00000000"})
+                assert len(cache) == 1
+
+                calls = recorder(client, "member_join")
+                event = {"event": {"channel": "C00000000", "user": "U99999999", "inviter": "U99999999"}}
+                client.connection.parse_member_joined_channel(event)
+
+            finally:
+                await client.close()
+
+            assert len(cache) == 0
+            assert len(calls["member_join"]) == 1
+
+    run(main())
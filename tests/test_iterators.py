@@ -0,0 +1,97 @@
+import slack
+from helpers import make_client, run
+from slack.testing import FakeSlackServer
+
+
+def users_list(client, **options):
+    return slack.CursorIterator(
+        client.http,
+        slack.Route("GET", "users.list", client.http.bot_token),
+        "members",
+        lambda m: m["id"],
+        **options
+    )
+
+
+def test_cursor_iterator_reads_every_page():
+    async def main():
+        async with FakeSlackServer(members=250, channels=1) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                ids = await users_list(client, page_size=100)
+                pages = [len(page) async for page in users_list(client, page_size=100).pages()]
+
+            finally:
+                await client.close()
+
+            assert ids == [m["id"] for m in server.members]
+            assert pages == [100, 100, 50]
+            assert server.requests["users.list"] == 6
+
+    run(main())
+
+
+def test_cursor_iterator_stops_at_the_limit():
+    async def main():
+        async with FakeSlackServer(members=250, channels=1) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                ids = await users_list(client, page_size=100, limit=120)
+                prefetched = await users_list(client, page_size=100, limit=120, prefetch=True)
+
+            finally:
+                await client.close()
+
+            assert ids == prefetched == [m["id"] for m in server.members[:120]]
+            assert server.requests["users.list"] == 4
+
+    run(main())
+
+
+def test_cursor_iterator_can_be_left_early_while_prefetching():
+    async def main():
+        async with FakeSlackServer(members=250, channels=1, latency=0.01) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                ids = []
+                async for member_id in users_list(client, page_size=10, prefetch=True):
+                    ids.append(member_id)
+                    if len(ids) == 15:
+                        break
+
+            finally:
+                await client.close()
+
+            assert ids == [m["id"] for m in server.members[:15]]
+            assert server.requests["users.list"] <= 3
+
+    run(main())
+
+
+def test_page_iterator_keeps_offsets_on_the_last_page():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            for i in range(300):
+                server.files[f"F{i:08d}"] = {"id": f"F{i:08d}", "name": f"{i}.txt"}
+
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                files = await slack.PageIterator(
+                    client.http,
+                    slack.Route("GET", "files.list", client.http.bot_token),
+                    "files",
+                    lambda f: f["id"],
+                    limit=150,
+                    page_size=100
+                )
+
+            finally:
+                await client.close()
+
+            assert files == [f"F{i:08d}" for i in range(150)]
+
+    run(main())
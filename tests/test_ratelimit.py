@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+import pytest
+
+import slack
+from helpers import make_client, run
+from slack.errors import RateLimitException
+from slack.httpclient import RateLimitBucket, RateLimiter
+from slack.testing import FakeSlackServer
+
+
+def test_bucket_waits_for_a_token_once_empty():
+    async def main():
+        bucket = RateLimitBucket(("chat.update", "xoxb-t", ""), 2, per=0.2)
+        started = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+        assert bucket.remaining == 0
+        assert time.monotonic() - started < 0.05
+
+        await bucket.acquire()
+        assert time.monotonic() - started >= 0.09
+
+    run(main())
+
+
+def test_buckets_are_kept_per_endpoint_team_and_channel():
+    limiter = RateLimiter()
+    post = slack.Route("POST", "chat.postMessage", "xoxb-t")
+    info = slack.Route("GET", "users.info", "xoxb-t")
+
+    assert limiter.get_bucket(post, {"channel": "C1"}) is limiter.get_bucket(post, {"channel": "C1"})
+    assert limiter.get_bucket(post, {"channel": "C1"}) is not limiter.get_bucket(post, {"channel": "C2"})
+    assert limiter.get_bucket(info, query={"team": "T1"}) is not limiter.get_bucket(info, query={"team": "T2"})
+    assert limiter.get_bucket(post, {"channel": "C1"}).limit == 60
+
+
+def test_ratelimited_requests_wait_for_retry_after():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1, retry_after=0.2) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                route = slack.Route("GET", "users.info", client.http.bot_token)
+                server.fail_next("users.info", "ratelimited", status=429)
+                started = time.monotonic()
+                response = await client.http.request(route, query={"user": "U00000000"})
+                elapsed = time.monotonic() - started
+
+            finally:
+                await client.close()
+
+            assert response["user"]["id"] == "U00000000"
+            assert elapsed >= 0.2
+            assert server.requests["users.info"] == 2
+
+    run(main())
+
+
+def test_ratelimited_requests_give_up_after_max_retries():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1, retry_after=0.01) as server:
+            client = make_client(server, rate_limit_retries=1)
+            await client.http.prepare()
+            try:
+                server.fail_next("users.info", "ratelimited", 2, status=429)
+                with pytest.raises(RateLimitException):
+                    await client.http.request(
+                        slack.Route("GET", "users.info", client.http.bot_token), query={"user": "U00000000"}
+                    )
+
+            finally:
+                await client.close()
+
+            assert server.requests["users.info"] == 2
+
+    run(main())
+
+
+def test_blocked_bucket_holds_every_caller_until_retry_after():
+    async def main():
+        bucket = RateLimitBucket(("users.info", "xoxb-t", ""), 100)
+        bucket.block(0.2)
+        assert bucket.is_limited
+        assert bucket.remaining == 0
+
+        started = time.monotonic()
+        await asyncio.gather(bucket.acquire(), bucket.acquire())
+        assert time.monotonic() - started >= 0.2
+
+    run(main())
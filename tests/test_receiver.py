@@ -0,0 +1,163 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import socket
+import time
+
+import aiohttp
+import pytest
+
+import slack
+from helpers import make_client, run
+from slack.receiver import verify_signature
+from slack.testing import FakeSlackServer
+from slack.ws import DedupIndex
+
+
+def signed_headers(secret, body, timestamp=None):
+    timestamp = str(int(time.time()) if timestamp is None else timestamp)
+    signature = "v0=" + hmac.new(secret.encode(), f"v0:{timestamp}:".encode() + body, hashlib.sha256).hexdigest()
+    return {
+        "X-Slack-Request-Timestamp": timestamp,
+        "X-Slack-Signature": signature,
+        "Content-Type": "application/json",
+    }
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def event_body(event_id):
+    return json.dumps({
+        "type": "event_callback",
+        "event_id": event_id,
+        "team_id": "T00000000",
+        "event": {"type": "app_mention"},
+    }).encode()
+
+
+def test_verify_signature():
+    body = b'{"type": "event_callback"}'
+    headers = signed_headers("secret", body, timestamp=1700000000)
+    timestamp, signature = headers["X-Slack-Request-Timestamp"], headers["X-Slack-Signature"]
+
+    assert verify_signature("secret", timestamp, body, signature, now=1700000100)
+    assert not verify_signature("other", timestamp, body, signature, now=1700000100)
+    assert not verify_signature("secret", timestamp, body + b" ", signature, now=1700000100)
+    # Replayed requests are too old.
+    assert not verify_signature("secret", timestamp, body, signature, now=1700000301)
+    assert not verify_signature("secret", None, body, signature)
+    assert not verify_signature("secret", "soon", body, signature)
+
+
+@pytest.mark.parametrize("body, headers, status", [
+    (b'{"type": "event_callback"}', {"X-Slack-Signature": "v0=0"}, 401),
+    (b'["event_callback"]', None, 400),
+    (b'{"event_id": "Ev1"}', None, 400),
+    (b'{"type": ', None, 400),
+])
+def test_receiver_rejects_bad_requests(body, headers, status):
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            dispatched = []
+            client.dispatcher = slack.EventDispatcher(dispatched.append, workers=1)
+            receiver = slack.EventsReceiver(client, "secret")
+            port = free_port()
+            await receiver.start("127.0.0.1", port)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    request_headers = {**signed_headers("secret", body), **(headers or {})}
+                    url = f"http://127.0.0.1:{port}/slack/events"
+                    async with session.post(url, data=body, headers=request_headers) as response:
+                        assert response.status == status
+
+            finally:
+                await receiver.stop()
+                await client.close()
+
+            assert not dispatched
+
+    run(main())
+
+
+def test_receiver_dispatches_the_retry_of_a_503():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            dispatched = []
+            client.dispatcher = slack.EventDispatcher(dispatched.append, workers=1, maxsize=1)
+            await client.dispatcher.put({"type": "events_api", "payload": {}})
+            receiver = slack.EventsReceiver(client, "secret", ack_timeout=0.1)
+            port = free_port()
+            await receiver.start("127.0.0.1", port)
+            body = event_body("Ev1")
+            url = f"http://127.0.0.1:{port}/slack/events"
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.post(url, data=body, headers=signed_headers("secret", body)) as response:
+                        assert response.status == 503
+
+                    client.dispatcher.start()
+                    async with session.post(url, data=body, headers=signed_headers("secret", body)) as response:
+                        assert response.status == 200
+
+                    await asyncio.wait_for(client.dispatcher.queue.join(), 5)
+
+            finally:
+                await receiver.stop()
+                await client.close()
+
+            assert [envelope["payload"].get("event_id") for envelope in dispatched] == [None, "Ev1"]
+
+    run(main())
+
+
+def test_receivers_sharing_a_dedup_store_suppress_retries_of_each_other():
+    class SharedStore:
+        def __init__(self):
+            self.index = DedupIndex()
+
+        async def seen_envelope(self, envelope):
+            return self.index.seen_envelope(envelope)
+
+        async def forget_envelope(self, envelope):
+            self.index.forget_envelope(envelope)
+
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            store = SharedStore()
+            clients, receivers, ports, dispatched = [], [], [], []
+            for _ in range(2):
+                client = make_client(server)
+                client.dispatcher = slack.EventDispatcher(dispatched.append, workers=1)
+                client.dispatcher.start()
+                receiver = slack.EventsReceiver(client, "secret", dedup=store)
+                ports.append(free_port())
+                await receiver.start("127.0.0.1", ports[-1])
+                clients.append(client)
+                receivers.append(receiver)
+
+            body = event_body("Ev1")
+            try:
+                async with aiohttp.ClientSession() as session:
+                    for port in ports:
+                        url = f"http://127.0.0.1:{port}/slack/events"
+                        async with session.post(url, data=body, headers=signed_headers("secret", body)) as response:
+                            assert response.status == 200
+
+                for client in clients:
+                    await asyncio.wait_for(client.dispatcher.queue.join(), 5)
+
+            finally:
+                for receiver, client in zip(receivers, clients):
+                    await receiver.stop()
+                    await client.close()
+
+            assert [envelope["payload"]["event_id"] for envelope in dispatched] == ["Ev1"]
+
+    run(main())
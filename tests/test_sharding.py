@@ -0,0 +1,142 @@
+import asyncio
+import queue
+import time
+
+import pytest
+
+import slack
+from helpers import make_client, run
+from slack.sharding import (
+    RateLimitState,
+    SharedRateLimitBucket,
+    _RESET_MEMBERSHIP,
+    _ShardMembership,
+    _ShardRouter,
+    shard_key,
+)
+from slack.snapshot import StateSnapshot
+from slack.testing import FakeSlackServer
+
+
+@pytest.mark.parametrize("payload, key, expected", [
+    ({"team_id": "T1", "event": {"type": "message", "channel": "C1"}}, "channel", "C1"),
+    ({"team_id": "T1", "event": {"type": "reaction_added", "item": {"channel": "C2"}}}, "channel", "C2"),
+    ({"team_id": "T1", "event": {"type": "channel_created", "channel": {"id": "C3"}}}, "channel", "C3"),
+    ({"type": "block_actions", "team": {"id": "T1"}, "channel": {"id": "C4"}}, "channel", "C4"),
+    ({"team_id": "T1", "event": {"type": "team_join"}}, "channel", "T1"),
+    ({"team_id": "T1", "event": {"type": "message", "channel": "C1"}}, "team", "T1"),
+    ({}, "channel", ""),
+])
+def test_shard_key(payload, key, expected):
+    assert shard_key({"type": "events_api", "payload": payload}, key) == expected
+
+
+def test_envelopes_of_a_channel_go_to_one_worker():
+    async def main():
+        queues = [queue.Queue() for _ in range(4)]
+        router = _ShardRouter(queues, "channel", slack.SocketMetrics())
+        for i in range(40):
+            await router.put({"type": "events_api", "payload": {"event": {"channel": f"C{i % 8}", "ts": str(i)}}})
+
+        workers = {}
+        for index, q in enumerate(queues):
+            while not q.empty():
+                event = q.get_nowait()["payload"]["event"]
+                workers.setdefault(event["channel"], []).append((index, int(event["ts"])))
+
+        for received in workers.values():
+            assert len({index for index, _ in received}) == 1
+            assert [ts for _, ts in received] == sorted(ts for _, ts in received)
+            assert len(received) == 5
+
+    run(main())
+
+
+def test_clearing_the_ingest_membership_resets_every_worker():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            queues = [queue.Queue(1) for _ in range(2)]
+            queues[1].put({"type": "events_api", "payload": {}})
+            router = _ShardRouter(queues, "channel", client.socket_metrics)
+            client.connection.membership = _ShardMembership(client.connection, router)
+            client.connection.membership.clear()
+            assert queues[0].get_nowait() == _RESET_MEMBERSHIP
+
+            # A full queue gets the reset once the worker made room.
+            queues[1].get_nowait()
+            assert await asyncio.get_running_loop().run_in_executor(None, queues[1].get, True, 5) == _RESET_MEMBERSHIP
+            await client.close()
+
+    run(main())
+
+
+def test_workers_load_the_state_bootstrapped_by_the_ingest_process(tmp_path):
+    async def main():
+        async with FakeSlackServer(members=30, channels=5) as server:
+            runner = slack.ShardedRunner(lambda: make_client(server), workers=2)
+            client = runner.client = make_client(server)
+            await client.http.prepare()
+            worker = make_client(server)
+            await worker.http.prepare()
+            try:
+                path = await runner.bootstrap(str(tmp_path / "bootstrap.sqlite3"))
+                # The ingest process keeps no state.
+                assert not client.connection.members and not client.connection.channels
+
+                requests = dict(server.requests)
+                await worker._initialize(StateSnapshot(path))
+                assert server.requests == requests
+                assert len(worker.connection.members) == 30
+                assert len(worker.connection.channels) == 5
+                assert worker.connection.members["U00000000"].name == server.members[0]["name"]
+
+            finally:
+                await client.close()
+                await worker.close()
+
+    run(main())
+
+
+def test_shared_rate_limits_do_not_block_the_loop():
+
+    class RemoteState(RateLimitState):
+        # Every call to the manager process takes a round trip.
+        def reserve(self, *args):
+            time.sleep(0.05)
+            return super().reserve(*args)
+
+        def peek(self, *args):
+            time.sleep(0.05)
+            return super().peek(*args)
+
+        def block(self, *args):
+            time.sleep(0.05)
+            return super().block(*args)
+
+    async def main():
+        gaps = []
+
+        async def ticker():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        task = asyncio.ensure_future(ticker())
+        bucket = SharedRateLimitBucket(("chat.postMessage", "xoxb-t", "T00000000"), 5, RemoteState(), per=60.0)
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+        assert bucket.remaining == 0
+        assert bucket.retry_after > 0
+
+        bucket.block(0.2)
+        assert bucket.is_limited
+        started = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - started >= 0.2
+        task.cancel()
+        assert max(gaps) < 0.04
+
+    run(main())
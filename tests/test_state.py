@@ -0,0 +1,222 @@
+import asyncio
+import time
+
+from helpers import make_client, recorder, run
+from slack.testing import FakeSlackServer
+
+
+def test_channel_events_of_uncached_channels_are_added():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                state = client.connection
+                calls = recorder(client, "channel_archive")
+                state.parse_group_rename({"event": {"channel": {"id": "G00000001", "name": "secret", "created": 0}}})
+                state.parse_group_unarchive({"event": {"channel": "G00000002", "user": "U99999999"}})
+                state.parse_channel_archive({"event": {"channel": "C00000009", "user": "U99999999"}})
+
+            finally:
+                await client.close()
+
+            assert state.channels["G00000001"].name == "secret"
+            assert state.channels["G00000002"].is_archived is False
+            assert calls["channel_archive"] == [(state.channels["C00000009"], None)]
+            assert state.channels["C00000009"].is_archived is True
+
+    run(main())
+
+
+def test_member_events_without_inviter_or_cached_objects_are_dispatched():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                state = client.connection
+                calls = recorder(client, "member_join", "member_left")
+                state.parse_member_joined_channel({"event": {"channel": "C00000009", "user": "U99999999"}})
+                state.parse_member_left_channel({"event": {"channel": "C00000008", "user": "U99999999"}})
+
+            finally:
+                await client.close()
+
+            assert calls["member_join"] == [(state.channels["C00000009"], None, None)]
+            assert calls["member_left"] == [(state.channels["C00000008"], None)]
+
+    run(main())
+
+
+def test_member_loader_resolves_waiters_on_bad_responses():
+    async def main():
+        async with FakeSlackServer(members=2, channels=1) as server:
+            client = make_client(server, member_cache="lazy")
+            await client.http.prepare()
+            try:
+                server.fail_next("users.info", "<html>Bad Gateway</html>", status=502)
+                server.fail_next("users.info", "", status=500)
+                members = await asyncio.wait_for(
+                    client.connection.fetch_members(["U00000000", "U00000001"]), 5
+                )
+
+            finally:
+                await client.close()
+
+            assert members == [None, None]
+            assert not client.connection.member_loader._inflight
+
+    run(main())
+
+
+def message_envelope(channel, user, ts):
+    event = {"type": "message", "channel": channel, "user": user, "text": ts, "ts": ts, "team": "T00000000"}
+    return {"type": "events_api", "envelope_id": ts, "payload": {"team_id": "T00000000", "event": event}}
+
+
+def test_envelopes_of_a_channel_wait_for_missing_members():
+    async def main():
+        async with FakeSlackServer(members=2, channels=1, latency=0.05) as server:
+            client = make_client(server, dispatch_workers=4)
+            await client.http.prepare()
+            try:
+                await client._initialize()
+                server.members.append(dict(server.members[0], id="UNEW"))
+                parsed = []
+                parse = client.connection.parsers["message"]
+                client.connection.parsers["message"] = lambda payload: parsed.append(payload["event"]["ts"])
+                dispatcher = client._start_dispatcher()
+                channel = server.channels[0]["id"]
+                await dispatcher.put(message_envelope(channel, "UNEW", "1"))
+                await dispatcher.put(message_envelope(channel, "U00000000", "2"))
+                await dispatcher.put(message_envelope(channel, "U00000001", "3"))
+                await asyncio.wait_for(dispatcher.queue.join(), 5)
+                client.connection.parsers["message"] = parse
+
+            finally:
+                await client.close()
+
+            assert parsed == ["1", "2", "3"]
+            assert "UNEW" in client.connection.members
+            assert not client._held
+
+    run(main())
+
+
+def test_member_loader_remembers_unknown_ids_for_a_while(monkeypatch):
+    # The event loop reads the same clock, so it only moves forward.
+    skipped = [0.]
+    monotonic = time.monotonic
+    monkeypatch.setattr("slack.state.time.monotonic", lambda: monotonic() + skipped[0])
+
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server, member_cache="lazy", member_miss_ttl=30)
+            await client.http.prepare()
+            try:
+                await client._initialize()
+                state = client.connection
+                assert await state.fetch_member("UNKNOWN") is None
+                assert await state.fetch_members(["UNKNOWN", "UNKNOWN"]) == [None, None]
+                assert server.requests["users.info"] == 1
+
+                skipped[0] += 31
+                assert await state.fetch_member("UNKNOWN") is None
+                assert server.requests["users.info"] == 2
+                assert (await state.fetch_member("U00000000")).id == "U00000000"
+
+            finally:
+                await client.close()
+
+    run(main())
+
+
+def test_reconcile_keeps_what_events_changed_while_listing():
+    async def main():
+        async with FakeSlackServer(members=2, channels=2) as server:
+            server.channels[1]["is_private"] = True
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                state = client.connection
+                await state.initialize()
+                assert set(state.channels) == {"C00000000", "C00000001"}
+
+                server.latency = 0.05
+                task = asyncio.ensure_future(state.reconcile())
+                await asyncio.sleep(0)
+                # Started, the lists are not read yet.
+                assert state._touched is not None
+                state.parse_channel_created({"event": {"channel": {"id": "C99999999", "name": "new", "created": 0}}})
+                state.parse_user_change({"event": {"user": dict(server.members[0], name="renamed", updated=0)}})
+                await task
+
+            finally:
+                await client.close()
+
+            assert set(state.channels) == {"C00000000", "C00000001", "C99999999"}
+            assert state.members["U00000000"].name == "renamed"
+            assert state._touched is None
+
+    run(main())
+
+
+def test_snapshot_replaces_the_bootstrap_of_the_next_start(tmp_path):
+    async def main():
+        async with FakeSlackServer(members=20, channels=3) as server:
+            path = str(tmp_path / "state.sqlite3")
+            client = make_client(server, snapshot_path=path, snapshot_interval=0)
+            await client.http.prepare()
+            try:
+                await client._initialize()
+                assert server.requests["users.list"] == 1
+
+            finally:
+                await client.close()
+
+            server.members[0].update(name="renamed", updated=server.members[0]["updated"] + 1)
+            client = make_client(server, snapshot_path=path, snapshot_interval=0)
+            await client.http.prepare()
+            try:
+                await client._initialize()
+                state = client.connection
+                assert len(state.members) == 20
+                assert server.requests["users.list"] == 1
+                assert set(state.channels) == {channel["id"] for channel in server.channels}
+                # Reconciled with Slack in the background.
+                await asyncio.wait_for(asyncio.gather(*client._snapshot_tasks), 5)
+                assert state.members["U00000000"].name == "renamed"
+
+            finally:
+                await client.close()
+
+            assert server.requests["users.list"] == 2
+
+    run(main())
+
+
+def test_membership_is_only_indexed_for_channels_the_bot_is_in():
+    async def main():
+        async with FakeSlackServer(members=2, channels=2) as server:
+            server.channels[1]["is_member"] = False
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                state = client.connection
+                await state.initialize()
+                joined, other = state.channels["C00000000"], state.channels["C00000001"]
+                assert await joined.has_member("U00000000")
+                assert await other.has_member("U00000000")
+                assert "C00000000" in state.membership
+                assert "C00000001" not in state.membership
+
+                server.channel_members["C00000001"].remove("U00000000")
+                assert not await other.has_member("U00000000")
+
+                state.membership.clear()
+                assert "C00000000" not in state.membership
+
+            finally:
+                await client.close()
+
+    run(main())
@@ -0,0 +1,44 @@
+import pytest
+
+from slack.errors import InvalidArgumentException
+from slack.utils import JSONCodec, get_codec
+from slack.ws import dispatch_to_parsers
+
+PAYLOAD = {"ok": True, "text": "こんにちは", "members": [{"id": "U00000000", "deleted": False, "tz_offset": -25200}]}
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codecs_roundtrip_payloads(name):
+    try:
+        codec = get_codec(name)
+
+    except InvalidArgumentException:
+        pytest.skip(f"{name} is not installed")
+
+    assert codec.name == name
+    text = codec.dumps(PAYLOAD)
+    assert isinstance(text, str)
+    assert codec.loads(text) == PAYLOAD
+    assert codec.loads(text.encode()) == PAYLOAD
+    with pytest.raises(codec.decode_errors):
+        codec.loads(b"{")
+
+
+def test_get_codec_picks_an_installed_codec_or_returns_the_given_one():
+    assert get_codec("auto").name in ("orjson", "msgspec", "json")
+    codec = JSONCodec()
+    assert get_codec(codec) is codec
+    with pytest.raises(InvalidArgumentException):
+        get_codec("yaml")
+
+
+def test_decoded_envelopes_reach_their_parser():
+    calls = []
+    parsers = {"message": calls.append, "hello": lambda: calls.append("hello")}
+    codec = get_codec("auto")
+    envelope = {"type": "events_api", "payload": {"event": {"type": "message", "text": "hi"}}}
+
+    assert dispatch_to_parsers(parsers, codec.loads(codec.dumps({"type": "hello"})))
+    assert dispatch_to_parsers(parsers, codec.loads(codec.dumps(envelope)))
+    assert not dispatch_to_parsers(parsers, {"type": "disconnect"})
+    assert calls == ["hello", envelope["payload"]]
@@ -0,0 +1,85 @@
+import asyncio
+
+from helpers import make_client, run
+from slack.metrics import Latency
+from slack.testing import FakeSlackServer
+from slack.ws import SlackWebSocket
+
+
+def test_supervisor_asks_for_a_new_socket_url_after_a_failure():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            connected = asyncio.get_running_loop().create_future()
+            read_socket = client._read_socket
+
+            async def record(ws, open_replacement):
+                if not connected.done():
+                    connected.set_result(ws)
+                return await read_socket(ws, open_replacement)
+
+            client._read_socket = record
+            await client.connection.initialize()
+            assert await client.connection.channels["C00000000"].has_member("U00000000")
+            assert "C00000000" in client.connection.membership
+            task = asyncio.ensure_future(client._supervise("ws://127.0.0.1:1/expired"))
+            try:
+                ws = await asyncio.wait_for(connected, 10)
+                assert not ws.socket.closed
+
+            finally:
+                await client.close()
+                task.cancel()
+
+            assert server.requests["apps.connections.open"] == 1
+            # Membership events may have been missed while no socket was open.
+            assert "C00000000" not in client.connection.membership
+
+    run(main())
+
+
+def test_heartbeat_waits_for_a_busy_reader():
+    async def main():
+        async with FakeSlackServer(members=1, channels=1) as server:
+            client = make_client(server)
+            await client.http.prepare()
+            try:
+                url = (await client.http.open_connection())["url"]
+                ws = await SlackWebSocket.from_client(client=client, ws_url=url, logger=client._logger)
+                loop = asyncio.get_running_loop()
+                pinged, measured = loop.create_future(), loop.create_future()
+                ping = ws.socket.ping
+
+                async def send_ping(*args):
+                    if not pinged.done():
+                        pinged.set_result(None)
+                    await ping(*args)
+
+                class SignalledLatency(Latency):
+                    def record(self, value):
+                        super().record(value)
+                        if not measured.done():
+                            measured.set_result(value)
+
+                ws.socket.ping, ws.metrics.latency = send_ping, SignalledLatency()
+                heartbeat = asyncio.ensure_future(ws.heartbeat(0.05, 0.1))
+                await asyncio.wait_for(pinged, 5)
+                # The reader is busy elsewhere, so the pong stays unread for several timeouts.
+                done, _ = await asyncio.wait([heartbeat], timeout=0.4)
+                assert not done
+                assert not ws.socket.closed
+
+                reader = asyncio.ensure_future(ws.receive())
+                await asyncio.wait_for(measured, 5)
+                assert not ws.socket.closed
+                assert ws.metrics.stale == 0
+
+                reader.cancel()
+                heartbeat.cancel()
+                await ws.socket.close()
+
+            finally:
+                await client.close()
+
+    run(main())